@@ -8,11 +8,14 @@ Version: 1.0.0
 """
 
 import argparse
+import hashlib
+import json
 import re
 import sys
 import os
+from bisect import bisect_left
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 import subprocess
 
 
@@ -25,11 +28,124 @@ class LockedSection:
         self.start_line = start_line
         self.end_line = end_line
         self.metadata = {}
+        self.content_hash = ''
     
     def __repr__(self):
         return f"LockedSection({self.lock_id} in {self.file_path}:{self.start_line}-{self.end_line})"
 
 
+DEFAULT_MANIFEST_FILE = 'governance/contracts/locked-sections-manifest.json'
+MANIFEST_VERSION = '1.0.0'
+
+
+def section_content_hash(lines: List[str]) -> str:
+    """SHA-256 of a locked section (START to END marker), whitespace-normalized.
+    
+    Runs of whitespace collapse to one space and blank lines are dropped, so
+    re-indentation, trailing spaces and line-ending changes keep the hash.
+    """
+    normalized = (' '.join(line.split()) for line in lines)
+    return hashlib.sha256('\n'.join(line for line in normalized if line).encode('utf-8')).hexdigest()
+
+
+HUNK_HEADER_PATTERN = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+
+class FileDiff:
+    """Changed line ranges of one file from a zero-context (-U0) unified diff.
+    
+    Hunks are disjoint and ordered on both sides, so interval queries and
+    head-to-base line mapping are binary searches over sorted arrays.
+    """
+    
+    def __init__(self, old_path: Optional[str], new_path: Optional[str]):
+        self.old_path = old_path
+        self.new_path = new_path
+        self.hunks: List[Tuple[int, int, int, int]] = []  # (old_start, old_count, new_start, new_count)
+        self.removed_lines: List[Tuple[int, str]] = []  # (base line number, text)
+        self._indexed = False
+    
+    def _index(self):
+        if self._indexed:
+            return
+        self._old = [(o, o + oc - 1) for o, oc, _, _ in self.hunks if oc]
+        self._old_ends = [end for _, end in self._old]
+        self._new = [(n, n + nc - 1) for _, _, n, nc in self.hunks if nc]
+        self._new_ends = [end for _, end in self._new]
+        # Last head line each hunk sits on (a pure deletion sits after new_start)
+        self._new_last = [n + nc - 1 if nc else n for _, _, n, nc in self.hunks]
+        self._shift = [0]
+        for _, oc, _, nc in self.hunks:
+            self._shift.append(self._shift[-1] + nc - oc)
+        self._indexed = True
+    
+    @staticmethod
+    def _overlaps(intervals: List[Tuple[int, int]], ends: List[int], start: int, end: int) -> bool:
+        i = bisect_left(ends, start)
+        return i < len(intervals) and intervals[i][0] <= end
+    
+    def head_changed(self, start: int, end: int) -> bool:
+        """True if lines were added or replaced within head lines start..end."""
+        self._index()
+        return self._overlaps(self._new, self._new_ends, start, end)
+    
+    def base_changed(self, start: int, end: int) -> bool:
+        """True if lines were removed or replaced within base lines start..end."""
+        self._index()
+        return self._overlaps(self._old, self._old_ends, start, end)
+    
+    def to_base(self, head_line: int) -> int:
+        """Base line number of an unchanged head line."""
+        self._index()
+        return head_line - self._shift[bisect_left(self._new_last, head_line)]
+
+
+def parse_unified_diff(diff_text: str) -> Dict[str, FileDiff]:
+    """Parse `git diff -U0` output into FileDiffs keyed by head path and by base path.
+    
+    Hunk bodies are consumed by the line counts in their `@@` header, so content
+    lines such as `++ x` (shown as `+++ x`) or `-- x` are never read as file headers.
+    """
+    files: Dict[str, FileDiff] = {}
+    current: Optional[FileDiff] = None
+    old_path: Optional[str] = None
+    old_line = 0
+    old_left = new_left = 0  # lines still owed to the current hunk
+    
+    for line in diff_text.splitlines():
+        if old_left or new_left:
+            if line.startswith('-'):
+                current.removed_lines.append((old_line, line[1:]))
+                old_line += 1
+                old_left -= 1
+            elif line.startswith('+'):
+                new_left -= 1
+            elif line.startswith(' '):
+                old_line += 1
+                old_left -= 1
+                new_left -= 1
+            continue
+        if line.startswith('diff --git '):
+            current, old_path = None, None
+        elif line.startswith('--- '):
+            old_path = None if line == '--- /dev/null' else line[6:]
+        elif line.startswith('+++ '):
+            new_path = None if line == '+++ /dev/null' else line[6:]
+            current = FileDiff(old_path, new_path)
+            for path in {old_path, new_path} - {None}:
+                files[path] = current
+        elif current is not None and line.startswith('@@'):
+            match = HUNK_HEADER_PATTERN.match(line)
+            if match:
+                old_start, old_count, new_start, new_count = match.groups()
+                hunk = (int(old_start), int(old_count or 1), int(new_start), int(new_count or 1))
+                current.hunks.append(hunk)
+                old_line = hunk[0]
+                old_left, new_left = hunk[1], hunk[3]
+    
+    return files
+
+
 class LockedSectionValidator:
     """Validates locked sections in agent contracts"""
     
@@ -46,8 +162,8 @@ class LockedSectionValidator:
     
     def scan_contracts(self) -> List[LockedSection]:
         """Scan all agent contracts for locked sections"""
-        contract_files = list(self.contracts_dir.glob('**/*.agent.md')) + \
-                        list(self.contracts_dir.glob('**/*.md'))
+        # **/*.md already covers *.agent.md; a set keeps each file (and lock) once
+        contract_files = sorted(set(self.contracts_dir.glob('**/*.md')))
         
         for contract_file in contract_files:
             if contract_file.name == 'README.md':
@@ -84,6 +200,9 @@ class LockedSectionValidator:
                     )
                 else:
                     current_section.end_line = i
+                    current_section.content_hash = section_content_hash(
+                        lines[current_section.start_line - 1:i]
+                    )
                     self.locked_sections.append(current_section)
                     in_locked_section = False
                     current_section = None
@@ -144,27 +263,123 @@ class LockedSectionValidator:
         return success
     
     def detect_modifications(self, base_ref: str, head_ref: str) -> Tuple[bool, List[str]]:
-        """Detect modifications to locked sections between two git refs"""
+        """Detect modifications to locked sections between two git refs.
+        
+        Lock ranges come from the scanned working tree, which is expected to be
+        head_ref (as checked out in CI). One `git diff -U0` supplies the hunks.
+        A lock counts as modified when lines were added or replaced inside its
+        head range, or removed or replaced inside its base range (its head range
+        mapped back through the hunks above it, so edits that only move a
+        lock are ignored). Locks whose markers were deleted are reported from the
+        removed lines.
+        """
         modified_locks = []
         
         try:
-            # Get diff between base and head
             diff_output = subprocess.check_output(
-                ['git', 'diff', f'{base_ref}..{head_ref}', '--', '.github/agents/'],
+                ['git', '-c', 'core.quotePath=false', 'diff', '-U0', '--no-color', '--no-ext-diff',
+                 f'{base_ref}..{head_ref}', '--', str(self.contracts_dir)],
                 universal_newlines=True
             )
+            toplevel = Path(subprocess.check_output(
+                ['git', 'rev-parse', '--show-toplevel'], universal_newlines=True
+            ).strip())
         except subprocess.CalledProcessError as e:
             self.errors.append(f"Error running git diff: {e}")
             return False, []
         
-        # Parse diff to find modifications within locked sections
-        # This is a simplified check - looks for changes to files with locked sections
+        file_diffs = parse_unified_diff(diff_output)
+        base_ranges: Dict[int, List[Tuple[int, int]]] = {}  # id(FileDiff) -> lock ranges on the base side
+        
         for section in self.locked_sections:
-            if section.file_path in diff_output:
-                # Check if the diff touches the locked section line range
-                # (This is a simplified heuristic; production should be more sophisticated)
+            rel_path = Path(section.file_path).resolve().relative_to(toplevel.resolve()).as_posix()
+            file_diff = file_diffs.get(rel_path)
+            if file_diff is None or file_diff.new_path != rel_path:
+                continue
+            start, end = section.start_line, section.end_line
+            if file_diff.head_changed(start, end):
+                modified_locks.append(section.lock_id)
+                continue
+            base_start, base_end = file_diff.to_base(start), file_diff.to_base(end)
+            base_ranges.setdefault(id(file_diff), []).append((base_start, base_end))
+            if file_diff.base_changed(base_start, base_end):
                 modified_locks.append(section.lock_id)
         
+        # Locks that no longer exist in head: their markers show up as removed lines
+        current_ids = {section.lock_id for section in self.locked_sections}
+        for file_diff in {id(fd): fd for fd in file_diffs.values()}.values():
+            removed_start = None  # base line of a removed START marker not yet named
+            for base_line, text in file_diff.removed_lines:
+                lock_id_match = self.LOCK_ID_PATTERN.search(text)
+                if lock_id_match and lock_id_match.group(1) not in current_ids:
+                    modified_locks.append(lock_id_match.group(1))
+                    removed_start = None
+                    continue
+                if removed_start is not None:
+                    modified_locks.append(f"{file_diff.old_path}:{removed_start} (removed locked section)")
+                    removed_start = None
+                if self.LOCKED_START_PATTERN.search(text) and not any(
+                    start <= base_line <= end for start, end in base_ranges.get(id(file_diff), [])
+                ):
+                    removed_start = base_line
+            if removed_start is not None:
+                modified_locks.append(f"{file_diff.old_path}:{removed_start} (removed locked section)")
+        
+        modified_locks = list(dict.fromkeys(modified_locks))
+        return len(modified_locks) > 0, modified_locks
+    
+    def _manifest_entries(self) -> Dict[Tuple[str, str, int], str]:
+        """Scanned locks keyed by (file relative to contracts dir, lock ID, occurrence)."""
+        entries = {}
+        seen: Dict[Tuple[str, str], int] = {}
+        for section in self.locked_sections:
+            rel_file = Path(section.file_path).relative_to(self.contracts_dir).as_posix()
+            occurrence = seen.get((rel_file, section.lock_id), 0)
+            seen[(rel_file, section.lock_id)] = occurrence + 1
+            entries[(rel_file, section.lock_id, occurrence)] = section.content_hash
+        return entries
+    
+    def build_manifest(self) -> Dict:
+        """Build the lock manifest for the scanned contracts"""
+        return {
+            'manifest_version': MANIFEST_VERSION,
+            'hash_algorithm': 'sha256',
+            'normalization': 'whitespace runs collapsed, blank lines dropped, START to END markers inclusive',
+            'locks': [
+                {'lock_id': lock_id, 'file': rel_file, 'occurrence': occurrence, 'content_hash': content_hash}
+                for (rel_file, lock_id, occurrence), content_hash in sorted(self._manifest_entries().items())
+            ],
+        }
+    
+    def verify_manifest(self, manifest_file: str) -> Tuple[bool, List[str]]:
+        """Compare scanned lock content hashes against a persisted lock manifest.
+        
+        Needs no git history, so it also works on offline snapshots of consumer
+        repos. Returns (modified, descriptions of changed, removed and unlisted locks).
+        """
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except Exception as e:
+            self.errors.append(f"Error reading lock manifest {manifest_file}: {e}")
+            return False, []
+        
+        expected = {
+            (entry['file'], entry['lock_id'], entry.get('occurrence', 0)): entry['content_hash']
+            for entry in manifest.get('locks', [])
+        }
+        actual = self._manifest_entries()
+        
+        modified_locks = []
+        for key in sorted(expected.keys() | actual.keys()):
+            rel_file, lock_id, _ = key
+            if key not in actual:
+                modified_locks.append(f"{lock_id} ({rel_file}: removed)")
+            elif key not in expected:
+                modified_locks.append(f"{lock_id} ({rel_file}: not in manifest)")
+            elif actual[key] != expected[key]:
+                modified_locks.append(lock_id)
+        
         return len(modified_locks) > 0, modified_locks
     
     def verify_registry_sync(self, registry_file: str) -> bool:
@@ -226,7 +441,7 @@ def main():
     )
     parser.add_argument(
         '--mode',
-        choices=['detect-modifications', 'validate-metadata', 'verify-registry'],
+        choices=['detect-modifications', 'verify-manifest', 'update-manifest', 'validate-metadata', 'verify-registry'],
         required=True,
         help='Validation mode'
     )
@@ -240,6 +455,11 @@ def main():
         default='governance/contracts/protection-registry.md',
         help='Path to protection registry'
     )
+    parser.add_argument(
+        '--manifest-file',
+        default=DEFAULT_MANIFEST_FILE,
+        help='Path to the locked section content-hash manifest'
+    )
     parser.add_argument(
         '--base-ref',
         help='Base git reference for modification detection'
@@ -256,12 +476,17 @@ def main():
     
     success = True
     
-    if args.mode == 'detect-modifications':
-        if not args.base_ref or not args.head_ref:
+    if args.mode in ('detect-modifications', 'verify-manifest'):
+        if args.mode == 'verify-manifest':
+            modified, modified_locks = validator.verify_manifest(args.manifest_file)
+            if validator.errors:
+                validator.print_summary()
+                sys.exit(1)
+        elif not args.base_ref or not args.head_ref:
             print("Error: --base-ref and --head-ref required for modification detection")
             sys.exit(1)
-        
-        modified, modified_locks = validator.detect_modifications(args.base_ref, args.head_ref)
+        else:
+            modified, modified_locks = validator.detect_modifications(args.base_ref, args.head_ref)
         
         if modified:
             print("locked_sections_modified=true")
@@ -287,6 +512,15 @@ def main():
                 with open(os.environ['GITHUB_OUTPUT'], 'a') as f:
                     f.write(f"locked_sections_modified=false\n")
     
+    elif args.mode == 'update-manifest':
+        manifest = validator.build_manifest()
+        Path(args.manifest_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+            f.write('\n')
+        print(f"✅ Wrote {len(manifest['locks'])} lock hashes to {args.manifest_file}")
+        success = not validator.errors
+    
     elif args.mode == 'validate-metadata':
         success = validator.validate_metadata() and validator.check_duplicate_lock_ids()
         validator.print_summary()
@@ -0,0 +1,157 @@
+#!/usr/bin/env bash
+# test-check-locked-sections.sh
+#
+# Regression tests for .github/scripts/check_locked_sections.py
+# --mode detect-modifications (zero-context diff parsing).
+#
+# Authority: governance/canon/AGENT_CONTRACT_PROTECTION_PROTOCOL.md
+#
+# Usage:
+#   bash .github/scripts/tests/test-check-locked-sections.sh
+#
+# Exit codes:
+#   0 = all tests passed
+#   1 = one or more tests failed
+#
+# Test coverage:
+#   1. Edit inside a lock → modified
+#   2. Edit outside a lock only → not modified
+#   3. Added "++ x" line above a lock plus an edit inside it → modified
+#      (the content line renders as "+++ x" and must not open a new file)
+#   4. Removed "-- x" line above a lock plus an edit inside it → modified
+#   5. Added "++ x" line outside a lock only → not modified
+#   6. Whole locked section deleted → modified (reported by Lock ID)
+
+set -euo pipefail
+
+# ── Resolve paths ─────────────────────────────────────────────────────────────
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+REPO_ROOT="$(cd "${SCRIPT_DIR}/../../.." && pwd)"
+CHECKER="${REPO_ROOT}/.github/scripts/check_locked_sections.py"
+WORK_DIR="$(mktemp -d)"
+trap 'rm -rf "${WORK_DIR}"' EXIT
+
+# ── Color helpers ─────────────────────────────────────────────────────────────
+GREEN='\033[0;32m'
+RED='\033[0;31m'
+NC='\033[0m'
+
+PASS_COUNT=0
+FAIL_COUNT=0
+
+pass() { echo -e "${GREEN}  PASS${NC}: $*"; PASS_COUNT=$((PASS_COUNT + 1)); }
+fail() { echo -e "${RED}  FAIL${NC}: $*"; FAIL_COUNT=$((FAIL_COUNT + 1)); }
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+BASE_CONTRACT='# Test Agent
+
+-- note above the lock
+intro
+
+<!-- LOCKED SECTION START -->
+<!-- Lock ID: LOCK-TEST-001 -->
+<!-- Lock Reason: regression fixture -->
+<!-- Lock Authority: CS2 -->
+<!-- END METADATA -->
+body1
+body2
+<!-- LOCKED SECTION END -->
+
+outro'
+
+# Create a repo whose base commit holds BASE_CONTRACT and whose head commit
+# holds the contract produced by the given python transform of the text.
+# Usage: make_repo <dir> <python expression over variable t>
+make_repo() {
+    local dir="$1"
+    local transform="$2"
+    mkdir -p "${dir}/.github/agents"
+    git -C "${dir}" init -q
+    git -C "${dir}" config user.email test@example.com
+    git -C "${dir}" config user.name test
+    printf '%s\n' "${BASE_CONTRACT}" > "${dir}/.github/agents/test.agent.md"
+    git -C "${dir}" add -A
+    git -C "${dir}" commit -qm base
+    python3 - "${dir}/.github/agents/test.agent.md" "${transform}" <<'PYEOF'
+import sys
+path, transform = sys.argv[1], sys.argv[2]
+t = open(path, encoding="utf-8").read()
+open(path, "w", encoding="utf-8").write(eval(transform))
+PYEOF
+    git -C "${dir}" commit -qam head
+}
+
+# Usage: assert_modified <expected true|false> <label> <dir> [substring]
+assert_modified() {
+    local expected="$1"
+    local label="$2"
+    local dir="$3"
+    local needle="${4:-}"
+    local output
+    output=$(cd "${dir}" && python3 "${CHECKER}" --mode detect-modifications \
+        --base-ref HEAD~1 --head-ref HEAD 2>&1 || true)
+    if ! echo "$output" | grep -qx "locked_sections_modified=${expected}"; then
+        fail "${label} — expected locked_sections_modified=${expected}"
+        echo "$output" | tail -10 | sed 's/^/      /'
+    elif [[ -n "${needle}" ]] && ! echo "$output" | grep -qF -- "${needle}"; then
+        fail "${label} — expected output to contain: '${needle}'"
+        echo "$output" | tail -10 | sed 's/^/      /'
+    else
+        pass "${label}"
+    fi
+}
+
+echo "======================================================="
+echo "  check_locked_sections.py — detect-modifications Tests"
+echo "  Authority: governance/canon/AGENT_CONTRACT_PROTECTION_PROTOCOL.md"
+echo "======================================================="
+echo ""
+
+echo "Test 1: edit inside a lock → modified"
+D="${WORK_DIR}/t1"
+make_repo "${D}" 't.replace("body1", "EVIL")'
+assert_modified true "Test 1 — lock edit detected" "${D}" "LOCK-TEST-001"
+echo ""
+
+echo "Test 2: edit outside a lock only → not modified"
+D="${WORK_DIR}/t2"
+make_repo "${D}" 't.replace("outro", "outro changed")'
+assert_modified false "Test 2 — outside edit ignored" "${D}"
+echo ""
+
+echo "Test 3: added '++ x' line above a lock plus lock edit → modified"
+D="${WORK_DIR}/t3"
+make_repo "${D}" 't.replace("intro", "++ harmless\nintro").replace("body1", "EVIL")'
+assert_modified true "Test 3 — '+++' content line is not a file header" "${D}" "LOCK-TEST-001"
+echo ""
+
+echo "Test 4: removed '-- x' line above a lock plus lock edit → modified"
+D="${WORK_DIR}/t4"
+make_repo "${D}" 't.replace("-- note above the lock\n", "").replace("body2", "EVIL")'
+assert_modified true "Test 4 — '---' content line is not a file header" "${D}" "LOCK-TEST-001"
+echo ""
+
+echo "Test 5: added '++ x' line outside a lock only → not modified"
+D="${WORK_DIR}/t5"
+make_repo "${D}" 't.replace("intro", "++ harmless\nintro")'
+assert_modified false "Test 5 — moved lock not reported" "${D}"
+echo ""
+
+echo "Test 6: whole locked section deleted → modified"
+D="${WORK_DIR}/t6"
+make_repo "${D}" 't[:t.index("<!-- LOCKED SECTION START")] + t[t.index("outro"):]'
+assert_modified true "Test 6 — removed lock reported" "${D}" "LOCK-TEST-001"
+echo ""
+
+# ── Summary ───────────────────────────────────────────────────────────────────
+echo "======================================================="
+TOTAL=$((PASS_COUNT + FAIL_COUNT))
+if [[ $FAIL_COUNT -eq 0 ]]; then
+    echo -e "${GREEN}All ${TOTAL} tests passed${NC}"
+    echo "======================================================="
+    exit 0
+else
+    echo -e "${RED}${FAIL_COUNT} of ${TOTAL} tests FAILED${NC}"
+    echo "======================================================="
+    exit 1
+fi
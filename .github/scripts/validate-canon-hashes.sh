@@ -6,7 +6,7 @@
 #   - version == canonical_version (if canonical_version is present and non-null)
 # Accumulates all validation failures and exits non-zero after checking every entry.
 #
-# Usage: .github/scripts/validate-canon-hashes.sh [path/to/CANON_INVENTORY.json]
+# Usage: .github/scripts/validate-canon-hashes.sh [path/to/CANON_INVENTORY.json] [--recompute]
 # Default: governance/CANON_INVENTORY.json
 
 set -euo pipefail
@@ -18,6 +18,22 @@ if [ ! -f "${INVENTORY}" ]; then
   exit 1
 fi
 
+# Rules live in the shared single-pass inventory integrity engine (also used by
+# check-alignment-overclaim.py). Pass --recompute to check hashes against the files on disk.
+ENGINE="$(dirname "$0")/../../governance/executable/scripts/inventory_integrity.py"
+if [ -f "${ENGINE}" ]; then
+  exec python3 "${ENGINE}" "${INVENTORY}" --gate canon-hash "${@:2}"
+fi
+
+# Standalone fallback for consumer copies of this script that do not carry the
+# engine (and its hash_store.py sibling); same rules and output, no --recompute
+for arg in "${@:2}"; do
+  if [ "${arg}" = "--recompute" ]; then
+    echo "❌ [CANON-HASH-001] --recompute needs governance/executable/scripts/inventory_integrity.py"
+    exit 2
+  fi
+done
+
 echo "[CANON-HASH-001] Validating file_hash integrity in ${INVENTORY}..."
 
 python3 - "${INVENTORY}" <<'PYEOF'
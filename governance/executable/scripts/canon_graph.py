@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""Persistent cross-reference graph of the governance Markdown corpus.
+
+Every Markdown file under the scanned directories (default governance/canon)
+is a node. Each file is parsed once into:
+
+  headings  GitHub anchor slugs of its ATX headings and explicit <a id/name>
+  links     Markdown link targets, [text](target) and [ref]: target
+  mentions  path-like references in prose or code spans, such as
+            BUILD_PHILOSOPHY.md or `governance/canon/WAVE_MODEL.md`
+
+Fenced code blocks are skipped, and links inside inline code are not links.
+The parse results are stored per node under the file's SHA256. An update
+hashes the corpus (through the optional digest store, see hash_store.py) and
+re-parses only nodes whose hash changed. Edges are then re-resolved from the
+stored parse results, because adding or removing a file can change what a
+bare filename points at:
+
+- a link or a path mention resolves against the repo root, then the file's
+  directory
+- a bare filename resolves to the file with that name in the same directory,
+  else to the only node with that name, else to a file at the repo root
+  (BUILD_PHILOSOPHY.md)
+
+References may point outside the scanned directories, so referrers and
+impact also work for files such as BUILD_PHILOSOPHY.md or governance
+templates. Mentions that resolve to nothing are ignored; only links can be
+broken.
+
+A link is broken when its target does not exist, or when it points into a
+node with an #anchor that matches none of that node's headings. External
+URLs are not checked.
+
+The graph is written with forward edges, reverse edges (referenced_by) and
+the broken links, so queries are dictionary lookups. It is kept in the user
+cache directory ($XDG_CACHE_HOME or ~/.cache), one file per repository,
+never in the checkout: a graph file committed by a PR could hide references
+or broken links. A --graph path inside --root is ignored, and library callers
+that gate anything (dispatch_ripple.py) build the graph in memory. `impact` returns the transitive referrers of a set of
+changed files, i.e. every canon that directly or indirectly cites them.
+
+Usage:
+    python canon_graph.py build|update [--scope DIR ...] [--store PATH]
+    python canon_graph.py referrers BUILD_PHILOSOPHY.md [--transitive]
+    python canon_graph.py references governance/canon/WAVE_MODEL.md [--transitive]
+    python canon_graph.py impact governance/canon/A.md [governance/canon/B.md ...]
+    python canon_graph.py broken [--json]
+
+Queries update the graph first unless --no-refresh is given. Exit codes:
+0 = ok (broken: no broken links), 1 = broken links found or path not in the
+graph, 2 = error.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import re
+from collections import deque
+from pathlib import Path
+from urllib.parse import unquote
+
+from hash_store import STORE_ENV, DigestStore, sha256_paths
+
+GRAPH_VERSION = 1
+DEFAULT_GRAPH_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "governance-canon-graph"
+DEFAULT_SCOPES = ("governance/canon",)
+
+FENCE = re.compile(r"^\s{0,3}(`{3,}|~{3,})")
+HEADING = re.compile(r"^\s{0,3}(#{1,6})\s+(.*?)\s*#*\s*$")
+HTML_ANCHOR = re.compile(r"<a\s+(?:name|id)=[\"']([^\"']+)[\"']", re.IGNORECASE)
+INLINE_CODE = re.compile(r"(`+).*?\1")
+INLINE_LINK = re.compile(r"\[(?:[^\[\]]|\[[^\]]*\])*\]\(\s*<?([^)\s>]+)>?(?:\s+[\"'(][^)]*)?\)")
+REFERENCE_DEF = re.compile(r"^\s{0,3}\[[^\]]+\]:\s*<?(\S+?)>?(?:\s|$)")
+MENTION = re.compile(r"(?<![\w./-])((?:\.{1,2}/)*[\w.-]+(?:/[\w.-]+)*\.md)(?![\w/-])")
+URL_SCHEME = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:")
+LINK_TEXT = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+
+
+def heading_slug(text: str) -> str:
+    """GitHub's anchor for a heading: lowercase, punctuation dropped, spaces to hyphens."""
+    text = LINK_TEXT.sub(r"\1", text).strip().lower()
+    return re.sub(r"[^\w\- ]", "", text).replace(" ", "-")
+
+
+def parse_markdown(text: str) -> dict:
+    """Headings, links and mentions of one Markdown document."""
+    headings: list[str] = []
+    seen: dict[str, int] = {}
+    links: list[list] = []
+    mentions: list[list] = []
+    fence = None
+    # Substring checks gate every regex; most lines are plain prose
+    for number, line in enumerate(text.splitlines(), 1):
+        marker = FENCE.match(line) if "``" in line or "~~" in line else None
+        if fence:
+            if marker and marker.group(1)[0] == fence[0] and len(marker.group(1)) >= len(fence):
+                fence = None
+            continue
+        if marker:
+            fence = marker.group(1)
+            continue
+
+        if "#" in line:
+            heading = HEADING.match(line)
+            if heading:
+                slug = heading_slug(heading.group(2))
+                count = seen.get(slug, 0)
+                seen[slug] = count + 1
+                headings.append(f"{slug}-{count}" if count else slug)
+        if "<a" in line:
+            headings.extend(anchor.lower() for anchor in HTML_ANCHOR.findall(line))
+
+        if "](" in line or "]:" in line:
+            prose = INLINE_CODE.sub("", line) if "`" in line else line
+            targets = INLINE_LINK.findall(prose)
+            definition = REFERENCE_DEF.match(prose)
+            if definition:
+                targets.append(definition.group(1))
+            links.extend([target, number] for target in targets)
+        if ".md" in line:
+            mentions.extend(
+                [ref, number] for ref in dict.fromkeys(MENTION.findall(line)) if not URL_SCHEME.match(ref)
+            )
+    return {"headings": headings, "links": links, "mentions": mentions}
+
+
+def scan_corpus(root: Path, scopes: list[str]) -> list[str]:
+    """Repo-relative posix paths of every Markdown file under the scopes."""
+    files = set()
+    for scope in scopes:
+        for directory, _subdirs, names in os.walk(root / scope):
+            rel_dir = Path(directory).relative_to(root).as_posix()
+            files.update(f"{rel_dir}/{name}" for name in names if name.endswith(".md"))
+    return sorted(files)
+
+
+class Resolver:
+    """Resolves link targets and mentions against the node set and the filesystem."""
+
+    def __init__(self, root: Path, nodes: dict[str, dict]) -> None:
+        self.root = root
+        self.nodes = nodes
+        self.by_name: dict[str, list[str]] = {}
+        for path in nodes:
+            self.by_name.setdefault(posixpath.basename(path), []).append(path)
+        self._exists: dict[str, bool] = {}
+
+    def exists(self, path: str) -> bool:
+        if path in self.nodes:
+            return True
+        if path not in self._exists:
+            self._exists[path] = (self.root / path).exists()
+        return self._exists[path]
+
+    def candidates(self, source: str, ref: str) -> list[str]:
+        if ref.startswith("/"):
+            return [posixpath.normpath(ref.lstrip("/"))]
+        local = posixpath.normpath(posixpath.join(posixpath.dirname(source), ref))
+        if "/" in ref and not ref.startswith("."):
+            return [posixpath.normpath(ref), local]
+        return [local]
+
+    def mention(self, source: str, ref: str) -> str | None:
+        """Existing file a path mention refers to, or None."""
+        for candidate in self.candidates(source, ref):
+            if self.exists(candidate):
+                return candidate
+        if "/" not in ref:
+            named = self.by_name.get(ref, [])
+            if len(named) == 1:
+                return named[0]
+            if self.exists(ref):
+                return ref
+        return None
+
+    def link(self, source: str, target: str) -> tuple[str | None, str | None]:
+        """(resolved path, broken reason) of a link target; external links resolve to (None, None)."""
+        if URL_SCHEME.match(target):
+            return None, None
+        path, _, anchor = target.partition("#")
+        path = unquote(path)
+        if path:
+            resolved = next((c for c in self.candidates(source, path) if self.exists(c)), None)
+            if resolved is None:
+                return self.candidates(source, path)[-1], "target does not exist"
+        else:
+            resolved = source
+        anchor = unquote(anchor).lower()
+        if anchor and resolved in self.nodes and anchor not in self.nodes[resolved]["headings"]:
+            return resolved, f"no heading #{anchor}"
+        return resolved, None
+
+
+def resolve(root: Path, nodes: dict[str, dict]) -> tuple[dict, dict, list]:
+    """Forward edges, reverse edges and broken links from the stored parse results."""
+    resolver = Resolver(root, nodes)
+    edges: dict[str, list[str]] = {}
+    broken: list[dict] = []
+    for source, node in nodes.items():
+        targets = set()
+        for target, line in node["links"]:
+            resolved, reason = resolver.link(source, target)
+            if reason:
+                broken.append({"source": source, "line": line, "target": target, "reason": reason})
+            elif resolved:
+                targets.add(resolved)
+        for ref, _line in node["mentions"]:
+            resolved = resolver.mention(source, ref)
+            if resolved:
+                targets.add(resolved)
+        targets.discard(source)
+        edges[source] = sorted(targets)
+
+    referenced_by: dict[str, list[str]] = {path: [] for path in nodes}
+    for source, targets in edges.items():
+        for target in targets:
+            referenced_by.setdefault(target, []).append(source)
+    return edges, referenced_by, broken
+
+
+def default_graph_path(root: Path) -> Path:
+    """Per-repository graph file in the user cache directory."""
+    return DEFAULT_GRAPH_DIR / f"{hashlib.sha256(str(root.resolve()).encode()).hexdigest()[:16]}.json"
+
+
+def trusted_graph_path(root: Path, graph_path: Path | None) -> Path | None:
+    """graph_path, or None when it is inside the checkout and could have been committed."""
+    if graph_path is None or graph_path.resolve().is_relative_to(root.resolve()):
+        return None
+    return graph_path
+
+
+def load_graph(graph_path: Path) -> dict | None:
+    try:
+        graph = json.loads(graph_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return graph if graph.get("graph_version") == GRAPH_VERSION else None
+
+
+def update_graph(
+    root: Path,
+    graph_path: Path | None,
+    scopes: list[str] | None = None,
+    store: DigestStore | None = None,
+    full: bool = False,
+) -> tuple[dict, int]:
+    """Bring the graph up to date; returns (graph, number of files parsed).
+
+    With graph_path None (or inside root) the graph is built in memory only.
+    """
+    graph_path = trusted_graph_path(root, graph_path)
+    previous = None if full or graph_path is None else load_graph(graph_path)
+    scopes = list(scopes or (previous["scopes"] if previous else DEFAULT_SCOPES))
+    if previous and previous["scopes"] != scopes:
+        previous = None
+    old_nodes = previous["nodes"] if previous else {}
+
+    files = scan_corpus(root, scopes)
+    digests = sha256_paths([root / path for path in files], store=store)
+    nodes: dict[str, dict] = {}
+    parsed = 0
+    for path in files:
+        digest = digests[root / path]
+        node = old_nodes.get(path)
+        if node is None or node["sha256"] != digest:
+            text = (root / path).read_text(encoding="utf-8", errors="replace")
+            node = {"sha256": digest, **parse_markdown(text)}
+            parsed += 1
+        nodes[path] = node
+
+    edges, referenced_by, broken = resolve(root, nodes)
+    graph = {
+        "graph_version": GRAPH_VERSION,
+        "scopes": scopes,
+        "nodes": nodes,
+        "edges": edges,
+        "referenced_by": referenced_by,
+        "broken": broken,
+    }
+    if graph_path is None:
+        return graph, parsed
+    graph_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = graph_path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(graph, separators=(",", ":")), encoding="utf-8")
+    tmp.replace(graph_path)
+    return graph, parsed
+
+
+def find_node(graph: dict, ref: str) -> str | None:
+    """Graph path for a repo-relative path or a unique bare filename."""
+    ref = posixpath.normpath(ref)
+    if ref in graph["referenced_by"]:
+        return ref
+    named = [path for path in graph["referenced_by"] if posixpath.basename(path) == ref]
+    return named[0] if len(named) == 1 else None
+
+
+def reachable(adjacency: dict[str, list[str]], starts: list[str]) -> list[str]:
+    """Every node reachable from starts (excluding the starts themselves), sorted."""
+    seen = set(starts)
+    queue = deque(starts)
+    while queue:
+        for neighbour in adjacency.get(queue.popleft(), []):
+            if neighbour not in seen:
+                seen.add(neighbour)
+                queue.append(neighbour)
+    return sorted(seen - set(starts))
+
+
+def impact(graph: dict, changed_paths: list[str]) -> list[str]:
+    """Files that transitively reference any changed path."""
+    starts = [path for path in (find_node(graph, p) for p in changed_paths) if path]
+    return reachable(graph["referenced_by"], starts)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build and query the canon cross-reference graph.")
+    parser.add_argument("--root", default=".", help="Repository root (default: cwd)")
+    parser.add_argument("--graph", help="Graph file outside the checkout (default: user cache dir)")
+    parser.add_argument("--scope", action="append",
+                        help=f"Directory to scan, repeatable (default: {', '.join(DEFAULT_SCOPES)})")
+    parser.add_argument("--store", help=f"Persistent digest store (default: ${STORE_ENV}, unset = no store)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="Parse every file and rebuild the graph")
+    sub.add_parser("update", help="Re-parse only files whose hash changed")
+    for name, help_text in (("referrers", "Files that reference PATH"), ("references", "Files PATH references")):
+        query_parser = sub.add_parser(name, help=help_text)
+        query_parser.add_argument("path")
+        query_parser.add_argument("--transitive", action="store_true")
+        query_parser.add_argument("--no-refresh", action="store_true", help="Query the graph as stored")
+    impact_parser = sub.add_parser("impact", help="Files that transitively reference any of PATHS")
+    impact_parser.add_argument("paths", nargs="+")
+    impact_parser.add_argument("--no-refresh", action="store_true", help="Query the graph as stored")
+    broken_parser = sub.add_parser("broken", help="List broken links")
+    broken_parser.add_argument("--json", action="store_true")
+    broken_parser.add_argument("--no-refresh", action="store_true", help="Query the graph as stored")
+    args = parser.parse_args()
+
+    root = Path(args.root)
+    graph_path = Path(args.graph) if args.graph else default_graph_path(root)
+    if trusted_graph_path(root, graph_path) is None:
+        print(f"ERROR: --graph {graph_path} is inside the checkout; keep the graph outside --root")
+        return 2
+    store = DigestStore.from_env(args.store)
+
+    if args.command in ("build", "update"):
+        graph, parsed = update_graph(root, graph_path, args.scope, store, full=args.command == "build")
+        edge_count = sum(len(targets) for targets in graph["edges"].values())
+        print(f"Graph: {len(graph['nodes'])} files, {edge_count} references, {len(graph['broken'])} broken links "
+              f"({parsed} parsed) -> {graph_path}")
+        return 0
+
+    graph = load_graph(graph_path) if args.no_refresh else update_graph(root, graph_path, args.scope, store)[0]
+    if graph is None:
+        print(f"ERROR: No canon graph at {graph_path}; run `canon_graph.py build` first")
+        return 2
+
+    if args.command == "broken":
+        if args.json:
+            print(json.dumps(graph["broken"], indent=2))
+        else:
+            for link in graph["broken"]:
+                print(f"{link['source']}:{link['line']}: {link['target']} ({link['reason']})")
+        return 1 if graph["broken"] else 0
+
+    if args.command == "impact":
+        paths = impact(graph, args.paths)
+    else:
+        node = find_node(graph, args.path)
+        if node is None:
+            print(f"ERROR: {args.path} is not in the graph")
+            return 1
+        adjacency = graph["referenced_by"] if args.command == "referrers" else graph["edges"]
+        paths = reachable(adjacency, [node]) if args.transitive else adjacency[node]
+    if paths:
+        print("\n".join(paths))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
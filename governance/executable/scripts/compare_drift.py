@@ -1,27 +1,263 @@
 #!/usr/bin/env python3
-"""Compare SHA256 of two files to detect drift."""
+"""Compare SHA256 of files to detect drift.
+
+Single mode compares one --expected-file/--actual-file pair. Batch mode
+compares every pair from a --manifest (JSON or TSV) or from two directory
+trees (--expected-root/--actual-root) in one process, hashes in parallel,
+writes a JSON or NDJSON drift report. Git mode (--git-objects) compares
+blob ids from `git ls-tree -r` for two refs and/or two repositories, so no
+file contents are read at all. Batch and git modes exit once at the end:
+
+  0 = every pair aligned
+  1 = drift (hash mismatch or file missing on the actual side)
+  2 = error (unreadable manifest, or expected file missing in manifest mode)
+"""
 
 import argparse
-import hashlib
+import json
 from pathlib import Path
 import sys
 
+from hash_store import STORE_ENV, DigestStore, ls_tree_blobs, sha256_file, sha256_paths
+
+ALIGNED = "ALIGNED"
+DRIFT = "DRIFT"
+MISSING_ACTUAL = "MISSING_ACTUAL"
+MISSING_EXPECTED = "MISSING_EXPECTED"
+EXTRA = "EXTRA"
+
 
 def compute_sha256(path: Path) -> str:
-    sha256_hash = hashlib.sha256()
-    with path.open("rb") as handle:
-        for block in iter(lambda: handle.read(4096), b""):
-            sha256_hash.update(block)
-    return sha256_hash.hexdigest()
+    return sha256_file(path)
+
+
+def load_manifest(path: Path) -> list[tuple[Path, Path]]:
+    """Read expected/actual pairs from a JSON or TSV manifest.
+
+    JSON: a list (or {"pairs": [...]}) of {"expected": ..., "actual": ...}
+    objects or [expected, actual] arrays. TSV: one "expected<TAB>actual" pair
+    per line; blank lines and lines starting with "#" are ignored.
+    """
+    text = path.read_text()
+    if path.suffix.lower() == ".json":
+        data = json.loads(text)
+        entries = data.get("pairs") if isinstance(data, dict) else data
+        if not isinstance(entries, list):
+            raise ValueError("Manifest JSON must be a list of pairs or an object with 'pairs'.")
+        pairs = []
+        for entry in entries:
+            if isinstance(entry, dict) and isinstance(entry.get("expected"), str) and isinstance(entry.get("actual"), str):
+                pairs.append((Path(entry["expected"]), Path(entry["actual"])))
+            elif isinstance(entry, list) and len(entry) == 2 and all(isinstance(p, str) for p in entry):
+                pairs.append((Path(entry[0]), Path(entry[1])))
+            else:
+                raise ValueError(f"Invalid manifest entry: {entry!r}")
+        return pairs
+
+    pairs = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        columns = line.split("\t")
+        if len(columns) != 2:
+            raise ValueError(f"Manifest line {line_number}: expected 2 tab-separated columns")
+        pairs.append((Path(columns[0]), Path(columns[1])))
+    return pairs
+
+
+def _tree_files(root: Path, pattern: str) -> set[Path]:
+    return {
+        path.relative_to(root)
+        for path in root.rglob(pattern)
+        if path.is_file() and ".git" not in path.relative_to(root).parts
+    }
+
+
+def directory_pairs(expected_root: Path, actual_root: Path, pattern: str) -> tuple[list[tuple[Path, Path]], list[Path]]:
+    """Pair files by relative path; also return files present only under actual_root."""
+    expected_files = _tree_files(expected_root, pattern)
+    actual_files = _tree_files(actual_root, pattern) if actual_root.is_dir() else set()
+    pairs = [(expected_root / rel, actual_root / rel) for rel in sorted(expected_files)]
+    extras = [actual_root / rel for rel in sorted(actual_files - expected_files)]
+    return pairs, extras
+
+
+def compare_pairs(
+    pairs: list[tuple[Path, Path]],
+    store: DigestStore | None = None,
+    jobs: int | None = None,
+    truncate: int = 0,
+) -> list[dict]:
+    """Compare every pair, hashing all existing files in one parallel batch."""
+    existing = {path for pair in pairs for path in pair if path.is_file()}
+    digests = sha256_paths(sorted(existing), store=store, jobs=jobs)
+
+    def shown(path: Path) -> str | None:
+        digest = digests.get(path)
+        if digest is None:
+            return None
+        return digest[:truncate] if truncate and truncate > 0 else digest
+
+    results = []
+    for expected, actual in pairs:
+        expected_hash = shown(expected)
+        actual_hash = shown(actual)
+        if expected_hash is None:
+            status = MISSING_EXPECTED
+        elif actual_hash is None:
+            status = MISSING_ACTUAL
+        else:
+            status = ALIGNED if expected_hash == actual_hash else DRIFT
+        results.append({
+            "expected": str(expected),
+            "actual": str(actual),
+            "status": status,
+            "expected_hash": expected_hash,
+            "actual_hash": actual_hash,
+        })
+    return results
+
+
+def compare_git_trees(expected: dict[str, str], actual: dict[str, str], truncate: int = 0) -> list[dict]:
+    """Compare two {path: blob id} maps; equal blob ids mean identical content."""
+
+    def shown(blob: str | None) -> str | None:
+        return blob[:truncate] if blob and truncate and truncate > 0 else blob
+
+    results = []
+    for path in sorted(expected):
+        actual_blob = actual.get(path)
+        if actual_blob is None:
+            status = MISSING_ACTUAL
+        else:
+            status = ALIGNED if actual_blob == expected[path] else DRIFT
+        results.append({
+            "expected": path,
+            "actual": path,
+            "status": status,
+            "expected_hash": shown(expected[path]),
+            "actual_hash": shown(actual_blob),
+        })
+    results.extend(
+        {"expected": None, "actual": path, "status": EXTRA, "expected_hash": None, "actual_hash": shown(actual[path])}
+        for path in sorted(set(actual) - set(expected))
+    )
+    return results
+
+
+def summarize(results: list[dict], hash_kind: str = "sha256") -> dict:
+    summary = {"total": len(results), "hash": hash_kind}
+    for status in (ALIGNED, DRIFT, MISSING_ACTUAL, MISSING_EXPECTED, EXTRA):
+        summary[status.lower()] = sum(1 for r in results if r["status"] == status)
+    return summary
+
+
+def write_report(results: list[dict], summary: dict, fmt: str, destination: Path | None) -> None:
+    if fmt == "ndjson":
+        lines = [json.dumps(r) for r in results] + [json.dumps({"summary": summary})]
+        text = "\n".join(lines) + "\n"
+    else:
+        text = json.dumps({"summary": summary, "results": results}, indent=2) + "\n"
+
+    if destination is None:
+        sys.stdout.write(text)
+        return
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    destination.write_text(text)
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    extras: list[Path] = []
+    hash_kind = "sha256"
+    if args.git_objects:
+        trees = []
+        for side in ("expected", "actual"):
+            repo = Path(getattr(args, f"{side}_repo"))
+            ref = getattr(args, f"{side}_ref")
+            blobs = ls_tree_blobs(repo, ref, args.path_prefix)
+            if blobs is None:
+                print(f"ERROR: Cannot read git tree {ref} in {repo}")
+                return 2
+            trees.append(blobs)
+        results = compare_git_trees(trees[0], trees[1], truncate=args.truncate)
+        hash_kind = "git-blob"
+    elif args.manifest:
+        manifest_path = Path(args.manifest)
+        try:
+            pairs = load_manifest(manifest_path)
+        except FileNotFoundError:
+            print(f"ERROR: Manifest missing: {manifest_path}")
+            return 2
+        except (json.JSONDecodeError, ValueError) as exc:
+            print(f"ERROR: Manifest invalid: {exc}")
+            return 2
+    else:
+        expected_root = Path(args.expected_root)
+        if not expected_root.is_dir():
+            print(f"ERROR: Expected root missing: {expected_root}")
+            return 2
+        pairs, extras = directory_pairs(expected_root, Path(args.actual_root), args.glob)
+
+    if not args.git_objects:
+        results = compare_pairs(pairs, store=DigestStore.from_env(args.store), jobs=args.jobs, truncate=args.truncate)
+        results.extend(
+            {"expected": None, "actual": str(path), "status": EXTRA, "expected_hash": None, "actual_hash": None}
+            for path in extras
+        )
+    summary = summarize(results, hash_kind)
+    report_path = Path(args.report) if args.report else None
+    write_report(results, summary, args.format, report_path)
+
+    if report_path is not None:
+        print(f"Drift report written to {report_path}")
+        print(
+            f"{summary['aligned']} aligned, {summary['drift']} drift, "
+            f"{summary['missing_actual']} missing locally, {summary['missing_expected']} missing canonical, "
+            f"{summary['extra']} extra (of {summary['total']})"
+        )
+
+    if summary["missing_expected"]:
+        return 2
+    if summary["drift"] or summary["missing_actual"]:
+        return 1
+    return 0
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="Compare two files by SHA256.")
-    parser.add_argument("--expected-file", required=True, help="Canonical file")
-    parser.add_argument("--actual-file", required=True, help="Local file")
+    parser = argparse.ArgumentParser(description="Compare files by SHA256.")
+    parser.add_argument("--expected-file", help="Canonical file")
+    parser.add_argument("--actual-file", help="Local file")
+    parser.add_argument("--manifest", help="Batch mode: JSON or TSV list of expected/actual pairs")
+    parser.add_argument("--expected-root", help="Batch mode: canonical directory tree")
+    parser.add_argument("--actual-root", help="Batch mode: local directory tree")
+    parser.add_argument("--glob", default="*", help="Batch directory mode: file pattern matched recursively (default: *)")
+    parser.add_argument("--git-objects", action="store_true", help="Git mode: compare blob ids of two refs/repositories")
+    parser.add_argument("--expected-repo", default=".", help="Git mode: canonical repository (default: .)")
+    parser.add_argument("--expected-ref", default="HEAD", help="Git mode: canonical ref (default: HEAD)")
+    parser.add_argument("--actual-repo", default=".", help="Git mode: local repository (default: .)")
+    parser.add_argument("--actual-ref", default="HEAD", help="Git mode: local ref (default: HEAD)")
+    parser.add_argument("--path-prefix", default="", help="Git mode: limit comparison to this repo-relative path")
+    parser.add_argument("--format", default="json", choices=["json", "ndjson"], help="Batch report format")
+    parser.add_argument("--report", help="Batch report path (default: stdout)")
+    parser.add_argument("--jobs", type=int, default=0, help="Worker threads for hashing (default: one per CPU)")
     parser.add_argument("--truncate", type=int, default=0, help="Truncate hashes to N characters")
+    parser.add_argument("--store", help=f"Persistent digest store (default: ${STORE_ENV}, unset = no store)")
     args = parser.parse_args()
 
+    single = args.expected_file is not None or args.actual_file is not None
+    roots = args.expected_root is not None or args.actual_root is not None
+    if sum([single, roots, args.manifest is not None, args.git_objects]) != 1:
+        parser.error(
+            "use exactly one of --expected-file/--actual-file, --manifest, "
+            "--expected-root/--actual-root, or --git-objects"
+        )
+    if single and not (args.expected_file and args.actual_file):
+        parser.error("--expected-file and --actual-file must be given together")
+    if roots and not (args.expected_root and args.actual_root):
+        parser.error("--expected-root and --actual-root must be given together")
+    if not single:
+        return run_batch(args)
+
     expected_path = Path(args.expected_file)
     actual_path = Path(args.actual_file)
 
@@ -32,8 +268,9 @@ def main() -> int:
         print(f"ERROR: Actual file missing: {actual_path}")
         return 2
 
-    expected_hash = compute_sha256(expected_path)
-    actual_hash = compute_sha256(actual_path)
+    digests = sha256_paths([expected_path, actual_path], store=DigestStore.from_env(args.store))
+    expected_hash = digests[expected_path]
+    actual_hash = digests[actual_path]
 
     if args.truncate and args.truncate > 0:
         expected_hash = expected_hash[: args.truncate]
@@ -1,36 +1,37 @@
 #!/usr/bin/env python3
-"""Compute SHA256 for a file with optional truncation."""
+"""Compute SHA256 for one or more files with optional truncation."""
 
 import argparse
-import hashlib
 from pathlib import Path
-import sys
+
+from hash_store import STORE_ENV, DigestStore, sha256_file, sha256_paths
 
 
 def compute_sha256(path: Path) -> str:
-    sha256_hash = hashlib.sha256()
-    with path.open("rb") as handle:
-        for block in iter(lambda: handle.read(4096), b""):
-            sha256_hash.update(block)
-    return sha256_hash.hexdigest()
+    return sha256_file(path)
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="Compute SHA256 for a file.")
-    parser.add_argument("path", help="Path to file to hash")
+    parser = argparse.ArgumentParser(description="Compute SHA256 for one or more files.")
+    parser.add_argument("paths", nargs="+", metavar="path", help="Path(s) to file(s) to hash")
     parser.add_argument("--truncate", type=int, default=0, help="Truncate to N characters")
+    parser.add_argument("--store", help=f"Persistent digest store (default: ${STORE_ENV}, unset = no store)")
+    parser.add_argument("--jobs", type=int, default=0, help="Worker threads for uncached files (default: one per CPU)")
     args = parser.parse_args()
 
-    target = Path(args.path)
-    if not target.exists():
-        print(f"ERROR: File not found: {target}")
-        return 2
-
-    digest = compute_sha256(target)
-    if args.truncate and args.truncate > 0:
-        digest = digest[: args.truncate]
-
-    print(digest)
+    targets = [Path(p) for p in args.paths]
+    for target in targets:
+        if not target.exists():
+            print(f"ERROR: File not found: {target}")
+            return 2
+
+    digests = sha256_paths(targets, store=DigestStore.from_env(args.store), jobs=args.jobs)
+    for target in targets:
+        digest = digests[target]
+        if args.truncate and args.truncate > 0:
+            digest = digest[: args.truncate]
+        # Single-file output stays a bare digest; batches use sha256sum layout
+        print(digest if len(targets) == 1 else f"{digest}  {target}")
     return 0
 
 
@@ -1,15 +1,191 @@
 #!/usr/bin/env python3
-"""Dispatch governance ripple events to consumer repositories."""
+"""Dispatch governance ripple events to consumer repositories.
+
+Consumers are dispatched concurrently by a bounded thread pool. A shared
+token bucket caps the request rate across all workers, and failed attempts
+back off with full-jitter exponential delays. There is no delay after the
+final attempt, and client errors that cannot succeed on retry (4xx other than
+408/429) stop at once. The log records the number of attempts actually made.
+
+Requests go through a keep-alive connection pool, so consecutive dispatches
+to the API host reuse TCP/TLS connections instead of paying the handshakes
+again. Each attempt's latency is written to the dispatch log. Every dispatch
+carries the delivery's idempotency key (client_payload.idempotency_key and an
+Idempotency-Key header), so a consumer can drop a retried dispatch that the
+server had already accepted.
+
+Deliveries are recorded in a durable queue (ripple_queue.py) keyed by an
+idempotency key per consumer and canonical commit. A rerun for the same
+commit re-sends the original payload only to consumers still outstanding, and
+concurrent dispatcher processes drain the queue without double delivery.
+--no-queue dispatches straight from the registry.
+
+Only consumers that carry a changed canon are dispatched to, as resolved by
+the canon-to-consumer dependency index in ripple_targets.py; other
+ripple-relevant changes (RIPPLE_PREFIXES) still reach every consumer, and
+evidence, changelog and other paths are ignored. --all-consumers disables targeting.
+--transitive-impact widens the target set to the consumers of every canon
+that directly or indirectly references a changed path (canon_graph.py).
+
+Bursts of commits can be coalesced into one ripple (ripple_coalesce.py):
+--since-commit takes the changed paths of every commit in BASE..HEAD, and
+--coalesce-window waits for further commits and lets only the newest run
+dispatch the merged batch. The payload then carries a commit_range.
+
+--api-url points the dispatcher at any GitHub-compatible endpoint (for
+example a local stub HTTP server).
+"""
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+import http.client
 import json
 import os
+import random
+import select
+import subprocess
+import threading
 import time
 import uuid
 from datetime import datetime
 from pathlib import Path
-from urllib import request
-from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+
+from canon_graph import impact, update_graph
+from ripple_coalesce import coalesce, git_changes
+from ripple_queue import DEFAULT_QUEUE_PATH, RippleQueue, idempotency_key
+from ripple_targets import DEFAULT_ALIGNMENT_DIR, INVENTORY_PATH, RIPPLE_PREFIXES, build_index, consumer_repository
+
+SUCCESS_STATUSES = {200, 201, 204}
+
+# Worth retrying: timeouts, rate limiting and server-side failures
+RETRYABLE_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+class ConnectionPool:
+    """Keep-alive HTTP/1.1 connections, pooled per (scheme, host, port).
+
+    A connection is checked out for one request/response exchange and returned
+    once the response body has been read, so sequential requests on the same
+    worker reuse the socket. If a reused connection turns out to be closed while
+    the request is being written, it is replaced and the request is sent again
+    on a fresh connection. A failure while waiting for the response is raised
+    instead: the server may already have acted on a POST, so resending is left
+    to the caller's retry policy.
+    """
+
+    def __init__(self, timeout: float = 10, max_idle_per_host: int = 8) -> None:
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self.lock = threading.Lock()
+        self.opened = 0
+        self.reused = 0
+
+    @staticmethod
+    def _alive(conn: http.client.HTTPConnection) -> bool:
+        """An idle keep-alive socket that has become readable was closed by the server."""
+        if conn.sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([conn.sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def _checkout(self, key: tuple[str, str, int]) -> tuple[http.client.HTTPConnection, bool]:
+        with self.lock:
+            idle = self.idle.get(key) or []
+            while idle:
+                conn = idle.pop()
+                if self._alive(conn):
+                    self.reused += 1
+                    return conn, True
+                conn.close()
+            self.opened += 1
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout), False
+        return http.client.HTTPConnection(host, port, timeout=self.timeout), False
+
+    def _checkin(self, key: tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self.lock:
+            idle = self.idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def request(self, method: str, url: str, body: bytes, headers: dict[str, str]) -> int:
+        """Send one request and return the HTTP status (any status, no exception for 4xx/5xx)."""
+        parts = urlsplit(url)
+        default_port = 443 if parts.scheme == "https" else 80
+        key = (parts.scheme, parts.hostname, parts.port or default_port)
+        target = parts.path + (f"?{parts.query}" if parts.query else "")
+        while True:
+            conn, reused = self._checkout(key)
+            try:
+                conn.request(method, target, body=body, headers=headers)
+            except (ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused:
+                    continue  # stale keep-alive socket, request not delivered: use a fresh connection
+                raise
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                raise
+            try:
+                resp = conn.getresponse()
+                resp.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+            return resp.status
+
+    def close(self) -> None:
+        with self.lock:
+            connections = [conn for idle in self.idle.values() for conn in idle]
+            self.idle.clear()
+        for conn in connections:
+            conn.close()
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, at most `capacity` banked."""
+
+    def __init__(self, rate: float, capacity: int = 1, clock=time.monotonic, sleep=time.sleep) -> None:
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = float(self.capacity)
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, waiting (outside the lock) until one is available."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+
+def backoff_delay(attempt: int, base: float, cap: float, rng: random.Random | None = None) -> float:
+    """Full-jitter exponential backoff after failed attempt number `attempt` (1-based)."""
+    ceiling = min(cap, base * (2 ** (attempt - 1)))
+    return (rng or random).uniform(0, ceiling)
 
 
 def load_registry(path: Path) -> dict:
@@ -17,16 +193,178 @@ def load_registry(path: Path) -> dict:
         return json.load(handle)
 
 
-def send_dispatch(owner: str, repo: str, token: str, event_type: str, payload: dict) -> int:
-    url = f"https://api.github.com/repos/{owner}/{repo}/dispatches"
+def consumer_coordinates(consumer: dict) -> tuple[str | None, str | None]:
+    """Return (owner, repo) from either explicit fields or "repository": "owner/repo"."""
+    owner, repo = consumer.get("owner"), consumer.get("repo")
+    if (not owner or not repo) and "/" in consumer.get("repository", ""):
+        owner, repo = consumer["repository"].split("/", 1)
+    return owner, repo
+
+
+def send_dispatch(
+    owner: str,
+    repo: str,
+    token: str,
+    event_type: str,
+    payload: dict,
+    api_url: str = "https://api.github.com",
+    pool: ConnectionPool | None = None,
+) -> int:
+    url = f"{api_url.rstrip('/')}/repos/{owner}/{repo}/dispatches"
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "Authorization": f"token {token}",
+        "User-Agent": "maturion-bot-ripple",
+        "Content-Type": "application/json",
+    }
+    if payload.get("canonical_commit"):
+        # Same key as the delivery queue; a resent dispatch carries it unchanged
+        # so the consumer can drop duplicates
+        key = idempotency_key(event_type, payload["canonical_commit"], owner, repo)
+        payload = {**payload, "idempotency_key": key}
+        headers["Idempotency-Key"] = key
     data = json.dumps({"event_type": event_type, "client_payload": payload}).encode("utf-8")
-    req = request.Request(url, data=data, method="POST")
-    req.add_header("Accept", "application/vnd.github+json")
-    req.add_header("Authorization", f"token {token}")
-    req.add_header("User-Agent", "maturion-bot-ripple")
+    if pool is not None:
+        return pool.request("POST", url, data, headers)
+    single = ConnectionPool()
+    try:
+        return single.request("POST", url, data, headers)
+    finally:
+        single.close()
+
+
+def dispatch_consumer(
+    consumer: dict,
+    send,
+    limiter: TokenBucket,
+    max_attempts: int,
+    backoff_seconds: float,
+    max_backoff_seconds: float,
+    sleep=time.sleep,
+) -> dict:
+    """Dispatch to one consumer with retries; `send(owner, repo)` returns an HTTP status."""
+    owner, repo = consumer_coordinates(consumer)
+    status = "FAILED"
+    error = None
+    requests_made = []
+    started = time.monotonic()
+    if not owner or not repo:
+        error = "Registry entry has no owner/repo"
+    else:
+        for attempt in range(1, max_attempts + 1):
+            limiter.acquire()
+            retryable = True
+            response_status = None
+            sent = time.monotonic()
+            try:
+                response_status = send(owner, repo)
+                if response_status in SUCCESS_STATUSES:
+                    status = "SUCCESS"
+                    error = None
+                else:
+                    error = f"HTTP {response_status}"
+                    retryable = response_status in RETRYABLE_STATUSES or response_status >= 500
+            except (http.client.HTTPException, OSError) as exc:
+                error = str(exc) or type(exc).__name__
+            requests_made.append({
+                "attempt": attempt,
+                "status": response_status,
+                "latency_ms": round((time.monotonic() - sent) * 1000, 1),
+            })
+            if status == "SUCCESS" or not retryable or attempt == max_attempts:
+                break
+            sleep(backoff_delay(attempt, backoff_seconds, max_backoff_seconds))
+    return {
+        "owner": owner,
+        "repo": repo,
+        "status": status,
+        "error": error,
+        "attempts": len(requests_made),
+        "duration_ms": round((time.monotonic() - started) * 1000, 1),
+        "requests": requests_made,
+    }
+
+
+def dispatch_all(
+    consumers: list[dict],
+    send,
+    concurrency: int,
+    limiter: TokenBucket,
+    max_attempts: int,
+    backoff_seconds: float,
+    max_backoff_seconds: float,
+) -> list[dict]:
+    """Dispatch to every consumer on a bounded pool; outcomes keep registry order."""
+    if not consumers:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(consumers)))) as executor:
+        return list(executor.map(
+            lambda consumer: dispatch_consumer(
+                consumer, send, limiter, max_attempts, backoff_seconds, max_backoff_seconds
+            ),
+            consumers,
+        ))
+
+
+def dispatch_queue(
+    queue: RippleQueue,
+    event_type: str,
+    canonical_commit: str,
+    make_send,
+    concurrency: int,
+    limiter: TokenBucket,
+    max_attempts: int,
+    backoff_seconds: float,
+    max_backoff_seconds: float,
+) -> list[dict]:
+    """Drain this commit's outstanding queue rows with `concurrency` workers.
+
+    `make_send(payload)` returns the send(owner, repo) callable for a row's
+    stored payload. Outcomes cover the rows this process delivered or failed.
+    """
+    outcomes: list[dict] = []
+    lock = threading.Lock()
+
+    def worker() -> None:
+        while True:
+            row = queue.claim(event_type, canonical_commit)
+            if row is None:
+                return
+            outcome = dispatch_consumer(
+                {"owner": row["owner"], "repo": row["repo"]},
+                make_send(json.loads(row["payload"])),
+                limiter, max_attempts, backoff_seconds, max_backoff_seconds,
+            )
+            outcome["idempotency_key"] = row["idempotency_key"]
+            queue.complete(row["idempotency_key"], outcome["status"] == "SUCCESS", outcome["attempts"], outcome["error"])
+            with lock:
+                outcomes.append(outcome)
 
-    with request.urlopen(req, timeout=10) as resp:
-        return resp.status
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        for future in [executor.submit(worker) for _ in range(max(1, concurrency))]:
+            future.result()
+    return sorted(outcomes, key=lambda o: (o["owner"], o["repo"]))
+
+
+def http_metrics(outcomes: list[dict], pool: ConnectionPool) -> dict:
+    """Connection reuse and latency percentiles over every attempt in the run."""
+    latencies = sorted(r["latency_ms"] for o in outcomes for r in o.get("requests", []))
+
+    def percentile(fraction: float) -> float | None:
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+    return {
+        "requests": len(latencies),
+        "connections_opened": pool.opened,
+        "connections_reused": pool.reused,
+        "latency_ms": {
+            "p50": percentile(0.50),
+            "p95": percentile(0.95),
+            "max": latencies[-1] if latencies else None,
+        },
+    }
 
 
 def main() -> int:
@@ -36,11 +374,36 @@ def main() -> int:
     parser.add_argument("--canonical-commit", required=True)
     parser.add_argument("--inventory-version", required=True)
     parser.add_argument("--changed-paths", default="")
+    parser.add_argument("--inventory", default=INVENTORY_PATH, help="Canon inventory used for targeting")
+    parser.add_argument("--alignment-dir", default=str(DEFAULT_ALIGNMENT_DIR),
+                        help="Directory of consumer GOVERNANCE_ALIGNMENT_INVENTORY.json files")
+    parser.add_argument("--since-commit",
+                        help="Coalesce the changed paths of every commit after this one up to --canonical-commit")
+    parser.add_argument("--coalesce-window", type=float, default=0,
+                        help="Seconds to wait for further commits before dispatching one merged ripple (0 = off)")
+    parser.add_argument("--coalesce-max-wait", type=float,
+                        help="Dispatch a coalesced batch once its oldest change has waited this long")
+    parser.add_argument("--all-consumers", action="store_true",
+                        help="Dispatch to every enabled consumer regardless of the changed paths")
+    parser.add_argument("--transitive-impact", action="store_true",
+                        help="Also target consumers of canons that transitively reference a changed path")
     parser.add_argument("--output", default=".agent-admin/governance/ripple-dispatch-log.json")
     parser.add_argument("--token-env", default="RIPPLE_DISPATCH_TOKEN")
+    parser.add_argument("--api-url", default=os.getenv("GITHUB_API_URL", "https://api.github.com"),
+                        help="GitHub API base URL (default: $GITHUB_API_URL or https://api.github.com)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Consumers dispatched in parallel")
     parser.add_argument("--max-attempts", type=int, default=3)
-    parser.add_argument("--backoff-seconds", type=int, default=30)
-    parser.add_argument("--rate-limit-seconds", type=int, default=1)
+    parser.add_argument("--backoff-seconds", type=float, default=30,
+                        help="Base delay; attempt n waits up to base * 2^(n-1), jittered")
+    parser.add_argument("--max-backoff-seconds", type=float, default=300, help="Cap on a single backoff delay")
+    parser.add_argument("--rate-limit-seconds", type=float, default=1,
+                        help="Average spacing between requests across all workers (0 = unlimited)")
+    parser.add_argument("--burst", type=int, default=1, help="Requests allowed back-to-back before rate limiting")
+    parser.add_argument("--timeout", type=float, default=10, help="Per-request timeout in seconds")
+    parser.add_argument("--queue", default=str(DEFAULT_QUEUE_PATH), help="Durable delivery queue (SQLite)")
+    parser.add_argument("--no-queue", action="store_true", help="Dispatch without recording deliveries")
+    parser.add_argument("--lease-seconds", type=float,
+                        help="How long a claimed delivery stays reserved (default: worst-case retry time plus 60s)")
     args = parser.parse_args()
 
     token = os.getenv(args.token_env)
@@ -59,53 +422,126 @@ def main() -> int:
         print("ERROR: No enabled consumers in registry.")
         return 2
 
+    if args.coalesce_window and args.no_queue:
+        print("ERROR: --coalesce-window needs the delivery queue; drop --no-queue.")
+        return 2
+    queue = None
+    if not args.no_queue:
+        lease = args.lease_seconds or args.max_attempts * (args.timeout + args.max_backoff_seconds) + 60
+        queue = RippleQueue(Path(args.queue), lease_seconds=lease)
+
+    canonical_commit = args.canonical_commit
+    changed_paths = [p for p in args.changed_paths.split(",") if p]
+    commit_range = None
+    if args.since_commit:
+        try:
+            changes = git_changes(args.since_commit, canonical_commit, prefixes=RIPPLE_PREFIXES)
+        except (OSError, subprocess.CalledProcessError) as exc:
+            print(f"ERROR: Cannot read commits {args.since_commit}..{canonical_commit}: {exc}")
+            return 2
+        merged = coalesce(changes, base=args.since_commit)
+        changed_paths = sorted(set(changed_paths) | set(merged["changed_paths"]))
+        commit_range = merged["commit_range"]
+        if not changed_paths:
+            # An empty change list would broadcast; this range has nothing to ripple
+            print(f"No ripple-relevant paths changed in {args.since_commit}..{canonical_commit}; nothing to dispatch.")
+            return 0
+    if args.coalesce_window:
+        queue.record_change(args.event_type, canonical_commit, changed_paths)
+        time.sleep(args.coalesce_window)
+        batch = queue.drain_changes(args.event_type, canonical_commit, args.coalesce_max_wait)
+        if batch is None:
+            print("Superseded by a later commit; its run dispatches the coalesced ripple.")
+            return 0
+        if len(batch) > 1 or commit_range is None:
+            merged = coalesce(batch)
+            changed_paths = merged["changed_paths"]
+            commit_range = merged["commit_range"]
+        canonical_commit = batch[-1].commit
+        print(f"Coalesced {len(batch)} commit(s) into one ripple for {canonical_commit}.")
+
+    targeting = None
+    if not args.all_consumers:
+        if Path(args.inventory).exists():
+            index = build_index(Path(args.inventory), consumers, Path(args.alignment_dir))
+            dependents = []
+            if args.transitive_impact and changed_paths:
+                # Built in memory: a graph file from the checkout is not trusted
+                graph, _ = update_graph(Path("."), None)
+                # Only inventoried canons; an unknown path would broadcast
+                dependents = [p for p in impact(graph, changed_paths)
+                              if p in index.status_by_path and p not in changed_paths]
+            affected, resolution = index.targets(changed_paths + dependents)
+            targeting = {
+                "affected": affected,
+                "skipped": [r for r in index.consumers if r not in affected],
+                "basis": index.basis,
+                "paths": resolution,
+            }
+            if args.transitive_impact:
+                targeting["dependents"] = dependents
+            consumers = [c for c in consumers if consumer_repository(c) in affected]
+            if not consumers:
+                print("No enabled consumer carries the changed canons; nothing to dispatch.")
+        else:
+            print(f"WARNING: Inventory not found at {args.inventory}; dispatching to every consumer.")
+
     dispatch_id = str(uuid.uuid4())
     payload = {
         "event_type": args.event_type,
-        "canonical_commit": args.canonical_commit,
+        "canonical_commit": canonical_commit,
         "inventory_version": args.inventory_version,
-        "changed_paths": [p for p in args.changed_paths.split(",") if p],
+        "changed_paths": changed_paths,
+        "commit_range": commit_range,
         "sender": "APGI-cmy/maturion-foreman-governance",
         "dispatch_id": dispatch_id,
         "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z"
     }
 
-    outcomes = []
-    failures = []
+    rate = 1 / args.rate_limit_seconds if args.rate_limit_seconds > 0 else 0
+    limiter = TokenBucket(rate, args.burst)
+    pool = ConnectionPool(timeout=args.timeout, max_idle_per_host=max(args.concurrency, 1))
 
-    for consumer in consumers:
-        owner = consumer.get("owner")
-        repo = consumer.get("repo")
-        status = "FAILED"
-        error = None
-        for attempt in range(1, args.max_attempts + 1):
-            try:
-                response_status = send_dispatch(owner, repo, token, args.event_type, payload)
-                if response_status in {200, 201, 204}:
-                    status = "SUCCESS"
-                    error = None
-                    break
-                error = f"HTTP {response_status}"
-            except (HTTPError, URLError, TimeoutError, OSError) as exc:
-                error = str(exc)
-            time.sleep(args.backoff_seconds * attempt)
-        outcomes.append({
-            "owner": owner,
-            "repo": repo,
-            "status": status,
-            "error": error,
-            "attempts": args.max_attempts
-        })
-        if status != "SUCCESS":
-            failures.append(f"{owner}/{repo}")
-        time.sleep(args.rate_limit_seconds)
+    def make_send(row_payload: dict):
+        def send(owner: str, repo: str) -> int:
+            return send_dispatch(owner, repo, token, args.event_type, row_payload, args.api_url, pool)
+        return send
+
+    queue_report = None
+    try:
+        if queue is None:
+            outcomes = dispatch_all(
+                consumers, make_send(payload), args.concurrency, limiter,
+                args.max_attempts, args.backoff_seconds, args.max_backoff_seconds,
+            )
+        else:
+            coordinates = [consumer_coordinates(c) for c in consumers]
+            invalid = [c for c, (owner, repo) in zip(consumers, coordinates) if not owner or not repo]
+            if invalid:
+                print(f"ERROR: {len(invalid)} registry entries have no owner/repo.")
+                return 2
+            payload = queue.enqueue(args.event_type, canonical_commit, coordinates, payload)
+            dispatch_id = payload["dispatch_id"]
+            outcomes = dispatch_queue(
+                queue, args.event_type, canonical_commit, make_send, args.concurrency, limiter,
+                args.max_attempts, args.backoff_seconds, args.max_backoff_seconds,
+            )
+            queue_report = {"path": args.queue, "status_counts": queue.status_counts(args.event_type, canonical_commit)}
+            if consumers and not outcomes:
+                print("Nothing outstanding: every consumer already has this ripple or is being served by another dispatcher.")
+    finally:
+        pool.close()
+    failures = [f"{o['owner']}/{o['repo']}" for o in outcomes if o["status"] != "SUCCESS"]
 
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(json.dumps({
         "dispatch_id": dispatch_id,
         "payload": payload,
-        "outcomes": outcomes
+        "outcomes": outcomes,
+        "http": http_metrics(outcomes, pool),
+        "queue": queue_report,
+        "targeting": targeting,
     }, indent=2))
 
     if failures:
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""Prebuilt index of governance evidence artifacts for gate lookups.
+
+Walks .agent-admin and .agent-workspace once and records every evidence
+artifact by kind, PR number and timestamp:
+
+  assurance-token      .agent-admin/assurance/{assurance-token,iaa-token-session,iaa-assurance-token}-*
+  rejection-package    .agent-admin/assurance/rejection-package-*
+  correction-addendum  .agent-admin/{assurance,prehandover}/correction-addendum-*
+  iaa-prebrief         .agent-admin/assurance/iaa-prebrief-*
+  prehandover-proof    .agent-admin/prehandover/{proof-,prehandover_proof,PREHANDOVER_PROOF}*.md
+  ecap-reconciliation  .agent-admin/prehandover/ecap-reconciliation-*.md
+  session-memory       .agent-workspace/<agent>/memory/session-*.md
+
+An artifact belongs to a PR when a digit run in its filename equals the PR
+number ("filename" match) or its content references it as "PR #N", "PR N" or
+"PR:N" ("content" match), as the gates' token discovery does. The timestamp
+is the YYYYMMDD date in the filename when there is one; mtime breaks ties.
+
+The index is a JSON file with a precomputed by_pr/by_kind lookup, so a query
+is a dictionary access. It records the HEAD commit it was built at and every
+path that was dirty (modified, deleted or untracked) at the time. A later
+update re-reads the paths that `git diff` against that commit reports, plus
+untracked files and the recorded dirty paths; the latter catches worktree
+edits that were reverted since. A full walk happens when the index is
+missing, has an older version, or its commit is no longer reachable.
+
+The index lives in the user cache directory ($XDG_CACHE_HOME or ~/.cache),
+one file per repository, never in the checkout: an index file committed by a
+PR could list artifacts that do not exist. An --index path inside --root is
+refused, and gates run `build` before querying.
+
+Usage:
+    python evidence_index.py build
+    python evidence_index.py update
+    python evidence_index.py query --pr 1336 --kind assurance-token [--match filename|content|any] [--latest]
+    python evidence_index.py query --kind session-memory --latest
+
+query refreshes the index first (unless --no-refresh) and prints one path per
+line. Exit codes: 0 = found, 1 = no matching artifact, 2 = error.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+from pathlib import Path
+
+INDEX_VERSION = 2
+DEFAULT_INDEX_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "governance-evidence-index"
+ROOTS = (".agent-admin", ".agent-workspace")
+SKIP_DIRS = {".agent-admin/cache", ".agent-admin/governance"}
+
+KIND_PATTERNS = [
+    ("assurance-token", re.compile(
+        r"^\.agent-admin/assurance/(assurance-token-|iaa-token-session-|iaa-assurance-token-)[^/]*$")),
+    ("rejection-package", re.compile(r"^\.agent-admin/assurance/rejection-package-[^/]*$")),
+    ("correction-addendum", re.compile(r"^\.agent-admin/(assurance|prehandover)/correction-addendum-[^/]*$")),
+    ("iaa-prebrief", re.compile(r"^\.agent-admin/assurance/iaa-prebrief-[^/]*$")),
+    ("prehandover-proof", re.compile(
+        r"^\.agent-admin/prehandover/([^/]+/)?(proof-|prehandover_proof|PREHANDOVER_PROOF)[^/]*\.md$")),
+    ("ecap-reconciliation", re.compile(r"^\.agent-admin/prehandover/ecap-reconciliation-[^/]*\.md$")),
+    ("session-memory", re.compile(r"^\.agent-workspace/([^/]+/){1,2}memory/session-[^/]*\.md$")),
+]
+KINDS = [kind for kind, _ in KIND_PATTERNS]
+
+DIGIT_RUN = re.compile(r"\d+")
+FILENAME_DATE = re.compile(r"(?<!\d)(20\d{6})(?!\d)")
+CONTENT_PR_REF = re.compile(r"(?:^|[^0-9])PR[# :]*(\d+)(?![0-9])")
+
+
+def classify(rel_path: str) -> str | None:
+    """Artifact kind of a repo-relative posix path, or None."""
+    for kind, pattern in KIND_PATTERNS:
+        if pattern.match(rel_path):
+            return kind
+    return None
+
+
+def index_artifact(root: Path, rel_path: str, kind: str) -> dict | None:
+    """Index record for one artifact, or None if it cannot be read."""
+    path = root / rel_path
+    try:
+        stat = path.stat()
+        text = path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+    name = Path(rel_path).name
+    date = FILENAME_DATE.search(name)
+    return {
+        "kind": kind,
+        "date": date.group(1) if date else None,
+        "mtime": stat.st_mtime,
+        "prs_filename": sorted({str(int(n)) for n in DIGIT_RUN.findall(name)}, key=int),
+        "prs_content": sorted({str(int(n)) for n in CONTENT_PR_REF.findall(text)}, key=int),
+    }
+
+
+def walk_artifacts(root: Path) -> dict[str, dict]:
+    """Walk the evidence roots once and index every recognised artifact."""
+    artifacts: dict[str, dict] = {}
+    for top in ROOTS:
+        for directory, subdirs, files in os.walk(root / top):
+            rel_dir = Path(directory).relative_to(root).as_posix()
+            subdirs[:] = [d for d in subdirs if f"{rel_dir}/{d}" not in SKIP_DIRS]
+            for name in files:
+                rel_path = f"{rel_dir}/{name}"
+                kind = classify(rel_path)
+                if kind:
+                    record = index_artifact(root, rel_path, kind)
+                    if record:
+                        artifacts[rel_path] = record
+    return artifacts
+
+
+def sort_key(item: tuple[str, dict]) -> tuple:
+    """Chronological order: filename date, then mtime, then path."""
+    path, record = item
+    return (record["date"] or "", record["mtime"], path)
+
+
+def build_lookups(artifacts: dict[str, dict]) -> tuple[dict, dict]:
+    """by_pr[pr][kind] = {"filename": [...], "content": [...]}, by_kind[kind] = [...], oldest first."""
+    by_pr: dict[str, dict[str, dict[str, list[str]]]] = {}
+    by_kind: dict[str, list[str]] = {}
+    for path, record in sorted(artifacts.items(), key=sort_key):
+        by_kind.setdefault(record["kind"], []).append(path)
+        for match in ("filename", "content"):
+            for pr in record[f"prs_{match}"]:
+                slot = by_pr.setdefault(pr, {}).setdefault(record["kind"], {"filename": [], "content": []})
+                slot[match].append(path)
+    return by_pr, by_kind
+
+
+def _git(args: list[str], root: Path) -> str | None:
+    try:
+        result = subprocess.run(["git", *args], cwd=root, capture_output=True, text=True, timeout=60)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def head_commit(root: Path) -> str | None:
+    out = _git(["rev-parse", "--verify", "HEAD"], root)
+    return out.strip() if out else None
+
+
+def changed_since(root: Path, commit: str) -> set[str] | None:
+    """Paths under the evidence roots changed since commit (worktree included), or None."""
+    diff = _git(["diff", "--name-only", "--no-renames", "-z", commit, "--", *ROOTS], root)
+    if diff is None:
+        return None
+    untracked = _git(["ls-files", "--others", "--exclude-standard", "-z", "--", *ROOTS], root) or ""
+    return {p for p in (diff + untracked).split("\0") if p}
+
+
+def write_index(index_path: Path, commit: str | None, artifacts: dict[str, dict], dirty: list[str]) -> dict:
+    by_pr, by_kind = build_lookups(artifacts)
+    index = {
+        "index_version": INDEX_VERSION,
+        "commit": commit,
+        "dirty": dirty,
+        "artifacts": artifacts,
+        "by_pr": by_pr,
+        "by_kind": by_kind,
+    }
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = index_path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+    tmp.replace(index_path)
+    return index
+
+
+def dirty_paths(root: Path) -> list[str]:
+    """Paths whose worktree state differs from HEAD (modified, deleted or untracked).
+
+    A later diff against the indexed commit would not report them once they
+    are reverted or removed, so the next update re-reads them explicitly.
+    """
+    modified = _git(["diff", "--name-only", "--no-renames", "-z", "HEAD", "--", *ROOTS], root) or ""
+    untracked = _git(["ls-files", "--others", "--exclude-standard", "-z", "--", *ROOTS], root) or ""
+    return sorted({p for p in (modified + untracked).split("\0") if p})
+
+
+def default_index_path(root: Path) -> Path:
+    """Per-repository index file in the user cache directory."""
+    return DEFAULT_INDEX_DIR / f"{hashlib.sha256(str(root.resolve()).encode()).hexdigest()[:16]}.json"
+
+
+def build_index(root: Path, index_path: Path) -> dict:
+    artifacts = walk_artifacts(root)
+    return write_index(index_path, head_commit(root), artifacts, dirty_paths(root))
+
+
+def load_index(index_path: Path) -> dict | None:
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return index if index.get("index_version") == INDEX_VERSION else None
+
+
+def update_index(root: Path, index_path: Path) -> tuple[dict, str]:
+    """Bring the index up to date; returns (index, "full" | "incremental")."""
+    index = load_index(index_path)
+    changed = changed_since(root, index["commit"]) if index and index.get("commit") else None
+    if changed is None:
+        return build_index(root, index_path), "full"
+
+    artifacts = index["artifacts"]
+    for rel_path in changed | set(index.get("dirty", [])):
+        kind = classify(rel_path)
+        record = index_artifact(root, rel_path, kind) if kind else None
+        if record:
+            artifacts[rel_path] = record
+        else:
+            artifacts.pop(rel_path, None)
+    return write_index(index_path, head_commit(root), artifacts, dirty_paths(root)), "incremental"
+
+
+def query(index: dict, kind: str | None, pr: str | None, match: str = "any", latest: bool = False) -> list[str]:
+    """Matching artifact paths, oldest first (only the newest with latest=True)."""
+    if pr is not None:
+        slots = index["by_pr"].get(str(int(pr)), {})
+        kinds = [kind] if kind else KINDS
+        matches = ["filename", "content"] if match == "any" else [match]
+        paths = list(dict.fromkeys(
+            path for k in kinds for m in matches for path in slots.get(k, {}).get(m, [])
+        ))
+        if len(kinds) > 1 or len(matches) > 1:
+            paths.sort(key=lambda p: sort_key((p, index["artifacts"][p])))
+    else:
+        paths = list(index["by_kind"].get(kind, [])) if kind else [
+            path for path, _ in sorted(index["artifacts"].items(), key=sort_key)
+        ]
+    return paths[-1:] if latest else paths
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build and query the governance evidence artifact index.")
+    parser.add_argument("--root", default=".", help="Repository root (default: cwd)")
+    parser.add_argument("--index", help="Index file outside --root (default: per-repository file in the user cache)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="Walk the evidence directories and rebuild the index")
+    sub.add_parser("update", help="Re-index only the paths changed since the indexed commit")
+    query_parser = sub.add_parser("query", help="Print matching artifact paths")
+    query_parser.add_argument("--kind", choices=KINDS)
+    query_parser.add_argument("--pr", help="PR number")
+    query_parser.add_argument("--match", choices=["filename", "content", "any"], default="any",
+                              help="How an artifact must reference --pr (default: any)")
+    query_parser.add_argument("--latest", action="store_true", help="Only print the newest match")
+    query_parser.add_argument("--no-refresh", action="store_true", help="Query the index as stored")
+    query_parser.add_argument("--json", action="store_true", help="Print matches with their index records")
+    args = parser.parse_args()
+
+    root = Path(args.root)
+    index_path = Path(args.index) if args.index else default_index_path(root)
+    if index_path.resolve().is_relative_to(root.resolve()):
+        print(f"ERROR: --index {index_path} is inside the checkout; keep the index outside --root")
+        return 2
+
+    if args.command == "build":
+        index = build_index(root, index_path)
+        print(f"Indexed {len(index['artifacts'])} evidence artifacts into {index_path}")
+        return 0
+    if args.command == "update":
+        index, mode = update_index(root, index_path)
+        print(f"Indexed {len(index['artifacts'])} evidence artifacts into {index_path} ({mode})")
+        return 0
+
+    if args.pr is not None and not args.pr.isdigit():
+        print(f"ERROR: --pr must be a number, got {args.pr!r}")
+        return 2
+    index = load_index(index_path) if args.no_refresh else update_index(root, index_path)[0]
+    if index is None:
+        print(f"ERROR: No evidence index at {index_path}; run `evidence_index.py build` first")
+        return 2
+    paths = query(index, args.kind, args.pr, args.match, args.latest)
+    if args.json:
+        print(json.dumps({path: index["artifacts"][path] for path in paths}, indent=2))
+    elif paths:
+        print("\n".join(paths))
+    return 0 if paths else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
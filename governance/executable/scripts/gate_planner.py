@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""Plan the governance checks a PR needs from GATE_REQUIREMENTS_INDEX.json.
+
+Reads the index once and compiles every path rule into one matcher:
+
+- file_pattern_checks globs (required and optional checks)
+- governance artifact categories (canon, schema, workflow_template,
+  registry, testing_canon) feeding governance_artifact_validations
+- the classification scopes (governance, docs)
+- path-based enforcement gate trigger_conditions ("Changes to X or Y")
+
+Each distinct rule regex is an optional lookahead with its own group, so one
+regex match per changed file reports every rule the file satisfies ("**/NAME"
+rules run as a second combined regex on the file name alone). Changed files
+come from one `git diff --name-only base...head` (or --files-from).
+
+Changes to the index or to this planner always require the IAA gate,
+whatever the trigger_conditions say, and --index-ref reads the index from
+a trusted ref (the PR base) so a PR cannot relax its own gates.
+
+The classification follows the merge gate's "Classify PR type" step. Any
+governance/, .agent or .agent-admin/ path makes it governance-change.
+Otherwise it is docs-only when every file is documentation, else
+code-change. The plan contains the classification's required evidence
+and validations, plus the validations of every governance artifact category
+touched and the checks of every file pattern matched.
+
+Enforcement gates resolve to one of three statuses:
+  required     a path, label or "Every PR" condition holds
+  skip         every condition is a path or label condition and none holds
+  conditional  some condition cannot be decided from the diff (deployments,
+               FCWT, API surface); callers must not skip these
+
+Usage:
+    python gate_planner.py --base-ref origin/main [--head-ref HEAD] [--labels a,b] [--json]
+    python gate_planner.py --base-ref origin/main --index-ref origin/main --gate iaa-assurance-check
+    git diff --name-only main... | python gate_planner.py --files-from - --gate iaa-assurance-check
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+DEFAULT_INDEX = "governance/GATE_REQUIREMENTS_INDEX.json"
+PLANNER_PATH = "governance/executable/scripts/gate_planner.py"
+
+# Editing the rules that decide whether IAA runs always requires IAA
+IAA_GATE = "iaa-assurance-check"
+IAA_SELF_TRIGGERS = (DEFAULT_INDEX, PLANNER_PATH)
+
+REQUIRED = "required"
+SKIP = "skip"
+CONDITIONAL = "conditional"
+
+# Scopes used by the merge gate's PR classification
+GOVERNANCE_SCOPE = ("governance/**", ".agent", ".agent-admin/**")
+DOCS_SCOPE = ("docs/**", "**/*.md", "**/*.txt", "**/*.rst")
+
+# Repository paths of each governance_artifact_validations category; an index
+# may override these with a "governance_artifact_patterns" object
+DEFAULT_ARTIFACT_PATTERNS = {
+    "canon": ["governance/canon/**"],
+    "schema": ["governance/schemas/**"],
+    "workflow_template": ["governance/executable/workflows/**", ".github/workflows/merge-gate-interface.yml"],
+    "registry": ["governance/CONSUMER_REPO_REGISTRY.json", "governance/AGENT_REGISTRY.json"],
+    "testing_canon": [
+        "governance/canon/CONTRACT_TESTING_CANON.md",
+        "governance/canon/CODE_COVERAGE_THRESHOLD_CANON.md",
+        "governance/canon/AUTOMATED_QUALITY_TOOLING_CANON.md",
+        "governance/canon/POST_PRODUCTION_TELEMETRY_CANON.md",
+    ],
+}
+
+PATH_CONDITION = re.compile(r"^\s*(changes to|any pr (modifying|touching|changing))\b", re.IGNORECASE)
+LABEL_CONDITION = re.compile(r"\blabell?ed\s+(.+)$", re.IGNORECASE)
+ALWAYS_CONDITION = re.compile(r"^\s*every pr\b", re.IGNORECASE)
+
+
+def glob_to_regex(pattern: str) -> str:
+    """Translate a repository glob into a regex for a repo-relative posix path.
+
+    "**/" spans zero or more directories, "**" anything, "*" and "?" stay
+    within one path segment. A trailing "/" matches everything below the
+    directory, and a pattern without "/" matches the file name at any depth.
+    """
+    return _translate(normalize_glob(pattern))
+
+
+def normalize_glob(pattern: str) -> str:
+    if pattern.endswith("/"):
+        pattern += "**"
+    if "/" not in pattern:
+        pattern = "**/" + pattern
+    return pattern
+
+
+def name_glob(pattern: str) -> str | None:
+    """The file-name part of a "**/NAME" glob, or None if it constrains directories."""
+    pattern = normalize_glob(pattern)
+    name = pattern[3:] if pattern.startswith("**/") else None
+    return name if name and "/" not in name and "**" not in name else None
+
+
+def _translate(pattern: str) -> str:
+    out = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "[":
+            end = pattern.find("]", i + 1)
+            if end < 0:
+                out.append(re.escape(char))
+            else:
+                body = pattern[i + 1:end]
+                out.append("[" + ("^" + body[1:] if body.startswith("!") else body) + "]")
+                i = end
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return "".join(out) + r"\Z"
+
+
+def condition_paths(condition: str) -> list[str]:
+    """Path globs named by a "Changes to ..." trigger condition."""
+    paths = []
+    for token in condition.split():
+        token = token.strip(",;()\"'`")
+        if "/" in token or token.startswith("*"):
+            paths.append(token)
+    return paths
+
+
+def condition_labels(condition: str) -> list[str]:
+    """Labels named by a "PR labelled a or b" trigger condition."""
+    match = LABEL_CONDITION.search(condition)
+    if not match:
+        return []
+    return [label for label in re.split(r"\s*(?:,|\bor\b|\band\b)\s*", match.group(1)) if label]
+
+
+class GatePlanner:
+    """Compiled view of GATE_REQUIREMENTS_INDEX.json."""
+
+    def __init__(self, index: dict) -> None:
+        self.index = index
+        self.rules: list[tuple[str, str]] = []  # (rule key, glob), one regex group each
+        self.gate_conditions: dict[str, list[tuple[str, str, list[str]]]] = {}
+
+        for scope, globs in (("scope:governance", GOVERNANCE_SCOPE), ("scope:docs", DOCS_SCOPE)):
+            self.rules.extend((scope, glob) for glob in globs)
+        for i, check in enumerate(index.get("file_pattern_checks", [])):
+            self.rules.extend((f"pattern:{i}", glob) for glob in check.get("patterns", []))
+        artifact_patterns = {**DEFAULT_ARTIFACT_PATTERNS, **index.get("governance_artifact_patterns", {})}
+        for category in index.get("governance_artifact_validations", {}):
+            self.rules.extend((f"artifact:{category}", glob) for glob in artifact_patterns.get(category, []))
+
+        for key, gate in index.get("enforcement_gates", {}).items():
+            gate_id = gate.get("gate_id", key)
+            conditions = []
+            for n, condition in enumerate(gate.get("trigger_conditions", [])):
+                paths = condition_paths(condition) if PATH_CONDITION.match(condition) else []
+                if paths:
+                    conditions.append(("path", condition, paths))
+                    self.rules.extend((f"gate:{gate_id}:{n}", glob) for glob in paths)
+                elif condition_labels(condition):
+                    conditions.append(("label", condition, condition_labels(condition)))
+                elif ALWAYS_CONDITION.match(condition):
+                    conditions.append(("always", condition, []))
+                else:
+                    conditions.append(("undecidable", condition, []))
+            self.gate_conditions[gate_id] = conditions
+
+        # "**/NAME" rules only look at the file name, so they get their own
+        # matcher run on the basename instead of re-scanning every directory
+        path_rules: dict[str, list[str]] = {}
+        name_rules: dict[str, list[str]] = {}
+        for key, glob in self.rules:
+            name = name_glob(glob)
+            if name is None:
+                path_rules.setdefault(_translate(normalize_glob(glob)), []).append(key)
+            else:
+                name_rules.setdefault(_translate(name), []).append(key)
+        self.path_matcher, self.path_keys = self._combine(path_rules)
+        self.name_matcher, self.name_keys = self._combine(name_rules)
+
+    @staticmethod
+    def _combine(rules: dict[str, list[str]]) -> tuple[re.Pattern, list[list[str]]]:
+        """One regex with an optional lookahead group per distinct rule regex."""
+        matcher = re.compile("".join(f"(?:(?=({regex})))?" for regex in rules))
+        return matcher, list(rules.values())
+
+    def match(self, path: str) -> set[str]:
+        """Rule keys a repo-relative path satisfies."""
+        keys: set[str] = set()
+        for matcher, group_keys, subject in (
+            (self.path_matcher, self.path_keys, path),
+            (self.name_matcher, self.name_keys, path.rpartition("/")[2]),
+        ):
+            for i, value in enumerate(matcher.match(subject).groups()):
+                if value is not None:
+                    keys.update(group_keys[i])
+        return keys
+
+    def plan(self, changed_files: list[str], labels: list[str] | None = None) -> dict:
+        labels = set(labels or [])
+        hits: dict[str, list[str]] = {}
+        governance, docs_only = False, True
+        for path in dict.fromkeys(changed_files):
+            if path in IAA_SELF_TRIGGERS:
+                hits.setdefault("iaa:self", []).append(path)
+            keys = self.match(path)
+            for key in keys:
+                hits.setdefault(key, []).append(path)
+            governance = governance or "scope:governance" in keys
+            docs_only = docs_only and "scope:docs" in keys
+
+        classification = "governance-change" if governance else "docs-only" if docs_only else "code-change"
+        spec = self.index.get("classifications", {}).get(classification, {})
+        required_validations = list(spec.get("required_validations", []))
+        artifacts = {}
+        for category, validations in self.index.get("governance_artifact_validations", {}).items():
+            if f"artifact:{category}" in hits:
+                artifacts[category] = len(hits[f"artifact:{category}"])
+                required_validations.extend(validations)
+
+        required_checks: list[str] = []
+        optional_checks: list[str] = []
+        for i, check in enumerate(self.index.get("file_pattern_checks", [])):
+            if f"pattern:{i}" in hits:
+                required_checks.extend(check.get("required_checks", []))
+                optional_checks.extend(check.get("optional_checks", []))
+
+        return {
+            "changed_files": len(dict.fromkeys(changed_files)),
+            "classification": classification,
+            "required_evidence": spec.get("required_evidence", []),
+            "optional_evidence": spec.get("optional_evidence", []),
+            "required_validations": list(dict.fromkeys(required_validations)),
+            "required_checks": list(dict.fromkeys(required_checks)),
+            "optional_checks": [c for c in dict.fromkeys(optional_checks) if c not in required_checks],
+            "governance_artifacts": artifacts,
+            "gates": {gate_id: self._gate_status(gate_id, hits, labels) for gate_id in self.gate_conditions},
+        }
+
+    def _gate_status(self, gate_id: str, hits: dict[str, list[str]], labels: set[str]) -> dict:
+        reasons = []
+        undecidable = []
+        conditions = self.gate_conditions[gate_id]
+        for n, (kind, condition, values) in enumerate(conditions):
+            if kind == "path" and f"gate:{gate_id}:{n}" in hits:
+                reasons.append(f"{condition}: {hits[f'gate:{gate_id}:{n}'][0]}")
+            elif kind == "label" and labels.intersection(values):
+                reasons.append(f"{condition}: {', '.join(sorted(labels.intersection(values)))}")
+            elif kind == "always":
+                reasons.append(condition)
+            elif kind == "undecidable":
+                undecidable.append(condition)
+        if gate_id == IAA_GATE:
+            reasons.extend(f"Changes to gate planner inputs: {path}" for path in hits.get("iaa:self", []))
+        if reasons:
+            return {"status": REQUIRED, "reasons": reasons}
+        if undecidable or not conditions:
+            return {"status": CONDITIONAL, "reasons": undecidable or ["no trigger_conditions declared"]}
+        return {"status": SKIP, "reasons": []}
+
+
+def read_index(path: str, ref: str | None, root: Path) -> dict:
+    """Load the index from the working tree, or from `ref` via git show."""
+    if ref is None:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    result = subprocess.run(
+        ["git", "show", f"{ref}:{path}"], cwd=root, capture_output=True, text=True, encoding="utf-8",
+    )
+    if result.returncode != 0:
+        raise ValueError(f"git show {ref}:{path} failed: {result.stderr.strip()}")
+    return json.loads(result.stdout)
+
+
+def git_changed_files(base_ref: str, head_ref: str, root: Path) -> list[str]:
+    result = subprocess.run(
+        ["git", "-c", "core.quotePath=false", "diff", "--name-only", "--no-renames", "-z", f"{base_ref}...{head_ref}"],
+        cwd=root, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise ValueError(f"git diff {base_ref}...{head_ref} failed: {result.stderr.strip()}")
+    return [name for name in result.stdout.split("\0") if name]
+
+
+def write_github_output(plan: dict) -> None:
+    path = os.environ.get("GITHUB_OUTPUT")
+    if not path:
+        return
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(f"classification={plan['classification']}\n")
+        for field in ("required_evidence", "required_validations", "required_checks"):
+            f.write(f"{field}={','.join(plan[field])}\n")
+        for gate_id, gate in plan["gates"].items():
+            f.write(f"gate_{gate_id.replace('-', '_')}={gate['status']}\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Plan the governance checks required by a PR's changed files.")
+    parser.add_argument("--index", default=DEFAULT_INDEX)
+    parser.add_argument("--index-ref", help="Read --index from this git ref instead of the working tree")
+    parser.add_argument("--base-ref", help="Diff base (changed files come from base-ref...head-ref)")
+    parser.add_argument("--head-ref", default="HEAD")
+    parser.add_argument("--files-from", help="Read changed paths from this file, one per line ('-' = stdin)")
+    parser.add_argument("--labels", default="", help="Comma-separated PR labels")
+    parser.add_argument("--gate", help="Only report this gate's status; exit 0 = required/conditional, 1 = skip")
+    parser.add_argument("--json", action="store_true", help="Print the plan as JSON")
+    args = parser.parse_args()
+
+    if bool(args.base_ref) == bool(args.files_from):
+        print("ERROR: Give exactly one of --base-ref or --files-from")
+        return 2
+    try:
+        index = read_index(args.index, args.index_ref, Path("."))
+        if args.files_from:
+            stream = sys.stdin if args.files_from == "-" else open(args.files_from, encoding="utf-8")
+            with stream:
+                changed = [line.strip() for line in stream if line.strip()]
+        else:
+            changed = git_changed_files(args.base_ref, args.head_ref, Path("."))
+    except (OSError, json.JSONDecodeError, ValueError) as exc:
+        print(f"ERROR: {exc}")
+        return 2
+
+    started = time.perf_counter()
+    planner = GatePlanner(index)
+    plan = planner.plan(changed, [label for label in args.labels.split(",") if label])
+    plan["planning_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    write_github_output(plan)
+
+    if args.gate:
+        gate = plan["gates"].get(args.gate)
+        if gate is None:
+            print(f"ERROR: Unknown gate {args.gate!r}; known: {', '.join(plan['gates'])}")
+            return 2
+        print(f"{args.gate}: {gate['status']}")
+        for reason in gate["reasons"]:
+            print(f"  - {reason}")
+        return 1 if gate["status"] == SKIP else 0
+
+    if args.json:
+        print(json.dumps(plan, indent=2))
+        return 0
+
+    print(f"Changed files: {plan['changed_files']}   Classification: {plan['classification']}")
+    for field in ("required_evidence", "required_validations", "required_checks", "optional_checks"):
+        print(f"{field}: {', '.join(plan[field]) or '(none)'}")
+    print("Gates:")
+    for gate_id, gate in plan["gates"].items():
+        print(f"  {gate_id}: {gate['status']}")
+        for reason in gate["reasons"]:
+            print(f"    - {reason}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""Shared SHA256 hashing with an optional persistent digest store.
+
+Digests are keyed on the git blob id of a tracked, unmodified file (read from
+the index, so the file itself is never opened) and fall back to a
+(path, size, mtime_ns, inode) stat key for untracked or locally modified
+files. Blob keys are content-addressed and survive fresh checkouts; stat keys
+are machine-local. Blob keys assume worktree bytes equal blob bytes, which the
+governance repository guarantees with `eol=lf` in .gitattributes.
+
+The store is opt-in: pass a path, or set GOVERNANCE_DIGEST_STORE.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import os
+from pathlib import Path
+import subprocess
+from typing import Iterable
+
+STORE_ENV = "GOVERNANCE_DIGEST_STORE"
+STORE_VERSION = 1
+
+# Paths per git invocation, keeps argv well under ARG_MAX
+GIT_PATHSPEC_CHUNK = 500
+
+# Read size for the fallback hashing loop (hashlib.file_digest is preferred)
+HASH_BUFFER_SIZE = 1024 * 1024
+
+
+def sha256_file(path: Path) -> str:
+    """Return the full SHA256 hex digest of a file."""
+    with open(path, "rb") as handle:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        sha256_hash = hashlib.sha256()
+        buffer = bytearray(HASH_BUFFER_SIZE)
+        view = memoryview(buffer)
+        while True:
+            size = handle.readinto(buffer)
+            if not size:
+                break
+            sha256_hash.update(view[:size])
+        return sha256_hash.hexdigest()
+
+
+def sha256_and_blob_id(path: Path) -> tuple[str, str]:
+    """Return (SHA256 hex, git blob id) of a file from a single read."""
+    size = path.stat().st_size
+    sha256_hash = hashlib.sha256()
+    blob_hash = hashlib.sha1(f"blob {size}\0".encode())
+    buffer = bytearray(HASH_BUFFER_SIZE)
+    view = memoryview(buffer)
+    read_total = 0
+    with open(path, "rb") as handle:
+        while True:
+            chunk_size = handle.readinto(buffer)
+            if not chunk_size:
+                break
+            sha256_hash.update(view[:chunk_size])
+            blob_hash.update(view[:chunk_size])
+            read_total += chunk_size
+    if read_total != size:
+        raise OSError(f"{path} changed size while hashing")
+    return sha256_hash.hexdigest(), blob_hash.hexdigest()
+
+
+def _git(args: list[str], cwd: Path) -> bytes | None:
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, timeout=60,
+            env={**os.environ, "GIT_LITERAL_PATHSPECS": "1"},
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def git_toplevel(directory: Path) -> Path | None:
+    out = _git(["rev-parse", "--show-toplevel"], directory)
+    return Path(out.decode().strip()) if out else None
+
+
+def clean_blob_ids(paths: Iterable[Path]) -> dict[Path, str]:
+    """Map resolved paths to index blob ids for tracked files with no worktree changes.
+
+    Uses two git calls per repository (ls-files --stage and diff-files); git's
+    own stat cache decides cleanliness, so unchanged files are not read.
+    """
+    by_root: dict[Path, list[Path]] = {}
+    toplevels: dict[Path, Path | None] = {}
+    for path in paths:
+        parent = path.parent
+        if parent not in toplevels:
+            toplevels[parent] = git_toplevel(parent) if parent.is_dir() else None
+        root = toplevels[parent]
+        if root is not None and path.is_relative_to(root):
+            by_root.setdefault(root, []).append(path)
+
+    blobs: dict[Path, str] = {}
+    for root, members in by_root.items():
+        for start in range(0, len(members), GIT_PATHSPEC_CHUNK):
+            chunk = [str(p.relative_to(root)) for p in members[start:start + GIT_PATHSPEC_CHUNK]]
+            staged = _git(["ls-files", "--stage", "-z", "--", *chunk], root)
+            dirty = _git(["diff-files", "--name-only", "-z", "--", *chunk], root)
+            if staged is None or dirty is None:
+                continue
+            dirty_paths = {name for name in dirty.split(b"\0") if name}
+            for record in staged.split(b"\0"):
+                if not record:
+                    continue
+                info, name = record.split(b"\t", 1)
+                _mode, blob, stage = info.split(b" ")
+                if stage != b"0" or name in dirty_paths:
+                    continue
+                blobs[root / os.fsdecode(name)] = blob.decode()
+    return blobs
+
+
+def ls_tree_blobs(repo: Path, ref: str, prefix: str = "") -> dict[str, str] | None:
+    """Map repo-relative paths under prefix to blob ids at ref (None if git fails).
+
+    Reads the object database only; no working-tree file is opened.
+    """
+    args = ["ls-tree", "-r", "-z", "--full-tree", ref]
+    if prefix:
+        args += ["--", prefix]
+    out = _git(args, repo)
+    if out is None:
+        return None
+    blobs: dict[str, str] = {}
+    for record in out.split(b"\0"):
+        if not record:
+            continue
+        info, name = record.split(b"\t", 1)
+        _mode, kind, blob = info.split(b" ")
+        if kind == b"blob":
+            blobs[os.fsdecode(name)] = blob.decode()
+    return blobs
+
+
+class DigestStore:
+    """Persistent blob-id / stat-keyed SHA256 digest store."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.blobs: dict[str, str] = {}
+        self.stats: dict[str, list] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+    @classmethod
+    def from_env(cls, path: str | Path | None = None) -> "DigestStore | None":
+        """Open the store at path, else at $GOVERNANCE_DIGEST_STORE; None if neither is set."""
+        location = path or os.environ.get(STORE_ENV)
+        if not location:
+            return None
+        store = cls(Path(location))
+        store.load()
+        return store
+
+    def load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get("store_version") != STORE_VERSION:
+            return
+        self.blobs = data.get("blobs", {})
+        self.stats = data.get("stats", {})
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps({
+            "store_version": STORE_VERSION,
+            "blobs": self.blobs,
+            "stats": self.stats,
+        }, sort_keys=True))
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def sha256_many(self, paths: Iterable[Path], jobs: int | None = None) -> dict[Path, str]:
+        """Return {path: sha256} for every path, hashing only what the store cannot answer.
+
+        Keys of the result are the paths as given. Missing files raise OSError.
+        """
+        requested = list(paths)
+        resolved = {path: path.resolve() for path in requested}
+        blobs = clean_blob_ids(set(resolved.values()))
+
+        digests: dict[Path, str] = {}
+        pending: list[tuple[Path, Path, os.stat_result, str | None]] = []
+        for path in requested:
+            real = resolved[path]
+            stat = real.stat()
+            blob = blobs.get(real)
+            stat_key = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+            cached = self.blobs.get(blob) if blob else None
+            if cached is None:
+                record = self.stats.get(str(real))
+                if record is not None and record[:3] == stat_key:
+                    cached = record[3]
+            if cached is not None:
+                self.hits += 1
+                digests[path] = cached
+            else:
+                self.misses += 1
+                pending.append((path, real, stat, blob))
+
+        computed = sha256_files([real for _path, real, _stat, _blob in pending], jobs=jobs)
+        for path, real, stat, blob in pending:
+            digest = computed[real]
+            digests[path] = digest
+            if blob:
+                self.blobs[blob] = digest
+            self.stats[str(real)] = [stat.st_size, stat.st_mtime_ns, stat.st_ino, digest]
+            self._dirty = True
+        return digests
+
+    def sha256(self, path: Path) -> str:
+        return self.sha256_many([path])[path]
+
+
+def sha256_files(paths: Iterable[Path], jobs: int | None = None) -> dict[Path, str]:
+    """Hash many files on a thread pool (0/None jobs = one per CPU)."""
+    paths = list(dict.fromkeys(paths))
+    workers = min(jobs if jobs and jobs > 0 else (os.cpu_count() or 1), max(len(paths), 1))
+    if workers == 1:
+        return {path: sha256_file(path) for path in paths}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(paths, executor.map(sha256_file, paths)))
+
+
+def sha256_paths(paths: Iterable[Path], store: DigestStore | None = None, jobs: int | None = None) -> dict[Path, str]:
+    """Batch API: hash paths through the store when one is given, directly otherwise."""
+    if store is None:
+        return sha256_files(paths, jobs=jobs)
+    digests = store.sha256_many(paths, jobs=jobs)
+    store.save()
+    return digests
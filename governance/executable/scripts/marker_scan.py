@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""Multi-pattern marker scanner (STOP-AND-FIX and other gate markers).
+
+Scans a file set for a set of named regular expressions and reports every
+matching line, grep-style: each pattern matches within a single line and a
+line is reported once per pattern. Each file is read at most once. Files of
+1 MiB or more are memory-mapped. A combined regex finds candidate lines, and
+only those lines are decoded and checked against the individual patterns.
+
+File selection:
+- In a git work tree the tracked and untracked-but-not-ignored files under
+  the given paths are scanned, so .gitignore applies and .git is never
+  entered. Outside git the paths are walked directly.
+- --exclude GLOB (matched against the repo-relative path and the file name)
+  and --exclude-dir NAME (any path component) drop more files.
+- --base-ref limits the scan to files changed between base...head.
+- Binary files (a NUL byte in the first 8 KiB) are skipped.
+
+Patterns use Python re syntax. POSIX bracket classes such as [:space:] are
+accepted so grep -E patterns can be reused. --unless ID=REGEX drops a
+pattern's matching lines that also match REGEX, for example "do not" wording.
+
+Results are cached per file under a key made of the pattern set and either
+the git blob id (tracked, unmodified files) or (size, mtime_ns, inode), so
+unchanged files are not read again. Each pattern set and repository has its
+own cache file, so gates with different patterns do not evict each other.
+The cache lives in the user cache directory ($XDG_CACHE_HOME or ~/.cache),
+never in the checkout: blob ids are public, so a committed cache file could
+claim a file has no matches. A --cache-dir inside --root is ignored for the
+same reason. Gates run with --no-cache.
+
+Exit codes:
+  0 = no matches
+  1 = at least one match
+  2 = error (bad pattern, unknown ref)
+
+Usage:
+    python marker_scan.py --pattern STOP-AND-FIX=STOP-AND-FIX [--exclude '*.md'] [--exclude-dir governance] [PATH ...]
+        [--unless ID=REGEX] [--base-ref REF [--head-ref REF]] [--format text|json|github] [--no-cache]
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import mmap
+import os
+import re
+import subprocess
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "governance-marker-scan"
+CACHE_VERSION = 1
+MMAP_THRESHOLD = 1024 * 1024
+BINARY_SNIFF_BYTES = 8192
+MAX_LINE_CHARS = 500
+
+POSIX_CLASSES = {
+    "[:space:]": r"\s",
+    "[:digit:]": r"\d",
+    "[:alpha:]": "a-zA-Z",
+    "[:alnum:]": "a-zA-Z0-9",
+    "[:upper:]": "A-Z",
+    "[:lower:]": "a-z",
+    "[:xdigit:]": "0-9A-Fa-f",
+    "[:blank:]": r" \t",
+}
+
+
+def translate_posix(regex: str) -> str:
+    """Rewrite POSIX bracket classes (grep -E) into Python re equivalents."""
+    for posix, python in POSIX_CLASSES.items():
+        regex = regex.replace(posix, python)
+    return regex
+
+
+class PatternSet:
+    """Named patterns with optional per-pattern exclusion, compiled for bytes."""
+
+    def __init__(self, patterns: list[tuple[str, str]], unless: dict[str, str] | None = None) -> None:
+        unless = unless or {}
+        unknown = set(unless) - {pattern_id for pattern_id, _ in patterns}
+        if unknown:
+            raise ValueError(f"--unless names unknown pattern(s): {', '.join(sorted(unknown))}")
+        self.ids = [pattern_id for pattern_id, _ in patterns]
+        self.compiled = [
+            (pattern_id, re.compile(translate_posix(regex).encode(), re.MULTILINE),
+             re.compile(translate_posix(unless[pattern_id]).encode()) if pattern_id in unless else None)
+            for pattern_id, regex in patterns
+        ]
+        self.combined = re.compile(
+            b"|".join(b"(?:" + pattern.pattern + b")" for _, pattern, _ in self.compiled), re.MULTILINE
+        )
+        spec = json.dumps([[pattern_id, regex, unless.get(pattern_id)] for pattern_id, regex in patterns])
+        self.digest = hashlib.sha256(spec.encode()).hexdigest()
+
+    def scan_buffer(self, buffer) -> list[list]:
+        """[pattern id, line number, line text] for every matching line in a bytes-like buffer."""
+        matches = []
+        pos, line_number, counted_to = 0, 1, 0
+        while True:
+            hit = self.combined.search(buffer, pos)
+            if hit is None:
+                break
+            start = buffer.rfind(b"\n", 0, hit.start()) + 1
+            end = buffer.find(b"\n", hit.start())
+            end = len(buffer) if end < 0 else end
+            line_number += bytes(buffer[counted_to:start]).count(b"\n")
+            counted_to = start
+            line = bytes(buffer[start:end]).rstrip(b"\r")
+            for pattern_id, pattern, unless in self.compiled:
+                if pattern.search(line) and not (unless and unless.search(line)):
+                    text = line.decode("utf-8", errors="replace").strip()
+                    matches.append([pattern_id, line_number, text[:MAX_LINE_CHARS]])
+            pos = end + 1
+            if pos > len(buffer):
+                break
+        return matches
+
+
+def scan_file(path: Path, patterns: PatternSet) -> list[list] | None:
+    """Matches in one file, or None if it is binary or unreadable."""
+    try:
+        with open(path, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size == 0:
+                return []
+            if size >= MMAP_THRESHOLD:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    if b"\0" in buffer[:BINARY_SNIFF_BYTES]:
+                        return None
+                    return patterns.scan_buffer(buffer)
+            data = handle.read()
+    except (OSError, ValueError):
+        return None
+    if b"\0" in data[:BINARY_SNIFF_BYTES]:
+        return None
+    return patterns.scan_buffer(data)
+
+
+def _git(args: list[str], root: Path) -> str | None:
+    try:
+        result = subprocess.run(["git", *args], cwd=root, capture_output=True, text=True, timeout=120)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _split(output: str | None) -> list[str]:
+    return [name for name in (output or "").split("\0") if name]
+
+
+def list_files(root: Path, paths: list[str], base_ref: str | None = None,
+               head_ref: str = "HEAD") -> dict[str, str | None]:
+    """Candidate files as {path relative to root: clean blob id or None}.
+
+    Raises ValueError when --base-ref is given but git cannot diff it.
+    """
+    staged = _git(["ls-files", "--stage", "-z", "--", *paths], root)
+    if staged is None:
+        if base_ref:
+            raise ValueError("--base-ref needs a git work tree")
+        files = {}
+        for top in paths:
+            top_path = root / top
+            if top_path.is_file():
+                files[Path(top).as_posix()] = None
+            for directory, subdirs, names in os.walk(top_path):
+                subdirs[:] = [d for d in subdirs if d != ".git"]
+                for name in names:
+                    files[(Path(directory) / name).relative_to(root).as_posix()] = None
+        return files
+
+    dirty = set(_split(_git(["diff-files", "--name-only", "-z", "--", *paths], root)))
+    files: dict[str, str | None] = {}
+    for record in _split(staged):
+        info, name = record.split("\t", 1)
+        _mode, blob, stage = info.split(" ")
+        files[name] = blob if stage == "0" and name not in dirty else None
+    for name in _split(_git(["ls-files", "--others", "--exclude-standard", "-z", "--", *paths], root)):
+        files[name] = None
+
+    if base_ref:
+        changed = _git(["diff", "--name-only", "--relative", "--no-renames", "--diff-filter=d", "-z",
+                        f"{base_ref}...{head_ref}", "--", *paths], root)
+        if changed is None:
+            raise ValueError(f"Cannot diff {base_ref}...{head_ref}")
+        keep = set(_split(changed))
+        files = {name: blob for name, blob in files.items() if name in keep}
+    return files
+
+
+def excluded(rel_path: str, exclude_globs: list[str], exclude_dirs: set[str]) -> bool:
+    parts = rel_path.split("/")
+    if exclude_dirs.intersection(parts[:-1]):
+        return True
+    return any(fnmatch.fnmatch(rel_path, glob) or fnmatch.fnmatch(parts[-1], glob) for glob in exclude_globs)
+
+
+def _stat_key(path: Path) -> str | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return f"stat:{st.st_size}:{st.st_mtime_ns}:{st.st_ino}"
+
+
+def load_cache(path: Path | None, digest: str) -> dict[str, dict]:
+    if path is None:
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("cache_version") != CACHE_VERSION or data.get("patterns") != digest:
+        return {}
+    return data.get("files", {})
+
+
+def save_cache(path: Path | None, digest: str, files: dict[str, dict]) -> None:
+    if path is None:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"cache_version": CACHE_VERSION, "patterns": digest, "files": files},
+                              separators=(",", ":")), encoding="utf-8")
+    tmp.replace(path)
+
+
+def scan(
+    root: Path,
+    patterns: PatternSet,
+    paths: list[str] | None = None,
+    exclude_globs: list[str] | None = None,
+    exclude_dirs: list[str] | None = None,
+    base_ref: str | None = None,
+    head_ref: str = "HEAD",
+    cache_dir: Path | None = None,
+) -> dict:
+    """Scan the selected files; returns {"scanned", "cached", "skipped_binary", "matches"}."""
+    candidates = list_files(root, paths or ["."], base_ref, head_ref)
+    exclude_globs = exclude_globs or []
+    exclude_dirs = set(exclude_dirs or [])
+    if cache_dir is not None and cache_dir.resolve().is_relative_to(root.resolve()):
+        cache_dir = None  # a cache inside the checkout could have been committed
+    cache_path = None
+    if cache_dir is not None:
+        cache_key = hashlib.sha256(f"{patterns.digest}\0{root.resolve()}".encode()).hexdigest()
+        cache_path = cache_dir / f"{cache_key[:16]}.json"
+    cached = load_cache(cache_path, patterns.digest)
+    fresh: dict[str, dict] = {}
+    matches = []
+    scanned = reused = binary = 0
+
+    for rel_path in sorted(candidates):
+        if excluded(rel_path, exclude_globs, exclude_dirs):
+            continue
+        path = root / rel_path
+        blob = candidates[rel_path]
+        key = f"blob:{blob}" if blob else _stat_key(path)
+        if key is None:
+            continue
+        entry = cached.get(rel_path)
+        if entry is not None and entry.get("key") == key:
+            reused += 1
+        else:
+            found = scan_file(path, patterns)
+            entry = {"key": key, "binary": found is None, "matches": found or []}
+        fresh[rel_path] = entry
+        if entry["binary"]:
+            binary += 1
+            continue
+        scanned += 1
+        matches.extend({"pattern": m[0], "path": rel_path, "line": m[1], "text": m[2]} for m in entry["matches"])
+
+    if base_ref is None:
+        save_cache(cache_path, patterns.digest, fresh)
+    else:
+        save_cache(cache_path, patterns.digest, {**cached, **fresh})
+    return {"scanned": scanned, "cached": reused, "skipped_binary": binary, "matches": matches}
+
+
+def parse_assignment(value: str, flag: str) -> tuple[str, str]:
+    pattern_id, sep, regex = value.partition("=")
+    if not sep or not pattern_id or not regex:
+        raise argparse.ArgumentTypeError(f"{flag} expects ID=REGEX, got {value!r}")
+    return pattern_id, regex
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Scan files for a set of marker patterns in one pass.")
+    parser.add_argument("paths", nargs="*", default=["."], help="Files or directories to scan (default: .)")
+    parser.add_argument("--pattern", action="append", required=True, metavar="ID=REGEX",
+                        type=lambda v: parse_assignment(v, "--pattern"), help="Named pattern (repeatable)")
+    parser.add_argument("--unless", action="append", default=[], metavar="ID=REGEX",
+                        type=lambda v: parse_assignment(v, "--unless"),
+                        help="Drop lines of pattern ID that also match REGEX (repeatable)")
+    parser.add_argument("--exclude", action="append", default=[], metavar="GLOB",
+                        help="Skip files whose path or name matches GLOB (repeatable)")
+    parser.add_argument("--exclude-dir", action="append", default=[], metavar="NAME",
+                        help="Skip files below any directory named NAME (repeatable)")
+    parser.add_argument("--base-ref", help="Only scan files changed in base-ref...head-ref")
+    parser.add_argument("--head-ref", default="HEAD")
+    parser.add_argument("--root", default=".", help="Repository root (default: cwd)")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR),
+                        help="Result cache directory outside the checkout (default: user cache dir)")
+    parser.add_argument("--no-cache", action="store_true", help="Neither read nor write the result cache")
+    parser.add_argument("--format", choices=["text", "json", "github"], default="text")
+    args = parser.parse_args()
+
+    root = Path(args.root)
+    try:
+        patterns = PatternSet(args.pattern, dict(args.unless))
+        result = scan(
+            root, patterns, args.paths, args.exclude, args.exclude_dir, args.base_ref, args.head_ref,
+            None if args.no_cache else Path(args.cache_dir),
+        )
+    except (re.error, ValueError) as exc:
+        print(f"ERROR: {exc}")
+        return 2
+
+    if args.format == "json":
+        print(json.dumps(result, indent=2))
+    else:
+        for match in result["matches"]:
+            if args.format == "github":
+                print(f"::error file={match['path']},line={match['line']}::{match['pattern']}: {match['text']}")
+            else:
+                print(f"{match['path']}:{match['line']}: [{match['pattern']}] {match['text']}")
+    return 1 if result["matches"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
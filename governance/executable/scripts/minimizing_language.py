@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Shared minimizing-language scanner.
+
+Compiles every pattern in governance/policy/minimizing_language_patterns.json
+once and joins them into a single alternation of named lookaheads, so a text
+is walked in one pass. A hit is suppressed when one of its entry's
+`allowlist` patterns matches at the same offset (allowlisted phrases such as
+"Only CS2 can authorize" start with the same keyword as the hit they excuse).
+
+Used by validate_gate_results.py, validate_prehandover_proof.py and
+validate_rca.py; can also be run directly against files or stdin.
+"""
+
+import argparse
+from functools import lru_cache
+import json
+import os
+from pathlib import Path
+import re
+import sys
+from typing import NamedTuple
+
+PATTERNS_ENV = "MINIMIZING_LANGUAGE_PATTERNS_PATH"
+
+_LEADING_LITERAL = re.compile(r"\\b([A-Za-z0-9])")
+
+
+class MinimizingMatch(NamedTuple):
+    id: str
+    start: int
+    end: int
+    text: str
+
+
+class MinimizingLanguageScanner:
+    """One-pass scanner over a list of (id, pattern, allowlist) entries."""
+
+    def __init__(self, entries: list[tuple[str, str, list[str]]]) -> None:
+        self.ids: list[str] = []
+        self.patterns: list[re.Pattern] = []
+        self.allowlists: list[list[re.Pattern]] = []
+        for pattern_id, pattern, allowlist in entries:
+            try:
+                self.patterns.append(re.compile(pattern, re.IGNORECASE))
+                self.allowlists.append([re.compile(allowed, re.IGNORECASE) for allowed in allowlist])
+            except re.error as exc:
+                raise ValueError(f"Invalid minimizing language pattern {pattern_id!r}: {exc}") from exc
+            self.ids.append(pattern_id)
+
+        # Zero-width alternatives: each reports where a pattern starts without
+        # consuming text, so overlapping hits of different patterns are all seen.
+        alternatives = "|".join(
+            f"(?=(?P<p{index}>{pattern.pattern}))" for index, pattern in enumerate(self.patterns)
+        )
+        try:
+            self._combined: re.Pattern | None = re.compile(
+                self._leading_guard() + f"(?:{alternatives})", re.IGNORECASE
+            )
+        except re.error:
+            # Patterns using numbered backreferences cannot be combined
+            self._combined = None
+
+    def _leading_guard(self) -> str:
+        """Cheap prefix that lets the regex engine reject most offsets early.
+
+        An alternation gives CPython's engine no literal prefix to search for, so
+        every offset would be tried against every alternative. When every pattern
+        starts with a word boundary and a literal character, checking those first
+        keeps one pass over the text cheaper than one search per pattern.
+        """
+        first_chars = set()
+        for pattern in self.patterns:
+            leading = _LEADING_LITERAL.match(pattern.pattern)
+            if leading is None:
+                return ""
+            first_chars.add(leading.group(1).lower())
+        return r"\b(?=[" + "".join(sorted(first_chars)) + "])"
+
+    def _allowed(self, index: int, text: str, start: int) -> bool:
+        return any(allowed.match(text, start) for allowed in self.allowlists[index])
+
+    def scan(self, text: str) -> list[MinimizingMatch]:
+        """Return every non-allowlisted hit, ordered by offset."""
+        hits: list[MinimizingMatch] = []
+
+        def record(index: int, match: re.Match) -> None:
+            if not self._allowed(index, text, match.start()):
+                hits.append(MinimizingMatch(self.ids[index], match.start(), match.end(), match.group()))
+
+        if self._combined is None:
+            for index, pattern in enumerate(self.patterns):
+                for match in pattern.finditer(text):
+                    record(index, match)
+            hits.sort(key=lambda hit: (hit.start, hit.id))
+            return hits
+
+        for found in self._combined.finditer(text):
+            start = found.start()
+            first = int(found.lastgroup[1:])
+            # Alternation stops at the first alternative that matches here;
+            # later patterns may match at the same offset too.
+            record(first, self.patterns[first].match(text, start))
+            for index in range(first + 1, len(self.patterns)):
+                match = self.patterns[index].match(text, start)
+                if match is not None:
+                    record(index, match)
+        return hits
+
+    def detect(self, text: str) -> list[str]:
+        """Return the ids of patterns with at least one non-allowlisted hit."""
+        return list(dict.fromkeys(hit.id for hit in self.scan(text)))
+
+
+def resolve_minimizing_language_path() -> Path:
+    env_path = os.environ.get(PATTERNS_ENV)
+    if env_path:
+        return Path(env_path)
+
+    for parent in Path(__file__).resolve().parents:
+        candidate = parent / "policy" / "minimizing_language_patterns.json"
+        if candidate.exists():
+            return candidate
+
+    raise ValueError(
+        "Missing minimizing language patterns file. "
+        f"Set {PATTERNS_ENV} to override."
+    )
+
+
+def load_minimizing_language_entries(patterns_path: Path) -> list[tuple[str, str, list[str]]]:
+    try:
+        data = json.loads(patterns_path.read_text())
+    except FileNotFoundError as exc:
+        raise ValueError(f"Missing minimizing language patterns file: {patterns_path}") from exc
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Invalid minimizing language patterns JSON: {exc}") from exc
+
+    patterns = data.get("patterns")
+    if not isinstance(patterns, list) or not patterns:
+        raise ValueError("Minimizing language patterns list missing or empty.")
+
+    resolved = []
+    for entry in patterns:
+        if isinstance(entry, str):
+            resolved.append((entry, entry, []))
+            continue
+        if isinstance(entry, dict) and isinstance(entry.get("pattern"), str):
+            allowlist = entry.get("allowlist", [])
+            if not isinstance(allowlist, list) or not all(isinstance(item, str) for item in allowlist):
+                raise ValueError(f"Invalid allowlist for minimizing language pattern {entry.get('id')!r}.")
+            resolved.append((str(entry.get("id") or entry["pattern"]), entry["pattern"], allowlist))
+            continue
+        raise ValueError("Invalid minimizing language pattern entry; expected string or object with 'pattern'.")
+    return resolved
+
+
+@lru_cache(maxsize=1)
+def load_scanner() -> MinimizingLanguageScanner:
+    """Build the scanner for the resolved policy file (compiled once per process)."""
+    return MinimizingLanguageScanner(load_minimizing_language_entries(resolve_minimizing_language_path()))
+
+
+def scan_minimizing_language(text: str) -> list[MinimizingMatch]:
+    return load_scanner().scan(text)
+
+
+def detect_minimizing_language(text: str) -> list[str]:
+    return load_scanner().detect(text)
+
+
+def format_matches(matches: list[MinimizingMatch], limit: int = 10) -> list[str]:
+    lines = [f"  - {match.id} at offset {match.start}: {match.text[:80]!r}" for match in matches[:limit]]
+    if len(matches) > limit:
+        lines.append(f"  ... and {len(matches) - limit} more")
+    return lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Scan text for minimizing language.")
+    parser.add_argument("paths", nargs="*", help="Files to scan (default: stdin)")
+    parser.add_argument("--json", action="store_true", help="Print matches as JSON")
+    args = parser.parse_args()
+
+    try:
+        scanner = load_scanner()
+        sources = [(path, Path(path).read_text(encoding="utf-8")) for path in args.paths] or [("-", sys.stdin.read())]
+    except (OSError, UnicodeDecodeError, ValueError) as exc:
+        print(f"ERROR: {exc}")
+        return 2
+
+    report = {source: [match._asdict() for match in scanner.scan(text)] for source, text in sources}
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for source, matches in report.items():
+            for match in matches:
+                print(f"{source}:{match['start']}: {match['id']}: {match['text'][:80]!r}")
+    return 1 if any(report.values()) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Coalesce bursts of governance commits into a single ripple.
+
+A burst of merges should reach consumers as one layer-down event, not one per
+commit. Changes are merged into a sorted, deduplicated changed_paths list
+plus the commit range they came from.
+
+Two ways to form a batch:
+
+- Range: every commit in base..head (git_changes), for example everything
+  since the last successful dispatch.
+- Window: each commit is recorded in the ripple queue's change spool, then
+  the dispatcher waits out the window. Only the run holding the newest commit
+  drains the spool and dispatches. Runs superseded by a later commit exit
+  without dispatching.
+
+plan_batches() applies the same window rule to a recorded history. The
+simulation harness (scripts/simulate_ripple_coalescing.py) uses it to count
+the dispatches saved.
+"""
+
+import subprocess
+from pathlib import Path
+from typing import NamedTuple
+
+
+class Change(NamedTuple):
+    commit: str
+    timestamp: float
+    paths: tuple[str, ...]
+
+
+def git_changes(
+    base: str | None, head: str, repo_root: Path = Path("."), prefixes: tuple[str, ...] = ()
+) -> list[Change]:
+    """Commits in base..head (all of head's history without base), oldest first, with their paths.
+
+    With `prefixes`, only matching paths are kept, and commits left with no
+    paths are dropped.
+    """
+    result = subprocess.run(
+        ["git", "log", "--reverse", "--no-renames", "--format=%x00%H %ct", "--name-only",
+         f"{base}..{head}" if base else head, "--"],
+        cwd=repo_root, capture_output=True, text=True, check=True,
+    )
+    changes = []
+    for record in result.stdout.split("\0")[1:]:
+        header, _, body = record.partition("\n")
+        commit, timestamp = header.split()
+        paths = tuple(p for p in body.splitlines() if p and (not prefixes or p.startswith(prefixes)))
+        if paths or not prefixes:
+            changes.append(Change(commit, float(timestamp), paths))
+    return changes
+
+
+def coalesce(changes: list[Change], base: str | None = None) -> dict:
+    """Merge changes into the changed_paths and commit_range payload fields."""
+    return {
+        "changed_paths": sorted({path for change in changes for path in change.paths}),
+        "commit_range": {
+            "base": base,
+            "head": changes[-1].commit if changes else None,
+            "commits": [change.commit for change in changes],
+        },
+    }
+
+
+def plan_batches(changes: list[Change], window: float, max_wait: float | None = None) -> list[list[Change]]:
+    """Group a time-ordered history into dispatch batches.
+
+    A batch closes when the next change arrives more than `window` seconds
+    after the previous one. With `max_wait`, a batch also closes once its
+    oldest change has waited that long, so a steady stream of commits cannot
+    hold a ripple back indefinitely.
+    """
+    batches: list[list[Change]] = []
+    for change in changes:
+        if batches:
+            batch = batches[-1]
+            quiet = change.timestamp - batch[-1].timestamp <= window
+            fresh = max_wait is None or change.timestamp - batch[0].timestamp <= max_wait
+            if quiet and fresh:
+                batch.append(change)
+                continue
+        batches.append([change])
+    return batches
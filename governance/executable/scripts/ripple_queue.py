@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Durable ripple delivery queue backed by SQLite.
+
+Every (event type, canonical commit, consumer) triple is one row keyed by an
+idempotency key derived from those three values. The first enqueue for a
+commit fixes its dispatch_id and payload, so a rerun after a crash re-sends
+the identical payload to the consumers that are still outstanding and never
+re-sends to consumers already marked DELIVERED.
+
+Rows are claimed under a lease by a single UPDATE ... RETURNING statement,
+which SQLite runs under its write lock, so any number of dispatcher processes
+and threads can drain the same queue: each row is handed to one worker at a
+time. A worker that dies leaves its lease to
+expire, after which another worker picks the row up.
+
+The same database holds the change spool used by coalescing windows
+(ripple_coalesce.py): each dispatcher run records its commit, and after the
+window the run holding the newest commit drains the spool in one transaction.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import socket
+import sqlite3
+import threading
+import time
+
+from ripple_coalesce import Change
+
+DEFAULT_QUEUE_PATH = Path(".agent-admin/governance/ripple-queue.sqlite3")
+
+PENDING = "PENDING"
+IN_FLIGHT = "IN_FLIGHT"
+DELIVERED = "DELIVERED"
+FAILED = "FAILED"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS deliveries (
+    idempotency_key  TEXT PRIMARY KEY,
+    event_type       TEXT NOT NULL,
+    canonical_commit TEXT NOT NULL,
+    owner            TEXT NOT NULL,
+    repo             TEXT NOT NULL,
+    dispatch_id      TEXT NOT NULL,
+    payload          TEXT NOT NULL,
+    status           TEXT NOT NULL,
+    attempts         INTEGER NOT NULL DEFAULT 0,
+    last_error       TEXT,
+    lease_owner      TEXT,
+    lease_expires    REAL,
+    created_at       REAL NOT NULL,
+    updated_at       REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS deliveries_by_event
+    ON deliveries (event_type, canonical_commit, status);
+CREATE TABLE IF NOT EXISTS pending_changes (
+    event_type       TEXT NOT NULL,
+    canonical_commit TEXT NOT NULL,
+    paths            TEXT NOT NULL,
+    recorded_at      REAL NOT NULL,
+    PRIMARY KEY (event_type, canonical_commit)
+);
+"""
+
+
+def idempotency_key(event_type: str, canonical_commit: str, owner: str, repo: str) -> str:
+    return hashlib.sha256(f"{event_type}\0{canonical_commit}\0{owner}/{repo}".encode()).hexdigest()
+
+
+def worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+class RippleQueue:
+    """SQLite delivery queue; safe to share across threads and processes."""
+
+    def __init__(self, path: Path, lease_seconds: float = 300) -> None:
+        self.path = path
+        self.lease_seconds = lease_seconds
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per operation: sqlite3 connections must not
+        # cross threads, and opening one is cheap next to an HTTP round trip
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def enqueue(self, event_type: str, canonical_commit: str, consumers: list[tuple[str, str]], payload: dict) -> dict:
+        """Record one row per consumer; return the payload in effect for this commit.
+
+        If the commit was enqueued before, its stored payload (and dispatch_id)
+        wins over the one passed in, and rows that previously FAILED are made
+        PENDING again so this run retries them.
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT payload FROM deliveries WHERE event_type = ? AND canonical_commit = ? LIMIT 1",
+                (event_type, canonical_commit),
+            ).fetchone()
+            if row is not None:
+                payload = json.loads(row["payload"])
+            payload_text = json.dumps(payload, sort_keys=True)
+            conn.executemany(
+                "INSERT OR IGNORE INTO deliveries (idempotency_key, event_type, canonical_commit, owner, repo,"
+                " dispatch_id, payload, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (idempotency_key(event_type, canonical_commit, owner, repo), event_type, canonical_commit,
+                     owner, repo, payload["dispatch_id"], payload_text, PENDING, now, now)
+                    for owner, repo in consumers
+                ],
+            )
+            conn.execute(
+                "UPDATE deliveries SET status = ?, updated_at = ? WHERE event_type = ? AND canonical_commit = ? AND status = ?",
+                (PENDING, now, event_type, canonical_commit, FAILED),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return payload
+
+    def claim(self, event_type: str, canonical_commit: str, owner_id: str | None = None) -> sqlite3.Row | None:
+        """Lease the next outstanding row of this commit to the caller, or None if none is left."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "UPDATE deliveries SET status = ?, lease_owner = ?, lease_expires = ?, updated_at = ?"
+                " WHERE idempotency_key = ("
+                "   SELECT idempotency_key FROM deliveries"
+                "   WHERE event_type = ? AND canonical_commit = ?"
+                "     AND (status = ? OR (status = ? AND lease_expires < ?))"
+                "   ORDER BY created_at, owner, repo LIMIT 1"
+                " ) RETURNING *",
+                (IN_FLIGHT, owner_id or worker_id(), now + self.lease_seconds, now,
+                 event_type, canonical_commit, PENDING, IN_FLIGHT, now),
+            ).fetchone()
+        finally:
+            conn.close()
+
+    def complete(self, key: str, delivered: bool, attempts: int, error: str | None) -> None:
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE deliveries SET status = ?, attempts = attempts + ?, last_error = ?,"
+                " lease_owner = NULL, lease_expires = NULL, updated_at = ? WHERE idempotency_key = ?",
+                (DELIVERED if delivered else FAILED, attempts, error, time.time(), key),
+            )
+        finally:
+            conn.close()
+
+    def status_counts(self, event_type: str, canonical_commit: str) -> dict[str, int]:
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) AS n FROM deliveries WHERE event_type = ? AND canonical_commit = ? GROUP BY status",
+                (event_type, canonical_commit),
+            ).fetchall()
+        finally:
+            conn.close()
+        return {row["status"]: row["n"] for row in rows}
+
+    def record_change(self, event_type: str, canonical_commit: str, paths: list[str]) -> None:
+        """Add a commit to the change spool (re-recording makes it the newest again)."""
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT INTO pending_changes (event_type, canonical_commit, paths, recorded_at) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (event_type, canonical_commit)"
+                " DO UPDATE SET paths = excluded.paths, recorded_at = excluded.recorded_at",
+                (event_type, canonical_commit, json.dumps(sorted(set(paths))), time.time()),
+            )
+        finally:
+            conn.close()
+
+    def drain_changes(self, event_type: str, canonical_commit: str, max_wait: float | None = None) -> list[Change] | None:
+        """Take every spooled change if this run owns the batch, else None.
+
+        The run recording the newest commit owns the batch. With `max_wait`,
+        any run may take it once the oldest spooled change has waited that
+        long. Rows are read and deleted in one transaction, so exactly one
+        run dispatches each change.
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT canonical_commit, paths, recorded_at FROM pending_changes"
+                " WHERE event_type = ? ORDER BY recorded_at, canonical_commit",
+                (event_type,),
+            ).fetchall()
+            owns = bool(rows) and rows[-1]["canonical_commit"] == canonical_commit
+            overdue = bool(rows) and max_wait is not None and time.time() - rows[0]["recorded_at"] >= max_wait
+            if not (owns or overdue):
+                conn.execute("ROLLBACK")
+                return None
+            conn.execute("DELETE FROM pending_changes WHERE event_type = ?", (event_type,))
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return [Change(row["canonical_commit"], row["recorded_at"], tuple(json.loads(row["paths"]))) for row in rows]
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""Canon-to-consumer dependency index for change-scoped ripple targeting.
+
+The index maps every canon in CANON_INVENTORY.json (by path, together with
+its layer_down_status) to the consumer repositories that carry it:
+
+- Registry rule: a consumer carries every canon whose layer_down_status is in
+  its registry entry's "canon_layer_down_statuses", or every status except
+  INTERNAL when the field is absent.
+- A consumer with a GOVERNANCE_ALIGNMENT_INVENTORY.json in the alignment
+  directory (fetched as "<owner>__<repo>.json") carries the canons listed
+  under "layered_down" plus the mandatory canons listed under "missing" (it
+  still has to receive those). Every PUBLIC_API canon, and every canon its
+  inventory does not mention yet (newly added or promoted), is added by the
+  registry rule.
+- Any other consumer is targeted by the registry rule alone.
+
+Changed paths resolve as follows. An INTERNAL canon reaches nobody. Any other
+known canon reaches the consumers that carry it. A canon the inventory does
+not know yet, any other ripple-relevant path (RIPPLE_PREFIXES: executable
+scripts, schemas, gate index, registry, agent contracts) and an empty change
+list reach every consumer. Paths outside RIPPLE_PREFIXES (.agent-admin
+evidence, CHANGELOG, docs) reach nobody. CANON_INVENTORY.json itself is
+derived from the canons and only broadcasts when no canon changed.
+
+Usage:
+    python ripple_targets.py --changed-paths governance/canon/A.md,governance/canon/B.md
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+DEFAULT_ALIGNMENT_DIR = Path(".agent-admin/governance/consumer-alignment")
+CANON_PREFIX = "governance/canon/"
+INVENTORY_PATH = "governance/CANON_INVENTORY.json"
+DEFAULT_LAYER_DOWN_STATUSES = frozenset({"PUBLIC_API", "OPTIONAL"})
+MANDATORY_LAYER_DOWN_STATUSES = frozenset({"PUBLIC_API"})
+BROADCAST = "broadcast"
+
+# Paths that trigger governance ripples (ripple-dispatcher.yml and
+# governance-layer-down-dispatch.yml push filters)
+RIPPLE_PREFIXES = (
+    "governance/canon/",
+    "governance/schemas/",
+    "governance/templates/",
+    "governance/executable/",
+    "governance/policy/",
+    "governance/runbooks/",
+    "governance/quality/agent-integrity/",
+    "governance/CANON_INVENTORY.json",
+    "governance/GATE_REQUIREMENTS_INDEX.json",
+    "governance/CONSUMER_REPO_REGISTRY.json",
+    "governance/CONSTITUTION.md",
+    "BUILD_PHILOSOPHY.md",
+    ".github/agents/",
+)
+
+
+def consumer_repository(consumer: dict) -> str:
+    """Return "owner/repo" for a registry entry using either field style."""
+    if consumer.get("repository"):
+        return consumer["repository"]
+    return f"{consumer.get('owner')}/{consumer.get('repo')}"
+
+
+def load_alignment_inventories(directory: Path) -> dict[str, dict]:
+    """Read every "<owner>__<repo>.json" alignment inventory in `directory`.
+
+    Inventories are keyed by the repository they were fetched for (the file
+    name), never by their self-declared "repository" field.
+    """
+    inventories: dict[str, dict] = {}
+    if not directory.is_dir():
+        return inventories
+    for path in sorted(directory.glob("*.json")):
+        owner, _, repo = path.stem.partition("__")
+        if not owner or not repo:
+            print(f"WARNING: Skipping alignment inventory {path}: name is not <owner>__<repo>.json")
+            continue
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            print(f"WARNING: Skipping unreadable alignment inventory {path}: {exc}")
+            continue
+        if isinstance(data, dict):
+            inventories[f"{owner}/{repo}"] = data
+    return inventories
+
+
+def _entry_paths(entries: list[dict], paths_by_filename: dict[str, list[str]]) -> set[str]:
+    """Central canon paths of alignment entries.
+
+    Entries carry the central path as "source_path". Inventories written
+    before that field existed only have the bare filename in "id".
+    """
+    paths: set[str] = set()
+    for entry in entries:
+        if entry.get("source_path"):
+            paths.add(entry["source_path"])
+        else:
+            paths.update(paths_by_filename.get(entry.get("id"), ()))
+    return paths
+
+
+def carried_canons(alignment: dict, paths_by_filename: dict[str, list[str]]) -> set[str]:
+    """Central canon paths a consumer holds or is required to hold."""
+    entries = list(alignment.get("layered_down", []))
+    entries.extend(entry for entry in alignment.get("missing", []) if entry.get("mandatory"))
+    return _entry_paths(entries, paths_by_filename)
+
+
+def listed_canons(alignment: dict, paths_by_filename: dict[str, list[str]]) -> set[str]:
+    """Central canon paths an alignment inventory mentions at all."""
+    entries = list(alignment.get("layered_down", [])) + list(alignment.get("missing", []))
+    return _entry_paths(entries, paths_by_filename)
+
+
+class CanonDependencyIndex:
+    """Inverted index from central canon path to the consumers carrying it."""
+
+    def __init__(self, canons: list[dict], consumers: list[dict], alignments: dict[str, dict]) -> None:
+        self.consumers = [consumer_repository(c) for c in consumers]
+        self.status_by_path = {
+            canon["path"]: canon.get("layer_down_status", "OPTIONAL")
+            for canon in canons
+            if canon.get("type", "canon") == "canon" and canon.get("path")
+        }
+        self.basis: dict[str, str] = {}
+        self.consumers_by_canon: dict[str, set[str]] = {}
+
+        paths_by_status: dict[str, list[str]] = {}
+        paths_by_filename: dict[str, list[str]] = {}
+        for path, status in self.status_by_path.items():
+            paths_by_status.setdefault(status, []).append(path)
+            paths_by_filename.setdefault(Path(path).name, []).append(path)
+
+        for consumer, repository in zip(consumers, self.consumers):
+            statuses = consumer.get("canon_layer_down_statuses", DEFAULT_LAYER_DOWN_STATUSES)
+            paths = {p for status in statuses for p in paths_by_status.get(status, [])}
+            if repository in alignments:
+                self.basis[repository] = "alignment-inventory"
+                alignment = alignments[repository]
+                mandatory = {p for status in MANDATORY_LAYER_DOWN_STATUSES for p in paths_by_status.get(status, [])}
+                paths = (
+                    carried_canons(alignment, paths_by_filename)
+                    | mandatory
+                    | (paths - listed_canons(alignment, paths_by_filename))
+                )
+            else:
+                self.basis[repository] = "registry"
+            for path in paths:
+                self.consumers_by_canon.setdefault(path, set()).add(repository)
+
+    def resolve(self, path: str) -> list[str] | str:
+        """Consumers reached by one changed path, or BROADCAST."""
+        if not path.startswith(CANON_PREFIX):
+            return BROADCAST if path.startswith(RIPPLE_PREFIXES) else []
+        if path not in self.status_by_path and path not in self.consumers_by_canon:
+            return BROADCAST
+        if self.status_by_path.get(path) == "INTERNAL":
+            return []
+        return sorted(self.consumers_by_canon.get(path, ()))
+
+    def targets(self, changed_paths: list[str]) -> tuple[list[str], dict[str, list[str] | str]]:
+        """Return (affected consumers in registry order, per-path resolution)."""
+        if not changed_paths:
+            return list(self.consumers), {}
+        canon_changed = any(p.startswith(CANON_PREFIX) for p in changed_paths)
+        resolution = {
+            path: self.resolve(path)
+            for path in changed_paths
+            if not (path == INVENTORY_PATH and canon_changed)
+        }
+        if BROADCAST in resolution.values():
+            return list(self.consumers), resolution
+        affected = set().union(*resolution.values()) if resolution else set()
+        return [r for r in self.consumers if r in affected], resolution
+
+
+def build_index(
+    inventory_path: Path,
+    consumers: list[dict],
+    alignment_dir: Path = DEFAULT_ALIGNMENT_DIR,
+) -> CanonDependencyIndex:
+    inventory = json.loads(inventory_path.read_text(encoding="utf-8"))
+    return CanonDependencyIndex(inventory.get("canons", []), consumers, load_alignment_inventories(alignment_dir))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Resolve which consumers a governance change reaches.")
+    parser.add_argument("--registry", default="governance/CONSUMER_REPO_REGISTRY.json")
+    parser.add_argument("--inventory", default=INVENTORY_PATH)
+    parser.add_argument("--alignment-dir", default=str(DEFAULT_ALIGNMENT_DIR),
+                        help="Directory of consumer GOVERNANCE_ALIGNMENT_INVENTORY.json files")
+    parser.add_argument("--changed-paths", default="")
+    args = parser.parse_args()
+
+    for required in (args.registry, args.inventory):
+        if not Path(required).exists():
+            print(f"ERROR: Not found: {required}")
+            return 2
+
+    registry = json.loads(Path(args.registry).read_text(encoding="utf-8"))
+    consumers = [c for c in registry.get("consumers", []) if c.get("enabled")]
+    index = build_index(Path(args.inventory), consumers, Path(args.alignment_dir))
+    affected, resolution = index.targets([p for p in args.changed_paths.split(",") if p])
+    print(json.dumps({
+        "affected": affected,
+        "skipped": [r for r in index.consumers if r not in affected],
+        "basis": index.basis,
+        "paths": resolution,
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
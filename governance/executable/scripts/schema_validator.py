@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""Compiled JSON Schema validators for governance evidence artifacts.
+
+Each schema in governance/executable/schemas/ is translated once into the
+source of a plain Python function that checks every keyword inline and
+collects all violations in a single walk over the document. The generated
+source is compiled in memory once per process and schema; translation takes a
+few milliseconds. Nothing is cached on disk, since a cached module inside the
+checkout could be replaced by a PR and run in place of the check. No network
+access is needed: only local schemas are read and remote $ref is not
+supported.
+
+Supported draft-07 keywords: type, const, enum, required, properties,
+additionalProperties, items, minItems, maxItems, minLength, maxLength,
+pattern, minimum, maximum, exclusiveMinimum, exclusiveMaximum and format
+(date-time and date are checked, other formats are annotations). Unsupported
+keywords raise ValueError at compile time instead of being ignored.
+"""
+
+import argparse
+from functools import lru_cache
+import json
+from pathlib import Path
+from typing import Callable
+
+SCHEMA_DIR = Path(__file__).resolve().parent.parent / "schemas"
+
+ANNOTATION_KEYWORDS = {"$schema", "$id", "$comment", "title", "description", "default", "examples"}
+
+TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool))",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+}
+
+# RFC 3339 date-time / full-date (format "date-time" / "date")
+FORMAT_PATTERNS = {
+    "date-time": r"^\d{4}-\d{2}-\d{2}[Tt ]\d{2}:\d{2}:\d{2}(\.\d+)?([Zz]|[+-]\d{2}:\d{2})$",
+    "date": r"^\d{4}-\d{2}-\d{2}$",
+}
+
+
+def _escape(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+class _SchemaCompiler:
+    """Emit Python source for one schema; each nested value gets a fresh variable.
+
+    Paths are carried as (f-string body, has_placeholders) so that messages for
+    fixed locations are emitted as plain string constants.
+    """
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.patterns: dict[str, str] = {}
+        self.counter = 0
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def fail(self, indent: int, path: tuple[str, bool], message: str) -> None:
+        body, dynamic = path
+        if dynamic:
+            text = "f" + repr(f"{body}: {_escape(message)}")
+        else:
+            text = repr(f"{body}: {message}".replace("{{", "{").replace("}}", "}"))
+        self.emit(indent, f"errors.append({text})")
+
+    def pattern_name(self, pattern: str) -> str:
+        if pattern not in self.patterns:
+            self.patterns[pattern] = f"_PATTERN_{len(self.patterns)}"
+        return self.patterns[pattern]
+
+    def open_block(self, indent: int, header: str) -> int:
+        """Emit a block header; returns the line index to check with close_block()."""
+        self.emit(indent, header)
+        return len(self.lines)
+
+    def close_block(self, start: int) -> None:
+        """Drop the block header again if nothing was emitted inside it."""
+        if start >= 0 and len(self.lines) == start:
+            self.lines.pop()
+
+    def new_var(self) -> str:
+        self.counter += 1
+        return f"v{self.counter}"
+
+    def compile_node(self, schema: dict | bool, var: str, path: tuple[str, bool], indent: int) -> None:
+        if schema is True or schema == {}:
+            return
+        if schema is False:
+            self.fail(indent, path, "no value is allowed here")
+            return
+        if not isinstance(schema, dict):
+            raise ValueError(f"Schema node must be an object or boolean, got {schema!r}")
+
+        unsupported = set(schema) - ANNOTATION_KEYWORDS - SUPPORTED_KEYWORDS
+        if unsupported:
+            raise ValueError(f"Unsupported schema keywords: {', '.join(sorted(unsupported))}")
+
+        block = None
+        known = None
+        if "type" in schema:
+            types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+            unknown = [t for t in types if t not in TYPE_CHECKS]
+            if unknown:
+                raise ValueError(f"Unknown schema type(s): {unknown}")
+            check = " or ".join(TYPE_CHECKS[t].format(v=var) for t in types)
+            self.emit(indent, f"if not ({check}):")
+            self.fail(indent + 1, path, f"expected {' or '.join(types)}")
+            # Keyword checks below only run for values of the right type
+            block = self.open_block(indent, "else:")
+            indent += 1
+            known = types[0] if len(types) == 1 else None
+
+        if "const" in schema:
+            self.emit(indent, f"if {var} != {schema['const']!r}:")
+            self.fail(indent + 1, path, f"must be {schema['const']!r}")
+        if "enum" in schema:
+            self.emit(indent, f"if {var} not in {tuple(schema['enum'])!r}:")
+            self.fail(indent + 1, path, f"must be one of {', '.join(map(str, schema['enum']))}")
+
+        self._compile_string(schema, var, path, indent, known)
+        self._compile_number(schema, var, path, indent, known)
+        self._compile_object(schema, var, path, indent, known)
+        self._compile_array(schema, var, path, indent, known)
+        if block is not None:
+            self.close_block(block)
+
+    def _guard(self, indent: int, json_type: str, var: str, known: str | None) -> tuple[int, int]:
+        """Open an isinstance() block unless the type is already known; return (indent, block)."""
+        if known == json_type or (known == "integer" and json_type == "number"):
+            return indent, -1
+        return indent + 1, self.open_block(indent, f"if {TYPE_CHECKS[json_type].format(v=var)}:")
+
+    def _compile_string(self, schema: dict, var: str, path: tuple[str, bool], indent: int, known: str | None) -> None:
+        if not any(k in schema for k in ("minLength", "maxLength", "pattern", "format")):
+            return
+        indent, block = self._guard(indent, "string", var, known)
+        if "minLength" in schema:
+            self.emit(indent, f"if len({var}) < {int(schema['minLength'])}:")
+            self.fail(indent + 1, path, f"shorter than {schema['minLength']} characters")
+        if "maxLength" in schema:
+            self.emit(indent, f"if len({var}) > {int(schema['maxLength'])}:")
+            self.fail(indent + 1, path, f"longer than {schema['maxLength']} characters")
+        if "pattern" in schema:
+            self.emit(indent, f"if {self.pattern_name(schema['pattern'])}.search({var}) is None:")
+            self.fail(indent + 1, path, f"does not match pattern {schema['pattern']}")
+        if schema.get("format") in FORMAT_PATTERNS:
+            self.emit(indent, f"if {self.pattern_name(FORMAT_PATTERNS[schema['format']])}.match({var}) is None:")
+            self.fail(indent + 1, path, f"not a valid {schema['format']}")
+        self.close_block(block)
+
+    def _compile_number(self, schema: dict, var: str, path: tuple[str, bool], indent: int, known: str | None) -> None:
+        bounds = [
+            ("minimum", "<", "less than"),
+            ("maximum", ">", "greater than"),
+            ("exclusiveMinimum", "<=", "not greater than"),
+            ("exclusiveMaximum", ">=", "not less than"),
+        ]
+        present = [bound for bound in bounds if bound[0] in schema]
+        if not present:
+            return
+        indent, block = self._guard(indent, "number", var, known)
+        for keyword, operator, wording in present:
+            self.emit(indent, f"if {var} {operator} {schema[keyword]!r}:")
+            self.fail(indent + 1, path, f"{wording} {schema[keyword]}")
+        self.close_block(block)
+
+    def _compile_object(self, schema: dict, var: str, path: tuple[str, bool], indent: int, known: str | None) -> None:
+        if not any(k in schema for k in ("required", "properties", "additionalProperties")):
+            return
+        body, dynamic = path
+        properties = schema.get("properties", {})
+        indent, block = self._guard(indent, "object", var, known)
+        for name in schema.get("required", []):
+            self.emit(indent, f"if {name!r} not in {var}:")
+            self.fail(indent + 1, path, f"missing required property {_escape(repr(name))}")
+        for name, subschema in properties.items():
+            if subschema is True or subschema == {}:
+                continue
+            child = self.new_var()
+            self.emit(indent, f"if {name!r} in {var}:")
+            self.emit(indent + 1, f"{child} = {var}[{name!r}]")
+            self.compile_node(subschema, child, (f"{body}.{_escape(name)}", dynamic), indent + 1)
+        additional = schema.get("additionalProperties", True)
+        if additional is not True:
+            key = self.new_var()
+            self.emit(indent, f"for {key} in {var}:")
+            if properties:
+                self.emit(indent + 1, f"if {key} in {tuple(properties)!r}:")
+                self.emit(indent + 2, "continue")
+            if additional is False:
+                message = f"{body}: unexpected property {{{key}!r}}"
+                self.emit(indent + 1, f"errors.append(f{message!r})")
+            else:
+                child = self.new_var()
+                self.emit(indent + 1, f"{child} = {var}[{key}]")
+                self.compile_node(additional, child, (f"{body}.{{{key}}}", True), indent + 1)
+        self.close_block(block)
+
+    def _compile_array(self, schema: dict, var: str, path: tuple[str, bool], indent: int, known: str | None) -> None:
+        if not any(k in schema for k in ("items", "minItems", "maxItems")):
+            return
+        body, _dynamic = path
+        indent, block = self._guard(indent, "array", var, known)
+        if "minItems" in schema:
+            self.emit(indent, f"if len({var}) < {int(schema['minItems'])}:")
+            self.fail(indent + 1, path, f"fewer than {schema['minItems']} items")
+        if "maxItems" in schema:
+            self.emit(indent, f"if len({var}) > {int(schema['maxItems'])}:")
+            self.fail(indent + 1, path, f"more than {schema['maxItems']} items")
+        items = schema.get("items", True)
+        if isinstance(items, list):
+            raise ValueError("Tuple-form 'items' is not supported")
+        if items is not True and items != {}:
+            index, child = self.new_var(), self.new_var()
+            loop = self.open_block(indent, f"for {index}, {child} in enumerate({var}):")
+            self.compile_node(items, child, (f"{body}[{{{index}}}]", True), indent + 1)
+            self.close_block(loop)
+        self.close_block(block)
+
+    def module_source(self, schema: dict) -> str:
+        self.compile_node(schema, "data", ("$", False), 1)
+        header = [
+            '"""Generated by schema_validator.py; do not edit."""',
+            "",
+            "import re",
+            "",
+        ]
+        header += [f"{name} = re.compile({pattern!r})" for pattern, name in self.patterns.items()]
+        header += [
+            "",
+            "",
+            "def validate(data):",
+            "    errors = []",
+        ]
+        return "\n".join(header + self.lines + ["    return errors", ""])
+
+
+SUPPORTED_KEYWORDS = {
+    "type", "const", "enum", "required", "properties", "additionalProperties",
+    "items", "minItems", "maxItems", "minLength", "maxLength", "pattern", "format",
+    "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum",
+}
+
+
+def generate_validator_source(schema: dict) -> str:
+    """Return the Python source of a module defining validate(data) -> list[str]."""
+    return _SchemaCompiler().module_source(schema)
+
+
+@lru_cache(maxsize=None)
+def compile_schema_file(schema_path: Path) -> Callable[[object], list[str]]:
+    """Return the compiled validator for a schema file (generated and compiled in memory)."""
+    try:
+        schema = json.loads(schema_path.read_bytes())
+    except FileNotFoundError as exc:
+        raise ValueError(f"Missing schema: {schema_path}") from exc
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Invalid schema JSON {schema_path}: {exc}") from exc
+
+    namespace: dict = {}
+    exec(compile(generate_validator_source(schema), str(schema_path), "exec"), namespace)
+    return namespace["validate"]
+
+
+def schema_path(name: str) -> Path:
+    """Resolve a schema by artifact name, e.g. "gate_results"."""
+    return SCHEMA_DIR / f"{name}.schema.json"
+
+
+def validate_artifact(name: str, data: object) -> list[str]:
+    """Validate data against governance/executable/schemas/<name>.schema.json; return all violations."""
+    return compile_schema_file(schema_path(name))(data)
+
+
+def format_violations(violations: list[str], limit: int = 20) -> list[str]:
+    lines = [f"  - {violation}" for violation in violations[:limit]]
+    if len(violations) > limit:
+        lines.append(f"  ... and {len(violations) - limit} more")
+    return lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Validate JSON documents against a governance schema.")
+    parser.add_argument("schema", help="Schema name (e.g. gate_results) or path to a .schema.json file")
+    parser.add_argument("documents", nargs="*", help="JSON documents to validate")
+    parser.add_argument("--print-source", action="store_true", help="Print the generated validator and exit")
+    args = parser.parse_args()
+    if not args.documents and not args.print_source:
+        parser.error("give at least one document, or --print-source")
+
+    path = Path(args.schema) if args.schema.endswith(".json") else schema_path(args.schema)
+    try:
+        if args.print_source:
+            print(generate_validator_source(json.loads(path.read_text())))
+            return 0
+        validate = compile_schema_file(path)
+    except (OSError, ValueError) as exc:
+        print(f"ERROR: {exc}")
+        return 2
+
+    exit_code = 0
+    for document in args.documents:
+        try:
+            data = json.loads(Path(document).read_text())
+        except (OSError, json.JSONDecodeError) as exc:
+            print(f"ERROR: {document}: {exc}")
+            exit_code = 2
+            continue
+        violations = validate(data)
+        if violations:
+            print(f"FAIL: {document} ({len(violations)} violation(s))")
+            print("\n".join(format_violations(violations, limit=len(violations))))
+            exit_code = max(exit_code, 1)
+        else:
+            print(f"PASS: {document}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""Run every merge-gate evidence validator in one process.
+
+Each evidence artifact is read and parsed once and shared by every validator
+that needs it (gate_results.json feeds the verdict, stop-and-fix and RCA
+checks). The validators run concurrently on a thread pool, and one
+consolidated verdict JSON is written with per-validator status, messages and
+timing. Exit codes match the individual validators:
+
+  0 = every selected validator passed
+  1 = at least one validator failed
+  2 = at least one artifact or policy file was missing or invalid
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+import sys
+import time
+from typing import Callable, NamedTuple
+
+from minimizing_language import load_scanner
+from validate_gate_results import evaluate_gate_results
+from validate_improvement_entry import evaluate_improvement_entry
+from validate_prehandover_proof import evaluate_prehandover_proof
+from validate_rca import evaluate_rca
+from validate_sync_state import evaluate_sync_state
+
+VERDICT_SCHEMA_VERSION = "1.0.0"
+
+STATUS_BY_CODE = {0: "PASS", 1: "FAIL", 2: "ERROR"}
+
+# Validator name -> artifacts it reads; only these files are loaded
+VALIDATOR_ARTIFACTS = {
+    "gate-results": ("gate_results",),
+    "stop-and-fix": ("gate_results",),
+    "prehandover-proof": ("prehandover_proof",),
+    "improvement-entry": ("improvement_entry",),
+    "rca": ("gate_results", "rca"),
+    "sync-state": ("sync_state",),
+}
+VALIDATOR_NAMES = list(VALIDATOR_ARTIFACTS)
+
+
+class Artifact(NamedTuple):
+    """A loaded evidence file: data is None when missing or unparseable."""
+
+    path: Path
+    data: dict | None
+    error: str | None
+
+    @property
+    def missing(self) -> bool:
+        return self.data is None and self.error is None
+
+
+def load_artifact(path: Path) -> Artifact:
+    try:
+        return Artifact(path, json.loads(path.read_text()), None)
+    except FileNotFoundError:
+        return Artifact(path, None, None)
+    except json.JSONDecodeError as exc:
+        return Artifact(path, None, str(exc))
+
+
+def check_gate_results(artifacts: dict[str, Artifact], mode: str, pr_text: str) -> tuple[int, list[str]]:
+    gate = artifacts["gate_results"]
+    if gate.missing:
+        return 2, [f"ERROR: Missing gate results summary: {gate.path}"]
+    if gate.error:
+        return 2, [f"ERROR: Gate results invalid: {gate.error}"]
+    return evaluate_gate_results(gate.data, mode, pr_text)
+
+
+def check_prehandover_proof(artifacts: dict[str, Artifact]) -> tuple[int, list[str]]:
+    proof = artifacts["prehandover_proof"]
+    if proof.missing:
+        return 2, [f"ERROR: Missing prehandover proof: {proof.path}"]
+    if proof.error:
+        return 2, [f"ERROR: Prehandover proof JSON invalid: {proof.error}"]
+    return evaluate_prehandover_proof(proof.data)
+
+
+def check_improvement_entry(artifacts: dict[str, Artifact]) -> tuple[int, list[str]]:
+    entry = artifacts["improvement_entry"]
+    if entry.missing:
+        return 2, [f"ERROR: Missing improvement entry: {entry.path}"]
+    if entry.error:
+        return 2, [f"ERROR: Improvement entry JSON invalid: {entry.error}"]
+    return evaluate_improvement_entry(entry.data)
+
+
+def check_rca(artifacts: dict[str, Artifact]) -> tuple[int, list[str]]:
+    gate, rca = artifacts["gate_results"], artifacts["rca"]
+    if gate.error:
+        return 2, ["ERROR: Gate results JSON invalid; cannot determine RCA requirement."]
+    if rca.error:
+        return 2, [f"ERROR: RCA invalid: {rca.error}"]
+    return evaluate_rca(rca.data, gate.data, rca.path)
+
+
+def check_sync_state(artifacts: dict[str, Artifact], required_status: str) -> tuple[int, list[str]]:
+    sync = artifacts["sync_state"]
+    if sync.missing:
+        return 1, [f"ERROR: Missing sync_state.json at {sync.path}"]
+    if sync.error:
+        return 1, [f"ERROR: sync_state.json invalid: {sync.error}"]
+    return evaluate_sync_state(sync.data, required_status)
+
+
+def run_validator(name: str, check: Callable[[], tuple[int, list[str]]]) -> dict:
+    started = time.perf_counter()
+    try:
+        code, messages = check()
+    except ValueError as exc:
+        code, messages = 2, [f"ERROR: {exc}"]
+    except Exception as exc:  # e.g. non-object JSON; must not abort the other validators
+        code, messages = 2, [f"ERROR: {type(exc).__name__}: {exc}"]
+    return {
+        "name": name,
+        "status": STATUS_BY_CODE[code],
+        "exit_code": code,
+        "messages": messages,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Validate all merge-gate evidence in one process.")
+    parser.add_argument("--gate-results", default=".agent-admin/gates/gate_results.json", help="Path to gate_results.json")
+    parser.add_argument("--proof", default=".agent-admin/prehandover/prehandover_proof.json", help="Path to prehandover proof JSON")
+    parser.add_argument("--entry", default=".agent-admin/improvements/improvement_entry.json", help="Path to improvement entry JSON")
+    parser.add_argument("--rca", default=".agent-admin/rca/rca.json", help="Path to RCA JSON")
+    parser.add_argument("--sync-state", default=".agent-admin/governance/sync_state.json", help="Path to sync_state.json")
+    parser.add_argument("--required-status", default="ALIGNED", help="Expected alignment status")
+    parser.add_argument("--pr-title", default="", help="PR title for minimizing-language scan")
+    parser.add_argument("--pr-body", default="", help="PR body for minimizing-language scan")
+    parser.add_argument(
+        "--validators",
+        help="Comma-separated subset to run (default: all): " + ", ".join(VALIDATOR_NAMES),
+    )
+    parser.add_argument("--output", help="Write the verdict JSON here (default: stdout)")
+    parser.add_argument("--jobs", type=int, default=0, help="Worker threads (default: one per validator)")
+    args = parser.parse_args()
+
+    selected = VALIDATOR_NAMES if not args.validators else [name.strip() for name in args.validators.split(",") if name.strip()]
+    unknown = sorted(set(selected) - set(VALIDATOR_NAMES))
+    if unknown:
+        parser.error(f"unknown validators: {', '.join(unknown)}")
+    if not selected:
+        parser.error("--validators selected nothing")
+
+    started = time.perf_counter()
+    paths = {
+        "gate_results": Path(args.gate_results),
+        "prehandover_proof": Path(args.proof),
+        "improvement_entry": Path(args.entry),
+        "rca": Path(args.rca),
+        "sync_state": Path(args.sync_state),
+    }
+    needed = {artifact for name in selected for artifact in VALIDATOR_ARTIFACTS[name]}
+    artifacts = {key: load_artifact(path) for key, path in paths.items() if key in needed}
+
+    pr_text = f"{args.pr_title}\n{args.pr_body}"
+    checks = {
+        "gate-results": lambda: check_gate_results(artifacts, "verdict", pr_text),
+        "stop-and-fix": lambda: check_gate_results(artifacts, "stop-and-fix", ""),
+        "prehandover-proof": lambda: check_prehandover_proof(artifacts),
+        "improvement-entry": lambda: check_improvement_entry(artifacts),
+        "rca": lambda: check_rca(artifacts),
+        "sync-state": lambda: check_sync_state(artifacts, args.required_status),
+    }
+
+    # Compile the minimizing-language scanner once, before the workers share it
+    try:
+        load_scanner()
+    except ValueError:
+        pass  # reported by each validator that scans text
+
+    workers = args.jobs if args.jobs > 0 else len(selected)
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        results = list(executor.map(lambda name: run_validator(name, checks[name]), selected))
+
+    exit_code = max(result["exit_code"] for result in results)
+    verdict = {
+        "schema_version": VERDICT_SCHEMA_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "overall_status": STATUS_BY_CODE[exit_code],
+        "exit_code": exit_code,
+        "artifacts": {
+            key: {"path": str(artifact.path), "present": not artifact.missing}
+            for key, artifact in artifacts.items()
+        },
+        "validators": results,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+    }
+
+    # Keep stdout clean for the verdict JSON when no --output is given
+    log = sys.stdout if args.output else sys.stderr
+    for result in results:
+        for message in result["messages"]:
+            print(f"[{result['name']}] {message}", file=log)
+
+    text = json.dumps(verdict, indent=2) + "\n"
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(text)
+        print(f"{verdict['overall_status']}: verdict written to {output_path}")
+    else:
+        sys.stdout.write(text)
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,62 +2,12 @@
 """Validate gate results summary for merge gate enforcement."""
 
 import argparse
-from functools import lru_cache
 import json
-import os
-import re
 from pathlib import Path
 import sys
 
-
-def resolve_minimizing_language_path() -> Path:
-    env_path = os.environ.get("MINIMIZING_LANGUAGE_PATTERNS_PATH")
-    if env_path:
-        return Path(env_path)
-
-    for parent in Path(__file__).resolve().parents:
-        candidate = parent / "policy" / "minimizing_language_patterns.json"
-        if candidate.exists():
-            return candidate
-
-    raise ValueError(
-        "Missing minimizing language patterns file. "
-        "Set MINIMIZING_LANGUAGE_PATTERNS_PATH to override."
-    )
-
-
-@lru_cache(maxsize=1)
-def load_minimizing_language_patterns() -> list[str]:
-    patterns_path = resolve_minimizing_language_path()
-    try:
-        data = json.loads(patterns_path.read_text())
-    except FileNotFoundError as exc:
-        raise ValueError(f"Missing minimizing language patterns file: {patterns_path}") from exc
-    except json.JSONDecodeError as exc:
-        raise ValueError(f"Invalid minimizing language patterns JSON: {exc}") from exc
-
-    patterns = data.get("patterns")
-    if not isinstance(patterns, list) or not patterns:
-        raise ValueError("Minimizing language patterns list missing or empty.")
-
-    resolved = []
-    for entry in patterns:
-        if isinstance(entry, str):
-            resolved.append(entry)
-            continue
-        if isinstance(entry, dict) and isinstance(entry.get("pattern"), str):
-            resolved.append(entry["pattern"])
-            continue
-        raise ValueError("Invalid minimizing language pattern entry; expected string or object with 'pattern'.")
-    return resolved
-
-
-def detect_minimizing_language(text: str) -> list[str]:
-    matches = []
-    for pattern in load_minimizing_language_patterns():
-        if re.search(pattern, text, flags=re.IGNORECASE):
-            matches.append(pattern)
-    return matches
+from minimizing_language import format_matches, scan_minimizing_language
+from schema_validator import format_violations, validate_artifact
 
 
 def load_json(path: Path) -> dict:
@@ -65,24 +15,41 @@ def load_json(path: Path) -> dict:
         return json.load(handle)
 
 
-def require(condition: bool, message: str) -> None:
-    if not condition:
-        raise ValueError(message)
+def validate_structure(data: dict) -> list[str]:
+    """Return every gate_results.schema.json violation in data."""
+    return validate_artifact("gate_results", data)
 
 
-def validate_structure(data: dict) -> None:
-    require(data.get("schema_version") == "1.0.0", "Invalid or missing schema_version")
-    require("generated_at" in data, "Missing generated_at")
-    require(isinstance(data.get("pr"), dict), "Missing pr metadata")
-    require("overall_status" in data, "Missing overall_status")
-    require(isinstance(data.get("gates"), list) and data.get("gates"), "Missing gate list")
-    require(isinstance(data.get("stop_and_fix"), dict), "Missing stop_and_fix")
+def evaluate_gate_results(data: dict, mode: str = "verdict", pr_text: str = "") -> tuple[int, list[str]]:
+    """Check parsed gate results; return (exit code, report lines)."""
+    try:
+        violations = validate_structure(data)
+    except ValueError as exc:
+        return 2, [f"ERROR: {exc}"]
+    if violations:
+        return 2, [f"ERROR: Gate results invalid ({len(violations)} violation(s)):", *format_violations(violations)]
 
-    for gate in data["gates"]:
-        require(isinstance(gate, dict), "Gate entry must be object")
-        require("name" in gate, "Gate entry missing name")
-        require("status" in gate, f"Gate {gate.get('name', '<unknown>')} missing status")
-        require("evidence_paths" in gate, f"Gate {gate.get('name', '<unknown>')} missing evidence_paths")
+    combined_text = pr_text.strip()
+    if combined_text:
+        try:
+            matches = scan_minimizing_language(combined_text)
+        except ValueError as exc:
+            return 2, [f"ERROR: {exc}"]
+        if matches:
+            return 1, ["ERROR: Minimizing language detected in PR title/body.", *format_matches(matches)]
+
+    if mode == "verdict":
+        if data.get("overall_status") != "PASS":
+            return 1, ["ERROR: Merge verdict failed. Gate results indicate non-pass status."]
+        if any(gate.get("status") != "PASS" for gate in data.get("gates", [])):
+            return 1, ["ERROR: One or more gates failed. See gate_results.json for evidence."]
+        return 0, ["PASS: Merge gate verdict satisfied."]
+
+    stop_and_fix = data.get("stop_and_fix", {})
+    if stop_and_fix.get("required") and not stop_and_fix.get("resolved"):
+        return 1, ["ERROR: Stop-and-fix unresolved. RCA required before merge."]
+
+    return 0, ["PASS: Stop-and-fix enforcement satisfied."]
 
 
 def main() -> int:
@@ -100,39 +67,13 @@ def main() -> int:
 
     try:
         data = load_json(results_path)
-        validate_structure(data)
-    except (json.JSONDecodeError, ValueError) as exc:
+    except json.JSONDecodeError as exc:
         print(f"ERROR: Gate results invalid: {exc}")
         return 2
 
-    combined_text = f"{args.pr_title}\n{args.pr_body}".strip()
-    if combined_text:
-        try:
-            matches = detect_minimizing_language(combined_text)
-        except ValueError as exc:
-            print(f"ERROR: {exc}")
-            return 2
-        if matches:
-            print("ERROR: Minimizing language detected in PR title/body.")
-            return 1
-
-    if args.mode == "verdict":
-        if data.get("overall_status") != "PASS":
-            print("ERROR: Merge verdict failed. Gate results indicate non-pass status.")
-            return 1
-        if any(gate.get("status") != "PASS" for gate in data.get("gates", [])):
-            print("ERROR: One or more gates failed. See gate_results.json for evidence.")
-            return 1
-        print("PASS: Merge gate verdict satisfied.")
-        return 0
-
-    stop_and_fix = data.get("stop_and_fix", {})
-    if stop_and_fix.get("required") and not stop_and_fix.get("resolved"):
-        print("ERROR: Stop-and-fix unresolved. RCA required before merge.")
-        return 1
-
-    print("PASS: Stop-and-fix enforcement satisfied.")
-    return 0
+    code, lines = evaluate_gate_results(data, args.mode, f"{args.pr_title}\n{args.pr_body}")
+    print("\n".join(lines))
+    return code
 
 
 if __name__ == "__main__":
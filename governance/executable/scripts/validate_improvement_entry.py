@@ -5,10 +5,19 @@ import argparse
 import json
 from pathlib import Path
 
+from schema_validator import format_violations, validate_artifact
 
-def require(condition: bool, message: str) -> None:
-    if not condition:
-        raise ValueError(message)
+
+def evaluate_improvement_entry(data: dict) -> tuple[int, list[str]]:
+    """Check a parsed improvement entry; return (exit code, report lines)."""
+    try:
+        violations = validate_artifact("improvement_entry", data)
+    except ValueError as exc:
+        return 2, [f"ERROR: {exc}"]
+    if violations:
+        return 2, [f"ERROR: Improvement entry invalid ({len(violations)} violation(s)):", *format_violations(violations)]
+
+    return 0, ["PASS: Improvement entry validated."]
 
 
 def main() -> int:
@@ -27,18 +36,9 @@ def main() -> int:
         print(f"ERROR: Improvement entry JSON invalid: {exc}")
         return 2
 
-    try:
-        require(data.get("schema_version") == "1.0.0", "Invalid or missing schema_version")
-        require("captured_at" in data, "Missing captured_at")
-        require(data.get("category") in {"PROCESS", "TOOLING", "GOVERNANCE", "QUALITY", "OTHER"}, "Invalid category")
-        require(isinstance(data.get("description"), str) and len(data.get("description", "")) >= 10, "Description too short")
-        require(data.get("status") in {"IN_SCOPE", "PARKED"}, "Invalid status")
-    except ValueError as exc:
-        print(f"ERROR: Improvement entry invalid: {exc}")
-        return 2
-
-    print("PASS: Improvement entry validated.")
-    return 0
+    code, lines = evaluate_improvement_entry(data)
+    print("\n".join(lines))
+    return code
 
 
 if __name__ == "__main__":
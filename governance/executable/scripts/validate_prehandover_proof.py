@@ -1,67 +1,69 @@
 #!/usr/bin/env python3
-"""Validate structured prehandover proof."""
+"""Validate structured prehandover proof.
+
+Proofs are checked against prehandover_proof.schema.json (schema_version
+2.0.0). During the deprecation window, schema_version 1.0.0 proofs from
+consumer repositories are still accepted with the original 1.0.0 structural
+checks and a deprecation warning.
+"""
 
 import argparse
-from functools import lru_cache
 import json
-import os
-import re
 from pathlib import Path
 
+from minimizing_language import format_matches, scan_minimizing_language
+from schema_validator import format_violations, validate_artifact
+
+LEGACY_SCHEMA_VERSION = "1.0.0"
+LEGACY_WARNING = (
+    f"WARNING: schema_version {LEGACY_SCHEMA_VERSION} is deprecated; regenerate the proof with "
+    "schema_version 2.0.0 (adds lint_status, type_check_status, build_status)."
+)
+
+
+def validate_legacy_structure(data: dict) -> list[str]:
+    """Return every violation of the original schema_version 1.0.0 checks."""
+    checks = [
+        ("generated_at" in data, "Missing generated_at"),
+        (isinstance(data.get("pr"), dict), "Missing pr metadata"),
+        (isinstance(data.get("summary"), str) and bool(data.get("summary")), "Missing summary"),
+        (isinstance(data.get("scope"), str) and bool(data.get("scope")), "Missing scope"),
+        (data.get("test_status") in {"PASS", "FAIL", "NOT_RUN"}, "Invalid test_status"),
+        (isinstance(data.get("evidence_paths"), list) and bool(data.get("evidence_paths")),
+         "Missing evidence_paths"),
+    ]
+    return [message for passed, message in checks if not passed]
 
-def resolve_minimizing_language_path() -> Path:
-    env_path = os.environ.get("MINIMIZING_LANGUAGE_PATTERNS_PATH")
-    if env_path:
-        return Path(env_path)
-
-    for parent in Path(__file__).resolve().parents:
-        candidate = parent / "policy" / "minimizing_language_patterns.json"
-        if candidate.exists():
-            return candidate
 
-    raise ValueError(
-        "Missing minimizing language patterns file. "
-        "Set MINIMIZING_LANGUAGE_PATTERNS_PATH to override."
-    )
+def validate_structure(data: dict) -> list[str]:
+    """Return every prehandover_proof.schema.json violation in data (legacy checks for 1.0.0)."""
+    if data.get("schema_version") == LEGACY_SCHEMA_VERSION:
+        return validate_legacy_structure(data)
+    return validate_artifact("prehandover_proof", data)
 
 
-@lru_cache(maxsize=1)
-def load_minimizing_language_patterns() -> list[str]:
-    patterns_path = resolve_minimizing_language_path()
+def evaluate_prehandover_proof(data: dict) -> tuple[int, list[str]]:
+    """Check a parsed prehandover proof; return (exit code, report lines)."""
     try:
-        data = json.loads(patterns_path.read_text())
-    except FileNotFoundError as exc:
-        raise ValueError(f"Missing minimizing language patterns file: {patterns_path}") from exc
-    except json.JSONDecodeError as exc:
-        raise ValueError(f"Invalid minimizing language patterns JSON: {exc}") from exc
-
-    patterns = data.get("patterns")
-    if not isinstance(patterns, list) or not patterns:
-        raise ValueError("Minimizing language patterns list missing or empty.")
-
-    resolved = []
-    for entry in patterns:
-        if isinstance(entry, str):
-            resolved.append(entry)
-            continue
-        if isinstance(entry, dict) and isinstance(entry.get("pattern"), str):
-            resolved.append(entry["pattern"])
-            continue
-        raise ValueError("Invalid minimizing language pattern entry; expected string or object with 'pattern'.")
-    return resolved
-
-
-def detect_minimizing_language(text: str) -> list[str]:
-    return [
-        pattern
-        for pattern in load_minimizing_language_patterns()
-        if re.search(pattern, text, flags=re.IGNORECASE)
-    ]
+        violations = validate_structure(data)
+    except ValueError as exc:
+        return 2, [f"ERROR: {exc}"]
+    if violations:
+        return 2, [f"ERROR: Prehandover proof invalid ({len(violations)} violation(s)):", *format_violations(violations)]
 
+    text_blob = "\n".join(
+        [str(data.get("summary", "")), str(data.get("scope", "")), str(data.get("notes", ""))]
+    )
+    try:
+        matches = scan_minimizing_language(text_blob)
+    except ValueError as exc:
+        return 2, [f"ERROR: {exc}"]
+    if matches:
+        return 1, ["ERROR: Minimizing language detected in prehandover proof.", *format_matches(matches)]
 
-def require(condition: bool, message: str) -> None:
-    if not condition:
-        raise ValueError(message)
+    if data.get("schema_version") == LEGACY_SCHEMA_VERSION:
+        return 0, [LEGACY_WARNING, "PASS: Prehandover proof validated."]
+    return 0, ["PASS: Prehandover proof validated."]
 
 
 def main() -> int:
@@ -80,32 +82,9 @@ def main() -> int:
         print(f"ERROR: Prehandover proof JSON invalid: {exc}")
         return 2
 
-    try:
-        require(data.get("schema_version") == "1.0.0", "Invalid or missing schema_version")
-        require("generated_at" in data, "Missing generated_at")
-        require(isinstance(data.get("pr"), dict), "Missing pr metadata")
-        require(isinstance(data.get("summary"), str) and data.get("summary"), "Missing summary")
-        require(isinstance(data.get("scope"), str) and data.get("scope"), "Missing scope")
-        require(data.get("test_status") in {"PASS", "FAIL", "NOT_RUN"}, "Invalid test_status")
-        require(isinstance(data.get("evidence_paths"), list) and data.get("evidence_paths"), "Missing evidence_paths")
-    except ValueError as exc:
-        print(f"ERROR: Prehandover proof invalid: {exc}")
-        return 2
-
-    text_blob = "\n".join(
-        [str(data.get("summary", "")), str(data.get("scope", "")), str(data.get("notes", ""))]
-    )
-    try:
-        matches = detect_minimizing_language(text_blob)
-    except ValueError as exc:
-        print(f"ERROR: {exc}")
-        return 2
-    if matches:
-        print("ERROR: Minimizing language detected in prehandover proof.")
-        return 1
-
-    print("PASS: Prehandover proof validated.")
-    return 0
+    code, lines = evaluate_prehandover_proof(data)
+    print("\n".join(lines))
+    return code
 
 
 if __name__ == "__main__":
@@ -6,6 +6,14 @@ import json
 from pathlib import Path
 
 
+def evaluate_sync_state(data: dict, required_status: str = "ALIGNED") -> tuple[int, list[str]]:
+    """Check a parsed sync_state.json; return (exit code, report lines)."""
+    status = data.get("alignment_status")
+    if status != required_status:
+        return 1, [f"ERROR: Alignment status is {status}, expected {required_status}."]
+    return 0, ["PASS: Alignment state verified."]
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Validate sync_state.json alignment status.")
     parser.add_argument("--sync-state", required=True, help="Path to sync_state.json")
@@ -23,13 +31,9 @@ def main() -> int:
         print(f"ERROR: sync_state.json invalid: {exc}")
         return 1
 
-    status = data.get("alignment_status")
-    if status != args.required_status:
-        print(f"ERROR: Alignment status is {status}, expected {args.required_status}.")
-        return 1
-
-    print("PASS: Alignment state verified.")
-    return 0
+    code, lines = evaluate_sync_state(data, args.required_status)
+    print("\n".join(lines))
+    return code
 
 
 if __name__ == "__main__":
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Canon header parser micro-benchmark
+
+Times the single-pass parser (canon_header.parse_canon_header) against the
+previous per-field regex extractor over the real governance/canon and
+governance/policy corpus, and verifies that both produce identical metadata
+for every file.
+
+Usage:
+    python scripts/benchmark_canon_header.py [--rounds N] [--base-path PATH]
+
+Exit codes:
+  0 = outputs identical
+  1 = at least one file produced different metadata
+"""
+
+import argparse
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from canon_header import HEADER_LIMIT, parse_canon_header, parse_canon_header_text
+
+
+def legacy_extract_metadata_text(content: str) -> Dict:
+    """Previous per-field regex extractor (reference implementation, verbatim)."""
+    metadata = {
+        "version": "unknown",
+        "effective_date": "unknown",
+        "description": "",
+        "layer_down_status": "INTERNAL",
+    }
+
+    # Extract version
+    version_match = re.search(r'\*\*Version\*\*:\s*([^\n]+)', content, re.IGNORECASE)
+    if version_match:
+        metadata["version"] = version_match.group(1).strip()
+    else:
+        # Try alternate format
+        version_match = re.search(r'Version:\s*v?([^\n]+)', content, re.IGNORECASE)
+        if version_match:
+            metadata["version"] = version_match.group(1).strip()
+
+    # Extract effective date
+    date_match = re.search(r'\*\*Effective Date\*\*:\s*([^\n]+)', content, re.IGNORECASE)
+    if date_match:
+        date_str = date_match.group(1).strip()
+        # Try to parse and normalize date format
+        try:
+            # Try YYYY-MM-DD format
+            parsed_date = datetime.strptime(date_str, "%Y-%m-%d")
+            metadata["effective_date"] = parsed_date.strftime("%Y-%m-%d")
+        except ValueError:
+            metadata["effective_date"] = date_str
+
+    # Extract layer_down_status
+    layer_match = re.search(r'\*\*Layer-Down Status\*\*:\s*([^\n]+)', content, re.IGNORECASE)
+    if layer_match:
+        status = layer_match.group(1).strip().upper()
+        if status in ["PUBLIC_API", "INTERNAL", "OPTIONAL"]:
+            metadata["layer_down_status"] = status
+
+    # Extract description - use the first sentence of Purpose section
+    purpose_match = re.search(r'##\s*1\.\s*Purpose\s*\n+(.*?)(?:\n\n|\n#)', content, re.DOTALL)
+    if purpose_match:
+        desc = purpose_match.group(1).strip()
+        # Get first sentence or first 200 chars
+        first_sentence = re.split(r'[.!?]\s+', desc)[0]
+        if len(first_sentence) > 200:
+            first_sentence = first_sentence[:197] + "..."
+        metadata["description"] = first_sentence
+
+    return metadata
+
+
+def read_header(file_path: Path) -> str:
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read(HEADER_LIMIT)
+
+
+def collect_corpus(base_path: Path) -> List[Path]:
+    """Return every Markdown file the inventory regenerator would parse."""
+    files = []
+    for subdir in ("canon", "policy"):
+        scan_dir = base_path / "governance" / subdir
+        if scan_dir.exists():
+            files.extend(p for p in sorted(scan_dir.rglob("*.md")) if not p.name.startswith("."))
+    return files
+
+
+def time_pass(func: Callable, inputs: List, rounds: int) -> float:
+    """Return the best wall-clock time (seconds) of one full pass over inputs."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for item in inputs:
+            func(item)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark canon header parsing")
+    parser.add_argument("--rounds", type=int, default=50, help="Timed passes per implementation (best is reported)")
+    parser.add_argument(
+        "--base-path",
+        type=Path,
+        default=Path(__file__).parent.parent,
+        help="Repository root containing governance/ (default: this repository)",
+    )
+    args = parser.parse_args()
+
+    files = collect_corpus(args.base_path)
+    if not files:
+        print(f"ERROR: No canon files found under {args.base_path / 'governance'}")
+        return 1
+
+    headers = [read_header(file_path) for file_path in files]
+
+    mismatches = []
+    for file_path, content in zip(files, headers):
+        expected = legacy_extract_metadata_text(content)
+        actual = parse_canon_header(file_path)
+        if expected != actual:
+            mismatches.append((file_path, expected, actual))
+
+    # Parse-only timings isolate the regex work; end-to-end includes file reads
+    legacy_parse = time_pass(legacy_extract_metadata_text, headers, args.rounds)
+    single_parse = time_pass(parse_canon_header_text, headers, args.rounds)
+    legacy_total = time_pass(lambda p: legacy_extract_metadata_text(read_header(p)), files, args.rounds)
+    single_total = time_pass(parse_canon_header, files, args.rounds)
+
+    print("="*70)
+    print("CANON HEADER PARSER BENCHMARK")
+    print("="*70)
+    print(f"Files:        {len(files)}")
+    print(f"Rounds:       {args.rounds} (best pass reported)")
+    print(f"{'':14}{'legacy':>12}{'single-pass':>14}{'speedup':>10}")
+    for label, legacy_time, single_time in (
+        ("Parse only", legacy_parse, single_parse),
+        ("End-to-end", legacy_total, single_total),
+    ):
+        speedup = legacy_time / single_time if single_time > 0 else float("inf")
+        print(f"{label:<14}{legacy_time * 1000:>9.2f} ms{single_time * 1000:>11.2f} ms{speedup:>9.2f}x")
+    print(f"Mismatches:   {len(mismatches)}")
+    print("="*70)
+
+    for file_path, expected, actual in mismatches:
+        print(f"\n  [{file_path.relative_to(args.base_path)}]")
+        for key in expected:
+            if expected[key] != actual.get(key):
+                print(f"    {key}: legacy={expected[key]!r} single-pass={actual.get(key)!r}")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Gate planner benchmark
+
+Plans synthetic PRs touching thousands of files with
+governance/executable/scripts/gate_planner.py and compares the combined
+single-regex matcher against matching every rule separately per file (one
+compiled regex per glob, the shape of the workflows' grep-per-pattern
+checks). Both must produce the same plan.
+
+Paths are sampled from the real tree (git ls-files) and padded with
+synthetic source, docs and governance paths so every rule family is hit.
+
+Usage:
+    python scripts/benchmark_gate_planner.py [--files N] [--rounds N] [--seed N]
+
+Exit codes:
+  0 = plans identical
+  1 = the two matchers disagreed
+"""
+
+import argparse
+import json
+import random
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Set
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "governance" / "executable" / "scripts"))
+
+from gate_planner import DEFAULT_INDEX, GatePlanner, glob_to_regex  # noqa: E402
+
+SYNTHETIC_TEMPLATES = [
+    "apps/service-{n}/src/module_{n}.py",
+    "apps/web-{n}/components/Widget{n}.tsx",
+    "packages/lib-{n}/index.js",
+    "docs/guides/guide-{n}.md",
+    "notes/topic-{n}.txt",
+    "governance/canon/SYNTHETIC_CANON_{n}.md",
+    "governance/schemas/synthetic-{n}.schema.json",
+    ".github/agents/agent-{n}.md",
+    "modules/m{n}/m{n}-agent-contract.md",
+    "infra/terraform/stack-{n}.tf",
+]
+
+
+class PerRulePlanner(GatePlanner):
+    """Same plan, but each rule is a separately compiled regex tried in turn."""
+
+    def __init__(self, index: dict) -> None:
+        super().__init__(index)
+        self.rule_regexes = [(key, re.compile(glob_to_regex(glob))) for key, glob in self.rules]
+
+    def match(self, path: str) -> Set[str]:
+        return {key for key, regex in self.rule_regexes if regex.match(path)}
+
+
+def build_changed_files(count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    tracked = subprocess.run(["git", "ls-files"], capture_output=True, text=True).stdout.split()
+    paths = rng.sample(tracked, min(len(tracked), count // 2))
+    n = 0
+    while len(paths) < count:
+        paths.append(rng.choice(SYNTHETIC_TEMPLATES).format(n=n))
+        n += 1
+    rng.shuffle(paths)
+    return paths
+
+
+def best_of(planner: GatePlanner, files: List[str], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        planner.plan(files, ["mat-deliverable"])
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the gate planner's combined path matcher")
+    parser.add_argument("--files", type=int, default=5000, help="Changed files per synthetic PR")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--index", default=DEFAULT_INDEX)
+    args = parser.parse_args()
+
+    index = json.loads(Path(args.index).read_text(encoding="utf-8"))
+    combined = GatePlanner(index)
+    per_rule = PerRulePlanner(index)
+
+    print("=" * 70)
+    print("GATE PLANNER BENCHMARK")
+    print("=" * 70)
+    print(f"Rules:        {len(combined.rules)}")
+    print(f"Rounds:       {args.rounds} (best pass reported)")
+    print(f"{'files':>12}{'per-rule':>14}{'combined':>14}{'speedup':>10}")
+
+    mismatches = 0
+    for count in sorted({args.files // 10, args.files, args.files * 4}):
+        files = build_changed_files(count, args.seed)
+        if combined.plan(files, ["mat-deliverable"]) != per_rule.plan(files, ["mat-deliverable"]):
+            mismatches += 1
+        per_rule_time = best_of(per_rule, files, args.rounds)
+        combined_time = best_of(combined, files, args.rounds)
+        speedup = per_rule_time / combined_time if combined_time else float("inf")
+        print(f"{count:>12}{per_rule_time * 1000:>11.2f} ms{combined_time * 1000:>11.2f} ms{speedup:>9.2f}x")
+
+    started = time.perf_counter()
+    GatePlanner(index)
+    print(f"Compile:      {(time.perf_counter() - started) * 1000:.2f} ms")
+    print(f"Mismatches:   {mismatches}")
+    print("=" * 70)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
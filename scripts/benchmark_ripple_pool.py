@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Ripple dispatch connection-pool benchmark
+
+Starts the stub dispatch endpoint (scripts/ripple_stub_server.py) in-process
+on an ephemeral port and sends the same sequence of dispatches twice: once
+with a fresh connection per request (the previous urllib behaviour) and once
+through dispatch_ripple.ConnectionPool. Loopback HTTP only shows the TCP
+handshake saving; against api.github.com each avoided connection also saves
+a TLS handshake, so the real gain is larger.
+
+Usage:
+    python scripts/benchmark_ripple_pool.py [--requests N] [--latency-ms MS]
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from urllib import request
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "governance" / "executable" / "scripts"))
+
+from dispatch_ripple import ConnectionPool, send_dispatch  # noqa: E402
+from ripple_stub_server import StubState, make_handler  # noqa: E402
+
+
+def urllib_dispatch(api_url: str, owner: str, repo: str) -> int:
+    """One urlopen() per request, as dispatch_ripple.py did before pooling."""
+    data = json.dumps({"event_type": "governance_ripple", "client_payload": {}}).encode("utf-8")
+    req = request.Request(f"{api_url}/repos/{owner}/{repo}/dispatches", data=data, method="POST")
+    req.add_header("Authorization", "token benchmark")
+    with request.urlopen(req, timeout=10) as resp:
+        return resp.status
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs per-request ripple dispatch connections.")
+    parser.add_argument("--requests", type=int, default=500, help="Dispatches per variant (default: 500)")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Stub server response delay")
+    args = parser.parse_args()
+
+    state = StubState({}, args.latency_ms / 1000)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_port}"
+
+    try:
+        started = time.perf_counter()
+        for i in range(args.requests):
+            urllib_dispatch(api_url, "bench", f"repo-{i % 20}")
+        fresh = time.perf_counter() - started
+
+        pool = ConnectionPool()
+        started = time.perf_counter()
+        for i in range(args.requests):
+            send_dispatch("bench", f"repo-{i % 20}", "benchmark", "governance_ripple", {}, api_url, pool)
+        pooled = time.perf_counter() - started
+        pool.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"Requests per variant:  {args.requests}")
+    print(f"Connection per request: {fresh * 1000:.1f} ms ({fresh / args.requests * 1000:.3f} ms/request)")
+    print(f"Pooled keep-alive:      {pooled * 1000:.1f} ms ({pooled / args.requests * 1000:.3f} ms/request)")
+    print(f"Connections opened:     {pool.opened} (reused {pool.reused} times)")
+    print(f"Speedup:                {fresh / pooled:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Shared canon scanning engine
+
+Hashes governance files on a thread pool (SHA256 plus git blob id from one
+read) and, when asked, extracts header metadata in the same worker task so
+each file is visited once per scan.
+hashlib releases the GIL while digesting large buffers, so threads scale
+with available cores on cold caches.
+
+Used by:
+    scripts/regenerate_canon_inventory.py
+    scripts/sync_repo_inventory.py
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+# Hashing lives in the layered-down executable scripts so every governance
+# tool (here and in consumer repos) shares one implementation
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "governance" / "executable" / "scripts"))
+
+from hash_store import clean_blob_ids, sha256_and_blob_id, sha256_file  # noqa: E402
+
+
+class ScanResult(NamedTuple):
+    """Outcome of scanning a single file."""
+
+    path: Path
+    file_hash: str
+    blob_id: str
+    metadata: Optional[Dict]
+    error: Optional[str]
+
+
+def hash_file(file_path: Path) -> str:
+    """Return the full SHA256 hex digest of a file."""
+    return sha256_file(file_path)
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """Translate a --jobs value into a worker count (0/None = one per CPU)."""
+    if not jobs or jobs < 1:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _scan_one(file_path: Path, metadata_fn: Optional[Callable[[Path], Dict]]) -> ScanResult:
+    try:
+        file_hash, blob_id = sha256_and_blob_id(file_path)
+    except OSError as e:
+        return ScanResult(file_path, "", "", None, str(e))
+    metadata = metadata_fn(file_path) if metadata_fn is not None else None
+    return ScanResult(file_path, file_hash, blob_id, metadata, None)
+
+
+def scan_files(
+    paths: Iterable[Path],
+    jobs: Optional[int] = None,
+    metadata_fn: Optional[Callable[[Path], Dict]] = None,
+) -> List[ScanResult]:
+    """Hash (and optionally parse) every path, returning results in input order.
+
+    Args:
+        paths: Files to scan
+        jobs: Worker thread count (0/None = one per CPU, 1 = serial)
+        metadata_fn: Optional header extractor run in the same task as hashing
+
+    Returns:
+        One ScanResult per input path; unreadable files carry an error string
+    """
+    paths = list(paths)
+    workers = min(resolve_jobs(jobs), max(len(paths), 1))
+    if workers == 1:
+        return [_scan_one(p, metadata_fn) for p in paths]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda p: _scan_one(p, metadata_fn), paths))
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Shared --watch loop for the inventory tools
+
+Watches directory trees and individual files and hands debounced batches of
+changed paths to a callback. On Linux the backend is inotify, reached through
+ctypes and libc so nothing outside the standard library is required. If
+inotify is unavailable, or when asked, a polling backend compares
+(size, mtime_ns, inode) snapshots instead.
+
+Status is streamed to stdout as NDJSON, one object per line with "ts" and
+"event" keys. Human-readable progress from the tools goes to stderr while
+watching, so stdout stays machine-readable.
+
+Used by:
+    scripts/regenerate_canon_inventory.py --watch
+    scripts/sync_repo_inventory.py --watch
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# inotify(7) event masks
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+EVENT_HEADER = struct.Struct("iIII")
+
+# Returned by a backend when it lost track of events and a full rescan is needed
+RESCAN = None
+
+
+def emit(event: str, **fields) -> None:
+    """Write one NDJSON status line to stdout."""
+    record = {"ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"), "event": event}
+    record.update(fields)
+    sys.__stdout__.write(json.dumps(record, default=str) + "\n")
+    sys.__stdout__.flush()
+
+
+def _watched(path: Path, dirs: List[Path], files: Set[Path], suffix: str) -> bool:
+    if path in files:
+        return True
+    if suffix and path.suffix != suffix and path.suffix:
+        return False
+    return any(path == d or d in path.parents for d in dirs)
+
+
+class InotifyBackend:
+    """Recursive inotify watches on the given directories and the parents of the given files."""
+
+    name = "inotify"
+
+    def __init__(self, dirs: List[Path], files: List[Path], suffix: str = ".md"):
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError("inotify is only available on Linux")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs = [d.resolve() for d in dirs]
+        self.files = {f.resolve() for f in files}
+        self.suffix = suffix
+        self.watches: Dict[int, Path] = {}
+        for directory in self.dirs:
+            self._add_tree(directory)
+        for parent in {f.parent for f in self.files}:
+            self._add(parent)
+
+    def _add(self, directory: Path) -> None:
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd >= 0:
+            self.watches[wd] = directory
+
+    def _add_tree(self, directory: Path) -> None:
+        if not directory.is_dir():
+            return
+        self._add(directory)
+        for root, subdirs, _ in os.walk(directory):
+            for subdir in subdirs:
+                self._add(Path(root) / subdir)
+
+    def poll(self, timeout: float) -> Optional[Set[Path]]:
+        """Changed paths seen within `timeout` seconds (empty set if none), or RESCAN."""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed: Set[Path] = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b"\0")
+            offset += EVENT_HEADER.size + length
+            if mask & IN_Q_OVERFLOW:
+                return RESCAN
+            directory = self.watches.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                del self.watches[wd]
+                continue
+            path = directory / os.fsdecode(name) if name else directory
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                self._add_tree(path)
+            if mask & IN_ISDIR or _watched(path, self.dirs, self.files, self.suffix):
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingBackend:
+    """Portable fallback: diff stat snapshots every `interval` seconds."""
+
+    name = "polling"
+
+    def __init__(self, dirs: List[Path], files: List[Path], suffix: str = ".md", interval: float = 0.5):
+        self.dirs = [d.resolve() for d in dirs]
+        self.files = [f.resolve() for f in files]
+        self.suffix = suffix
+        self.interval = interval
+        self.snapshot = self._snapshot()
+
+    def _snapshot(self) -> Dict[Path, Tuple[int, int, int]]:
+        snapshot = {}
+        candidates: List[Path] = list(self.files)
+        for directory in self.dirs:
+            if directory.is_dir():
+                candidates.extend(directory.rglob(f"*{self.suffix}"))
+        for path in candidates:
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (st.st_size, st.st_mtime_ns, st.st_ino)
+        return snapshot
+
+    def poll(self, timeout: float) -> Optional[Set[Path]]:
+        time.sleep(min(timeout, self.interval))
+        current = self._snapshot()
+        changed = {p for p in current.keys() | self.snapshot.keys() if current.get(p) != self.snapshot.get(p)}
+        self.snapshot = current
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+def open_backend(dirs: List[Path], files: List[Path], backend: str = "auto", suffix: str = ".md", interval: float = 0.5):
+    """Return an inotify backend when possible (or requested), else polling."""
+    if backend in ("auto", "inotify"):
+        try:
+            return InotifyBackend(dirs, files, suffix)
+        except OSError as exc:
+            if backend == "inotify":
+                raise
+            emit("backend_fallback", reason=str(exc))
+    return PollingBackend(dirs, files, suffix, interval)
+
+
+def expand_changes(changed: Iterable[Path], known: Iterable[Path], suffix: str = ".md") -> Set[Path]:
+    """Resolve directory-level events to the files they affect.
+
+    A created or moved-in directory contributes every file below it; a removed
+    or moved-out directory contributes every known file that was below it.
+    """
+    known = list(known)
+    files: Set[Path] = set()
+    for path in changed:
+        if path.is_dir():
+            files.update(p for p in path.rglob(f"*{suffix}") if p.is_file())
+        else:
+            files.add(path)
+        files.update(k for k in known if path in k.parents)
+    return files
+
+
+def watch(
+    dirs: List[Path],
+    files: List[Path],
+    on_change: Callable[[Optional[Set[Path]]], Dict],
+    debounce: float = 0.2,
+    backend: str = "auto",
+    poll_interval: float = 0.5,
+    suffix: str = ".md",
+) -> int:
+    """Run until interrupted, calling on_change(paths) once per debounced batch.
+
+    on_change receives None when the backend asks for a full rescan. Its
+    returned dict is merged into the "updated" status line. Anything it prints
+    goes to stderr.
+    """
+    watcher = open_backend(dirs, files, backend, suffix, poll_interval)
+    emit("watching", backend=watcher.name, dirs=[str(d) for d in dirs], files=[str(f) for f in files],
+         debounce_ms=round(debounce * 1000))
+    pending: Optional[Set[Path]] = set()
+    last_event = 0.0
+    try:
+        while True:
+            changed = watcher.poll(debounce if pending or pending is None else 1.0)
+            if changed is RESCAN:
+                pending, last_event = None, time.monotonic()
+            elif changed:
+                if pending is not None:
+                    pending.update(changed)
+                last_event = time.monotonic()
+            if (pending is None or pending) and time.monotonic() - last_event >= debounce:
+                batch, pending = pending, set()
+                started = time.perf_counter()
+                try:
+                    with redirect_stdout(sys.stderr):
+                        result = on_change(batch)
+                except Exception as exc:  # keep watching; the next save may fix it
+                    emit("error", error=f"{type(exc).__name__}: {exc}")
+                    continue
+                emit("updated", duration_ms=round((time.perf_counter() - started) * 1000, 1),
+                     rescan=batch is None, **result)
+    except KeyboardInterrupt:
+        emit("stopped")
+        return 0
+    finally:
+        watcher.close()
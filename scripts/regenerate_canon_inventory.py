@@ -6,178 +6,263 @@ This script scans the governance/ directory for canon files and regenerates
 the CANON_INVENTORY.json with current SHA256 checksums and metadata.
 
 Usage:
-    python scripts/regenerate_canon_inventory.py
+    python scripts/regenerate_canon_inventory.py [--incremental] [--verify] [--cache PATH] [--jobs N]
+                                                 [--changes-output PATH]
+    python scripts/regenerate_canon_inventory.py --watch [--debounce-ms MS] [--watch-backend auto|inotify|polling]
+
+With --incremental, a machine-local cache keyed on (path, size, mtime_ns,
+inode) lets unchanged files skip hashing and metadata extraction. --verify
+forces a full rehash while still refreshing the cache.
+
+The inventory is only rewritten (atomically) when an entry actually changed;
+timestamp-only churn is skipped. --changes-output records which entries were
+added, removed or modified.
+
+--watch does one full scan, keeps the entries in memory and then, on every
+debounced batch of file events, re-hashes and re-parses only the files that
+changed before rewriting the inventory. Status streams to stdout as NDJSON
+(see canon_watch.py).
 """
 
+import argparse
 import hashlib
 import json
-import re
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+
+from canon_header import parse_canon_header
+from canon_scan import hash_file, resolve_jobs, scan_files
+from canon_watch import expand_changes, watch
+
+# Directories scanned under governance/, with the inventory "type" they produce
+SCAN_DIRECTORIES = (("canon", "canon"), ("policy", "policy"))
+
+DEFAULT_CACHE_PATH = Path(".agent-admin") / "cache" / "canon-inventory-cache.json"
+
+# Header fields that change on every run and do not make an inventory "changed"
+TIMESTAMP_KEYS = ("last_updated", "generation_timestamp")
 
 
 def calculate_sha256(file_path: Path, truncate: int = 12) -> tuple[str, str]:
     """Calculate both truncated and full SHA256 hash of a file."""
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    full_hash = sha256_hash.hexdigest()
+    full_hash = hash_file(file_path)
     return full_hash[:truncate], full_hash
 
 
 def extract_metadata(file_path: Path) -> Dict:
     """Extract metadata from a canon file's header.
     
-    Note: Reads first 3000 characters assuming all metadata appears in the header.
-    This assumption is safe for standard canon files which have metadata at the top.
+    Delegates to the single-pass parser in canon_header.py, which stops at the
+    first heading after the Purpose section (or HEADER_LIMIT characters).
     """
-    metadata = {
-        "version": "unknown",
-        "effective_date": "unknown",
-        "description": "",
-        "layer_down_status": "INTERNAL",
-    }
-    
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read(3000)  # Read first 3000 chars for metadata (expanded for safety)
-            
-        # Extract version
-        version_match = re.search(r'\*\*Version\*\*:\s*([^\n]+)', content, re.IGNORECASE)
-        if version_match:
-            metadata["version"] = version_match.group(1).strip()
-        else:
-            # Try alternate format
-            version_match = re.search(r'Version:\s*v?([^\n]+)', content, re.IGNORECASE)
-            if version_match:
-                metadata["version"] = version_match.group(1).strip()
-        
-        # Extract effective date
-        date_match = re.search(r'\*\*Effective Date\*\*:\s*([^\n]+)', content, re.IGNORECASE)
-        if date_match:
-            date_str = date_match.group(1).strip()
-            # Try to parse and normalize date format
-            try:
-                # Try YYYY-MM-DD format
-                parsed_date = datetime.strptime(date_str, "%Y-%m-%d")
-                metadata["effective_date"] = parsed_date.strftime("%Y-%m-%d")
-            except ValueError:
-                metadata["effective_date"] = date_str
-        
-        # Extract layer_down_status
-        layer_match = re.search(r'\*\*Layer-Down Status\*\*:\s*([^\n]+)', content, re.IGNORECASE)
-        if layer_match:
-            status = layer_match.group(1).strip().upper()
-            if status in ["PUBLIC_API", "INTERNAL", "OPTIONAL"]:
-                metadata["layer_down_status"] = status
-        
-        # Extract description - use the first sentence of Purpose section
-        purpose_match = re.search(r'##\s*1\.\s*Purpose\s*\n+(.*?)(?:\n\n|\n#)', content, re.DOTALL)
-        if purpose_match:
-            desc = purpose_match.group(1).strip()
-            # Get first sentence or first 200 chars
-            first_sentence = re.split(r'[.!?]\s+', desc)[0]
-            if len(first_sentence) > 200:
-                first_sentence = first_sentence[:197] + "..."
-            metadata["description"] = first_sentence
-        
+        return parse_canon_header(file_path)
     except Exception as e:
         print(f"  Warning: Could not extract metadata from {file_path}: {e}")
-    
-    return metadata
+        return {
+            "version": "unknown",
+            "effective_date": "unknown",
+            "description": "",
+            "layer_down_status": "INTERNAL",
+        }
 
 
-def scan_governance_directory(base_path: Path, existing_inventory: Optional[Dict] = None) -> List[Dict]:
-    """Scan governance directory for canon files."""
-    canons = []
-    
+class InventoryCache:
+    """Persistent hash/metadata cache keyed on (path, size, mtime_ns, inode).
+
+    The cache is machine-local: stat data is not stable across checkouts, so
+    the file must never be committed. A corrupt or foreign-version cache is
+    discarded and rebuilt.
+    """
+
+    CACHE_VERSION = 2
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.verified = 0
+        self._seen: set = set()
+
+    def load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"  Warning: Could not load inventory cache, rebuilding: {e}")
+            return
+        if data.get("cache_version") != self.CACHE_VERSION:
+            print("  Warning: Inventory cache version mismatch, rebuilding")
+            return
+        self.entries = data.get("entries", {})
+
+    @staticmethod
+    def _stat_key(stat: os.stat_result) -> List[int]:
+        return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+    def lookup(self, rel_path: str, stat: os.stat_result, verify: bool = False) -> Optional[Dict]:
+        """Return the cached record if the stat key still matches, else None.
+
+        With verify=True a match is counted as verified rather than as a hit,
+        since the caller re-hashes the file anyway.
+        """
+        self._seen.add(rel_path)
+        record = self.entries.get(rel_path)
+        if record is not None and record.get("stat") == self._stat_key(stat):
+            if verify:
+                self.verified += 1
+            else:
+                self.hits += 1
+            return record
+        self.misses += 1
+        return None
+
+    def store(self, rel_path: str, stat: os.stat_result, file_hash: str, blob_id: str, metadata: Dict) -> None:
+        self._seen.add(rel_path)
+        self.entries[rel_path] = {
+            "stat": self._stat_key(stat),
+            "file_hash": file_hash,
+            "git_blob_id": blob_id,
+            "metadata": metadata,
+        }
+
+    def forget(self, rel_path: str) -> None:
+        """Drop the record for a deleted file so save() does not keep it."""
+        self._seen.discard(rel_path)
+        self.entries.pop(rel_path, None)
+
+    def save(self) -> None:
+        """Write the cache, dropping records for files that no longer exist."""
+        entries = {k: v for k, v in sorted(self.entries.items()) if k in self._seen}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"cache_version": self.CACHE_VERSION, "entries": entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+def build_canon_entry(
+    rel_path: Path,
+    full_hash: str,
+    blob_id: str,
+    metadata: Dict,
+    entry_type: str,
+    existing_entry: Optional[Dict] = None,
+) -> Dict:
+    """Build a single inventory entry from file hashes and extracted metadata.
+
+    git_blob_id is computed from the same bytes as file_hash_sha256, so
+    consumers may compare blob ids (e.g. from git ls-tree) instead of hashing.
+    """
+    filename = rel_path.name
+
+    # Preserve layer_down_status from existing inventory if available
+    if existing_entry:
+        layer_down_status = existing_entry.get("layer_down_status", metadata["layer_down_status"])
+    else:
+        layer_down_status = metadata["layer_down_status"]
+
+    return {
+        "filename": filename,
+        "version": metadata["version"],
+        "file_hash": full_hash,
+        "effective_date": metadata["effective_date"],
+        "description": metadata["description"] or f"Canonical governance document: {filename.replace('.md', '')}",
+        "type": entry_type,
+        "path": str(rel_path),
+        "layer_down_status": layer_down_status,
+        "file_hash_sha256": full_hash,
+        "git_blob_id": blob_id,
+    }
+
+
+def scan_governance_directory(
+    base_path: Path,
+    existing_inventory: Optional[Dict] = None,
+    cache: Optional["InventoryCache"] = None,
+    verify: bool = False,
+    jobs: Optional[int] = None,
+) -> List[Dict]:
+    """Scan governance directory for canon files.
+
+    When a cache is supplied, files whose (size, mtime_ns, inode) stat key is
+    unchanged are neither re-hashed nor re-parsed. If the existing inventory
+    already carries an entry with the cached hash, that entry is reused as-is.
+    With verify=True every file is re-hashed and the cache is refreshed.
+    Remaining files are hashed and parsed on a pool of `jobs` threads.
+    """
+
     # Build lookup map from existing inventory
     existing_map = {}
     if existing_inventory:
         for canon in existing_inventory.get("canons", []):
             key = canon.get("path", "")
             existing_map[key] = canon
-    
-    # Scan governance/canon directory
-    canon_dir = base_path / "governance" / "canon"
-    if canon_dir.exists():
-        for file_path in sorted(canon_dir.rglob("*.md")):
+
+    # Pass 1: enumerate files and resolve cache hits; misses are queued for hashing
+    slots: List[Optional[Dict]] = []
+    pending = []
+    for subdir, entry_type in SCAN_DIRECTORIES:
+        scan_dir = base_path / "governance" / subdir
+        if not scan_dir.exists():
+            continue
+
+        for file_path in sorted(scan_dir.rglob("*.md")):
             if file_path.name.startswith("."):
                 continue
-                
+
             rel_path = file_path.relative_to(base_path)
-            filename = file_path.name
-            
-            print(f"  Processing: {rel_path}")
-            
-            # Calculate hashes
-            truncated_hash, full_hash = calculate_sha256(file_path)
-            
-            # Extract metadata
-            metadata = extract_metadata(file_path)
-            
-            # Preserve layer_down_status from existing inventory if available
             existing_entry = existing_map.get(str(rel_path))
-            if existing_entry:
-                layer_down_status = existing_entry.get("layer_down_status", metadata["layer_down_status"])
-            else:
-                layer_down_status = metadata["layer_down_status"]
-            
-            canon_entry = {
-                "filename": filename,
-                "version": metadata["version"],
-                "file_hash": full_hash,
-                "effective_date": metadata["effective_date"],
-                "description": metadata["description"] or f"Canonical governance document: {filename.replace('.md', '')}",
-                "type": "canon",
-                "path": str(rel_path),
-                "layer_down_status": layer_down_status,
-                "file_hash_sha256": full_hash,
-            }
-            
-            canons.append(canon_entry)
-    
-    # Scan governance/policy directory  
-    policy_dir = base_path / "governance" / "policy"
-    if policy_dir.exists():
-        for file_path in sorted(policy_dir.rglob("*.md")):
-            if file_path.name.startswith("."):
+
+            cached = None
+            stat = None
+            if cache is not None:
+                stat = file_path.stat()
+                cached = cache.lookup(str(rel_path), stat, verify=verify)
+
+            if cached is not None and not verify:
+                full_hash = cached["file_hash"]
+                blob_id = cached["git_blob_id"]
+                if (
+                    existing_entry
+                    and existing_entry.get("file_hash") == full_hash
+                    and existing_entry.get("git_blob_id") == blob_id
+                ):
+                    slots.append(dict(existing_entry))
+                else:
+                    slots.append(build_canon_entry(rel_path, full_hash, blob_id, cached["metadata"], entry_type, existing_entry))
                 continue
-                
-            rel_path = file_path.relative_to(base_path)
-            filename = file_path.name
-            
+
             print(f"  Processing: {rel_path}")
-            
-            # Calculate hashes
-            truncated_hash, full_hash = calculate_sha256(file_path)
-            
-            # Extract metadata
-            metadata = extract_metadata(file_path)
-            
-            # Preserve layer_down_status from existing inventory if available
-            existing_entry = existing_map.get(str(rel_path))
-            if existing_entry:
-                layer_down_status = existing_entry.get("layer_down_status", metadata["layer_down_status"])
-            else:
-                layer_down_status = metadata["layer_down_status"]
-            
-            canon_entry = {
-                "filename": filename,
-                "version": metadata["version"],
-                "file_hash": full_hash,
-                "effective_date": metadata["effective_date"],
-                "description": metadata["description"] or f"Canonical governance document: {filename.replace('.md', '')}",
-                "type": "policy",
-                "path": str(rel_path),
-                "layer_down_status": layer_down_status,
-                "file_hash_sha256": full_hash,
-            }
-            
-            canons.append(canon_entry)
-    
+            pending.append((len(slots), file_path, rel_path, entry_type, existing_entry, cached, stat))
+            slots.append(None)
+
+    # Pass 2: hash and extract metadata for every miss in one parallel pass
+    results = scan_files([item[1] for item in pending], jobs=jobs, metadata_fn=extract_metadata)
+    for (slot, file_path, rel_path, entry_type, existing_entry, cached, stat), result in zip(pending, results):
+        if result.error:
+            raise OSError(f"Could not hash {rel_path}: {result.error}")
+        full_hash = result.file_hash
+        metadata = result.metadata
+
+        if cache is not None:
+            if verify and cached is not None and cached["file_hash"] != full_hash:
+                cache.stale += 1
+                print(f"  Warning: cached hash for {rel_path} was stale")
+            cache.store(str(rel_path), stat, full_hash, result.blob_id, metadata)
+
+        slots[slot] = build_canon_entry(rel_path, full_hash, result.blob_id, metadata, entry_type, existing_entry)
+
+    canons = [entry for entry in slots if entry is not None]
     return canons
 
 
@@ -193,7 +278,12 @@ def load_existing_inventory(base_path: Path) -> Optional[Dict]:
     return None
 
 
-def generate_inventory(base_path: Path) -> Dict:
+def generate_inventory(
+    base_path: Path,
+    cache: Optional[InventoryCache] = None,
+    verify: bool = False,
+    jobs: Optional[int] = None,
+) -> Dict:
     """Generate the complete CANON_INVENTORY.json structure."""
     # Load existing inventory to preserve layer_down_status
     print("Loading existing inventory...")
@@ -202,7 +292,7 @@ def generate_inventory(base_path: Path) -> Dict:
         print(f"  Found existing inventory with {existing_inventory.get('total_canons', 0)} canons")
     
     print("\nScanning governance directory for canon files...")
-    canons = scan_governance_directory(base_path, existing_inventory)
+    canons = scan_governance_directory(base_path, existing_inventory, cache=cache, verify=verify, jobs=jobs)
     
     # Use consistent date format - last_updated is date-only for human readability
     # generation_timestamp is full ISO 8601 for precise tracking
@@ -218,30 +308,259 @@ def generate_inventory(base_path: Path) -> Dict:
     return inventory
 
 
-def save_inventory(inventory: Dict, output_path: Path):
-    """Save inventory to JSON file."""
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(inventory, f, indent=2, ensure_ascii=False)
+def iter_inventory_json(inventory: Dict) -> Iterator[str]:
+    """Yield the inventory as JSON text, one chunk per top-level key or canon entry.
+
+    Output is byte-identical to json.dump(indent=2, ensure_ascii=False) plus a
+    trailing newline, so unchanged inventories hash identically across runs.
+    """
+    yield "{"
+    for index, (key, value) in enumerate(inventory.items()):
+        separator = "," if index else ""
+        if key == "canons" and value:
+            yield f'{separator}\n  "canons": ['
+            for entry_index, entry in enumerate(value):
+                entry_text = json.dumps(entry, indent=2, ensure_ascii=False).replace("\n", "\n    ")
+                yield f'{"," if entry_index else ""}\n    {entry_text}'
+            yield "\n  ]"
+        else:
+            value_text = json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+            yield f"{separator}\n  {json.dumps(key, ensure_ascii=False)}: {value_text}"
+    yield "\n}\n"
+
+
+def diff_inventory_entries(old_canons: List[Dict], new_canons: List[Dict]) -> Dict[str, List[str]]:
+    """Return the paths of canon entries added, removed or modified between two inventories."""
+    old_map = {entry.get("path", ""): entry for entry in old_canons}
+    new_map = {entry.get("path", ""): entry for entry in new_canons}
+    return {
+        "added": sorted(path for path in new_map if path not in old_map),
+        "removed": sorted(path for path in old_map if path not in new_map),
+        "modified": sorted(path for path, entry in new_map.items() if path in old_map and old_map[path] != entry),
+    }
+
+
+def save_inventory(inventory: Dict, output_path: Path) -> Dict:
+    """Save inventory to JSON file, rewriting it only when an entry changed.
+
+    The inventory is first rendered with the on-disk timestamps; if that hashes
+    identically to the current file, nothing substantive changed and the write
+    is skipped (the in-memory timestamps are reset to the on-disk ones).
+    Otherwise the new inventory is streamed to a temp file and atomically
+    renamed over the output.
+
+    Returns:
+        Change report: {"written": bool, "added": [...], "removed": [...], "modified": [...]}
+    """
+    old_bytes = output_path.read_bytes() if output_path.exists() else None
+    old_inventory: Dict = {}
+    if old_bytes is not None:
+        try:
+            old_inventory = json.loads(old_bytes)
+        except ValueError:
+            old_inventory = {}
+
+    report = diff_inventory_entries(old_inventory.get("canons", []), inventory["canons"])
+
+    if old_bytes is not None and all(key in old_inventory for key in TIMESTAMP_KEYS):
+        candidate = dict(inventory, **{key: old_inventory[key] for key in TIMESTAMP_KEYS})
+        candidate_hash = hashlib.sha256()
+        for chunk in iter_inventory_json(candidate):
+            candidate_hash.update(chunk.encode("utf-8"))
+        if candidate_hash.digest() == hashlib.sha256(old_bytes).digest():
+            inventory.update({key: old_inventory[key] for key in TIMESTAMP_KEYS})
+            print(f"\n✓ Inventory unchanged, kept {output_path}")
+            return dict(report, written=False)
+
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{output_path.name}.", suffix=".tmp", dir=output_path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for chunk in iter_inventory_json(inventory):
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
     print(f"\n✓ Inventory saved to {output_path}")
+    return dict(report, written=True)
+
+
+def canon_sort_key(entry: Dict):
+    """Order entries as a full scan does: by SCAN_DIRECTORIES, then by path."""
+    path = Path(entry.get("path", ""))
+    for index, (subdir, _) in enumerate(SCAN_DIRECTORIES):
+        if Path("governance", subdir) in path.parents:
+            return index, path
+    return len(SCAN_DIRECTORIES), path
+
+
+def watch_inventory(
+    base_path: Path,
+    output_path: Path,
+    cache: Optional[InventoryCache] = None,
+    jobs: Optional[int] = None,
+    debounce: float = 0.2,
+    backend: str = "auto",
+) -> int:
+    """Keep CANON_INVENTORY.json current until interrupted (--watch)."""
+    base_path = base_path.resolve()
+    roots = {base_path / "governance" / subdir: entry_type for subdir, entry_type in SCAN_DIRECTORIES}
+    state: Dict = {}
+
+    def full_scan() -> Dict:
+        inventory = generate_inventory(base_path, cache=cache, jobs=jobs)
+        state["entries"] = {entry["path"]: entry for entry in inventory["canons"]}
+        changes = save_inventory(inventory, output_path)
+        if cache is not None:
+            cache.save()
+        return changes
+
+    def entry_type_for(file_path: Path) -> Optional[str]:
+        if file_path.suffix != ".md" or file_path.name.startswith("."):
+            return None
+        for root, entry_type in roots.items():
+            if root in file_path.parents:
+                return entry_type
+        return None
+
+    def on_change(paths) -> Dict:
+        if paths is None:
+            changes = full_scan()
+            scanned = len(state["entries"])
+        else:
+            entries = state["entries"]
+            files = expand_changes(paths, (base_path / path for path in entries))
+            targets = sorted(f for f in files if entry_type_for(f))
+            present = [f for f in targets if f.is_file()]
+            for file_path in targets:
+                if file_path not in present:
+                    rel_key = str(file_path.relative_to(base_path))
+                    entries.pop(rel_key, None)
+                    if cache is not None:
+                        cache.forget(rel_key)
+            for result in scan_files(present, jobs=jobs, metadata_fn=extract_metadata):
+                rel_path = result.path.relative_to(base_path)
+                if result.error:
+                    print(f"  Warning: Could not hash {rel_path}: {result.error}")
+                    continue
+                if cache is not None:
+                    cache.store(str(rel_path), result.path.stat(), result.file_hash, result.blob_id, result.metadata)
+                entries[str(rel_path)] = build_canon_entry(
+                    rel_path, result.file_hash, result.blob_id, result.metadata,
+                    entry_type_for(result.path), entries.get(str(rel_path)),
+                )
+            canons = sorted(entries.values(), key=canon_sort_key)
+            now = datetime.now()
+            changes = save_inventory({
+                "version": "1.0.0",
+                "last_updated": now.strftime("%Y-%m-%d"),
+                "total_canons": len(canons),
+                "generation_timestamp": now.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "canons": canons,
+            }, output_path)
+            if cache is not None and changes["written"]:
+                cache.save()
+            scanned = len(targets)
+        return {
+            "scanned": scanned,
+            "total_canons": len(state["entries"]),
+            "written": changes["written"],
+            "added": changes["added"],
+            "removed": changes["removed"],
+            "modified": changes["modified"],
+        }
+
+    with redirect_stdout(sys.stderr):
+        full_scan()
+    return watch(list(roots), [], on_change, debounce=debounce, backend=backend)
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Regenerate governance/CANON_INVENTORY.json")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse cached hashes/metadata for files whose size, mtime and inode are unchanged",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Force a full rehash of every file (refreshes the cache when --incremental is set)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        help=f"Cache file for --incremental (default: <repo-root>/{DEFAULT_CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Worker threads for hashing and metadata extraction (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--changes-output",
+        type=Path,
+        help="Write the added/removed/modified entry paths as JSON (e.g. to scope ripple dispatch)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and update changed entries on every save; status is NDJSON on stdout",
+    )
+    parser.add_argument(
+        "--debounce-ms",
+        type=int,
+        default=200,
+        help="--watch: quiet period before a batch of file events is applied (default: 200)",
+    )
+    parser.add_argument(
+        "--watch-backend",
+        choices=("auto", "inotify", "polling"),
+        default="auto",
+        help="--watch: event source (default: inotify where available, else polling)",
+    )
+    args = parser.parse_args()
+
     base_path = Path(__file__).parent.parent
     output_path = base_path / "governance" / "CANON_INVENTORY.json"
+
+    cache = None
+    if args.incremental:
+        cache = InventoryCache(args.cache or base_path / DEFAULT_CACHE_PATH)
+        cache.load()
+
+    if args.watch:
+        sys.exit(watch_inventory(
+            base_path, output_path, cache=cache, jobs=args.jobs,
+            debounce=args.debounce_ms / 1000, backend=args.watch_backend,
+        ))
     
     print("="*70)
     print("CANON_INVENTORY.json Regeneration")
     print("="*70)
     print(f"Base path: {base_path}")
     print(f"Output: {output_path}")
+    print(f"Jobs: {resolve_jobs(args.jobs)}")
+    if cache is not None:
+        print(f"Cache: {cache.path}{' (verify)' if args.verify else ''}")
     print()
     
     # Generate inventory
-    inventory = generate_inventory(base_path)
+    inventory = generate_inventory(base_path, cache=cache, verify=args.verify, jobs=args.jobs)
     
-    # Save to file
-    save_inventory(inventory, output_path)
+    # Save to file (skipped when no entry changed)
+    changes = save_inventory(inventory, output_path)
+    if cache is not None:
+        cache.save()
+    if args.changes_output:
+        args.changes_output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.changes_output, "w", encoding="utf-8") as f:
+            json.dump(changes, f, indent=2)
+            f.write("\n")
     
     # Print summary
     print("\n" + "="*70)
@@ -260,6 +579,20 @@ def main():
     print(f"  PUBLIC_API: {public_api}")
     print(f"  INTERNAL:   {internal}")
     print(f"  OPTIONAL:   {optional}")
+
+    print(f"\nChanged entries:{'' if changes['written'] else ' none (write skipped)'}")
+    for kind in ("added", "removed", "modified"):
+        print(f"  {kind.capitalize() + ':':<10}{len(changes[kind])}")
+        for path in changes[kind]:
+            print(f"    - {path}")
+
+    if cache is not None:
+        print(f"\nCache:")
+        print(f"  Hits:   {cache.hits}")
+        print(f"  Misses: {cache.misses}")
+        if args.verify:
+            print(f"  Verified: {cache.verified}")
+            print(f"  Stale:  {cache.stale}")
     print("="*70)
 
 
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Local stub for the GitHub repository_dispatch endpoint
+
+Accepts POST /repos/<owner>/<repo>/dispatches and answers 204, or a scripted
+failure status per repository, after an optional artificial latency. Used to
+exercise governance/executable/scripts/dispatch_ripple.py without network
+access:
+
+    python scripts/ripple_stub_server.py --port 8765 --fail APGI-cmy/PartPulse=503 &
+    RIPPLE_DISPATCH_TOKEN=x python governance/executable/scripts/dispatch_ripple.py \\
+        --api-url http://127.0.0.1:8765 --canonical-commit abc --inventory-version 1.0.0 \\
+        --backoff-seconds 0.1
+
+--fail REPO=STATUS[:COUNT] makes the first COUNT requests for REPO return
+STATUS (every request when COUNT is omitted). On shutdown (Ctrl-C/SIGTERM)
+the per-repository request counts are printed as JSON.
+"""
+
+import argparse
+import json
+import signal
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+
+class StubState:
+    """Scripted failures and received-request counters, shared by handler threads."""
+
+    def __init__(self, failures: Dict[str, Tuple[int, Optional[int]]], latency: float) -> None:
+        self.failures = failures
+        self.latency = latency
+        self.requests: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def respond(self, repo: str) -> int:
+        with self.lock:
+            count = self.requests.get(repo, 0) + 1
+            self.requests[repo] = count
+        status, limit = self.failures.get(repo, (204, None))
+        if status != 204 and (limit is None or count <= limit):
+            return status
+        return 204
+
+
+def make_handler(state: StubState):
+    class DispatchHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            parts = self.path.strip("/").split("/")
+            if len(parts) != 4 or parts[0] != "repos" or parts[3] != "dispatches":
+                self.send_error(404)
+                return
+            try:
+                json.loads(body or b"{}")
+            except json.JSONDecodeError:
+                self.send_error(400)
+                return
+            if state.latency:
+                time.sleep(state.latency)
+            status = state.respond(f"{parts[1]}/{parts[2]}")
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    return DispatchHandler
+
+
+def parse_failures(values) -> Dict[str, Tuple[int, Optional[int]]]:
+    failures = {}
+    for value in values:
+        repo, _, spec = value.partition("=")
+        status, _, count = spec.partition(":")
+        failures[repo] = (int(status), int(count) if count else None)
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stub GitHub dispatch endpoint for ripple tests.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay before each response")
+    parser.add_argument("--fail", action="append", default=[], metavar="REPO=STATUS[:COUNT]",
+                        help="Scripted failure for owner/repo (repeatable)")
+    args = parser.parse_args()
+
+    state = StubState(parse_failures(args.fail), args.latency_ms / 1000)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(state))
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown).start())
+    print(f"Stub dispatch endpoint on http://{args.host}:{server.server_port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        json.dump({"requests": state.requests}, sys.stdout, indent=2, sort_keys=True)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
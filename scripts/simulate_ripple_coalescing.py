@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Ripple coalescing simulation harness
+
+Replays a commit history through ripple_coalesce.plan_batches for a set of
+coalescing windows and reports how many ripple dispatches (and consumer
+events) each window saves against one dispatch per commit. It also reports
+the extra delay coalescing adds. That delay is measured from a batch's first
+commit to its dispatch, which happens one window after the last commit (or
+earlier when --max-wait applies).
+
+History comes from git (only commits touching ripple-triggering paths count)
+or from an NDJSON file with one {"commit", "timestamp", "paths"} object per
+line, for example exported from the upstream repository.
+
+Usage:
+    python scripts/simulate_ripple_coalescing.py [--repo PATH] [--since REV] [--history FILE]
+        [--windows 0,60,300,900,3600] [--max-wait SECONDS] [--consumers N] [--json]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "governance" / "executable" / "scripts"))
+
+from ripple_coalesce import Change, git_changes, plan_batches  # noqa: E402
+from ripple_targets import RIPPLE_PREFIXES  # noqa: E402
+
+
+def load_history(path: Path) -> List[Change]:
+    changes = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                changes.append(Change(record["commit"], float(record["timestamp"]), tuple(record.get("paths", []))))
+    return sorted(changes, key=lambda change: change.timestamp)
+
+
+def simulate(changes: List[Change], window: float, max_wait: Optional[float], consumers: int) -> Dict:
+    batches = plan_batches(changes, window, max_wait)
+    delays = []
+    for batch in batches:
+        dispatch_at = batch[-1].timestamp + window
+        if max_wait is not None:
+            dispatch_at = min(dispatch_at, batch[0].timestamp + max_wait)
+        delays.append(dispatch_at - batch[0].timestamp)
+    saved = len(changes) - len(batches)
+    return {
+        "window_seconds": window,
+        "commits": len(changes),
+        "dispatches": len(batches),
+        "dispatches_saved": saved,
+        "saved_percent": round(saved / len(changes) * 100, 1) if changes else 0.0,
+        "consumer_events_saved": saved * consumers,
+        "largest_batch": max((len(b) for b in batches), default=0),
+        "mean_paths_per_dispatch": round(
+            sum(len({p for c in b for p in c.paths}) for b in batches) / len(batches), 1
+        ) if batches else 0.0,
+        "max_added_delay_seconds": round(max(delays, default=0), 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Simulate ripple coalescing windows over a commit history.")
+    parser.add_argument("--repo", type=Path, default=Path("."), help="Git repository to replay (default: cwd)")
+    parser.add_argument("--since", help="Only replay commits after this revision")
+    parser.add_argument("--head", default="HEAD")
+    parser.add_argument("--history", type=Path, help="NDJSON history instead of git")
+    parser.add_argument("--windows", default="0,60,300,900,3600", help="Comma-separated windows in seconds")
+    parser.add_argument("--max-wait", type=float, help="Cap on how long a batch may be held back")
+    parser.add_argument("--consumers", type=int,
+                        help="Consumers per dispatch (default: enabled consumers in the registry)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    if args.history:
+        changes = load_history(args.history)
+    else:
+        changes = git_changes(args.since, args.head, args.repo, RIPPLE_PREFIXES)
+
+    consumers = args.consumers
+    if consumers is None:
+        registry = args.repo / "governance" / "CONSUMER_REPO_REGISTRY.json"
+        consumers = 1
+        if registry.exists():
+            consumers = sum(1 for c in json.loads(registry.read_text()).get("consumers", []) if c.get("enabled"))
+
+    results = [
+        simulate(changes, float(window), args.max_wait, consumers)
+        for window in args.windows.split(",") if window.strip()
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"Commits replayed: {len(changes)}   Consumers per dispatch: {consumers}")
+    print(f"{'Window (s)':>10} {'Dispatches':>10} {'Saved':>6} {'Saved %':>8} {'Events saved':>12} "
+          f"{'Largest batch':>13} {'Max delay (s)':>13}")
+    for r in results:
+        print(f"{r['window_seconds']:>10g} {r['dispatches']:>10} {r['dispatches_saved']:>6} {r['saved_percent']:>8} "
+              f"{r['consumer_events_saved']:>12} {r['largest_batch']:>13} {r['max_added_delay_seconds']:>13}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,46 +9,84 @@ This script synchronizes a repository's governance alignment inventory by:
 4. Generating or updating GOVERNANCE_ALIGNMENT_INVENTORY.json
 5. Reporting compliance status
 
+Fleet mode syncs many consumer checkouts in one run: the central inventory is
+loaded once and handed to a process pool that scans one repository per task,
+writes each GOVERNANCE_ALIGNMENT_INVENTORY.json and returns a summary for the
+aggregate fleet coverage report. Repositories come either from a directory
+of checkouts (--fleet-dir) or from the consumer registry plus a clones
+directory (--registry with --clones-dir, resolved as <clones>/<owner>/<repo>
+or <clones>/<repo>).
+
+--watch keeps the central index and the local scan in memory and resyncs on
+every save, re-hashing only the canons that changed (see canon_watch.py).
+
 Usage:
-    python sync_repo_inventory.py [--repo-root PATH] [--governance-source PATH]
+    python sync_repo_inventory.py [--repo-root PATH] [--governance-source PATH] [--jobs N]
+    python sync_repo_inventory.py --watch [--debounce-ms MS] [--watch-backend auto|inotify|polling]
+    python sync_repo_inventory.py --fleet-dir DIR [--fleet-jobs N] [--fleet-report PATH]
+    python sync_repo_inventory.py --registry governance/CONSUMER_REPO_REGISTRY.json --clones-dir DIR
 """
 
 import argparse
-import hashlib
 import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from canon_scan import clean_blob_ids, hash_file, scan_files
+from canon_watch import expand_changes, watch
 
 # Constants
 SHA256_TRUNCATE_LENGTH = 12  # Consistent with CANON_INVENTORY.json format
+ALIGNMENT_INVENTORY_NAME = "GOVERNANCE_ALIGNMENT_INVENTORY.json"
+DEFAULT_FLEET_REPORT = Path(".agent-admin/governance/fleet-alignment-report.json")
 
 
 def calculate_sha256(file_path: Path) -> str:
     """Calculate SHA256 hash of a file."""
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()[:SHA256_TRUNCATE_LENGTH]
+    return hash_file(file_path)[:SHA256_TRUNCATE_LENGTH]
 
 
 def load_central_inventory(governance_source_path: Path) -> Dict:
-    """Load the central CANON_INVENTORY.json from governance repository."""
+    """Load the central CANON_INVENTORY.json from governance repository.
+    
+    Raises:
+        FileNotFoundError if the inventory is missing (callers decide whether
+        that ends the process; the watcher reports it and keeps watching)
+    """
     inventory_path = governance_source_path / "governance" / "CANON_INVENTORY.json"
     
     if not inventory_path.exists():
-        print(f"ERROR: Central CANON_INVENTORY.json not found at {inventory_path}")
-        sys.exit(1)
+        raise FileNotFoundError(f"Central CANON_INVENTORY.json not found at {inventory_path}")
     
     with open(inventory_path, 'r') as f:
         return json.load(f)
 
 
-def scan_local_canons(repo_root: Path) -> Dict[str, Dict]:
-    """Scan local governance/canon/ directory for present canons."""
+def scan_local_canons(
+    repo_root: Path,
+    jobs: Optional[int] = None,
+    central_blobs: Optional[Dict[str, str]] = None,
+    only: Optional[List[Path]] = None
+) -> Dict[str, Dict]:
+    """
+    Scan the local governance/canon/ tree (recursively) for present canons.
+    
+    Args:
+        repo_root: Root directory of the repository
+        jobs: Worker threads for hashing
+        central_blobs: Optional git_blob_id -> file_hash from the central
+            inventory. Clean tracked files whose index blob id is listed are
+            identical to that central canon and are not read at all.
+        only: Scan just these files (under repo_root) instead of the whole tree
+    
+    Returns:
+        repo-relative path -> {"path", "file_hash", "sha256", "layered_down_date"}
+    """
     local_canon_dir = repo_root / "governance" / "canon"
     local_canons = {}
     
@@ -56,26 +94,127 @@ def scan_local_canons(repo_root: Path) -> Dict[str, Dict]:
         print(f"WARNING: Local canon directory not found at {local_canon_dir}")
         return local_canons
     
-    for canon_file in local_canon_dir.glob("*.md"):
-        filename = canon_file.name
-        sha256 = calculate_sha256(canon_file)
+    if only is None:
+        canon_files = sorted(p for p in local_canon_dir.rglob("*.md") if p.is_file())
+    else:
+        canon_files = sorted(only)
+    
+    # Blob fast path: identical git blob id implies identical content
+    known_hashes = {}
+    if central_blobs:
+        local_blobs = clean_blob_ids(p.resolve() for p in canon_files)
+        for canon_file in canon_files:
+            blob_id = local_blobs.get(canon_file.resolve())
+            if blob_id in central_blobs:
+                known_hashes[canon_file] = central_blobs[blob_id]
+        if known_hashes and only is None:
+            print(f"Blob fast path: {len(known_hashes)} of {len(canon_files)} local canons match by git blob id")
+    
+    to_hash = [p for p in canon_files if p not in known_hashes]
+    hashed = {result.path: result for result in scan_files(to_hash, jobs=jobs)}
+    
+    for canon_file in canon_files:
+        if canon_file in known_hashes:
+            full_hash = known_hashes[canon_file]
+        else:
+            result = hashed[canon_file]
+            if result.error:
+                print(f"WARNING: Could not hash {canon_file}: {result.error}")
+                continue
+            full_hash = result.file_hash
         
         # Get file modification time for layered_down_date
         mtime = datetime.fromtimestamp(canon_file.stat().st_mtime)
-        layered_down_date = mtime.strftime("%Y-%m-%d")
         
-        local_canons[filename] = {
-            "path": str(canon_file.relative_to(repo_root)),
-            "sha256": sha256,
-            "layered_down_date": layered_down_date
+        path = canon_file.relative_to(repo_root).as_posix()
+        local_canons[path] = {
+            "path": path,
+            "file_hash": full_hash,
+            "sha256": full_hash[:SHA256_TRUNCATE_LENGTH],
+            "layered_down_date": mtime.strftime("%Y-%m-%d")
         }
     
     return local_canons
 
 
+def hashes_match(local_hash: str, central_hash: str) -> bool:
+    """Compare a full local SHA256 with a central hash that may be truncated."""
+    central_hash = central_hash.lower()
+    return len(central_hash) >= SHA256_TRUNCATE_LENGTH and local_hash.lower().startswith(central_hash)
+
+
+class CanonIndex:
+    """
+    Central canons indexed for O(1) matching of local files.
+    
+    Lookups by repo-relative path, by content hash (keyed on the truncated
+    prefix so legacy 12-character inventories still match), by git blob id and
+    by bare filename for consumers that keep canons in a different layout.
+    """
+    
+    def __init__(self, central_inventory: Dict):
+        self.canons = [c for c in central_inventory.get("canons", []) if c.get("type") == "canon"]
+        self.by_path: Dict[str, Dict] = {}
+        self.by_hash: Dict[str, List[Dict]] = {}
+        self.by_blob: Dict[str, Dict] = {}
+        self.by_filename: Dict[str, List[Dict]] = {}
+        for canon in self.canons:
+            if canon.get("path"):
+                self.by_path[canon["path"]] = canon
+            if canon.get("file_hash"):
+                self.by_hash.setdefault(canon["file_hash"][:SHA256_TRUNCATE_LENGTH].lower(), []).append(canon)
+            if canon.get("git_blob_id"):
+                self.by_blob[canon["git_blob_id"]] = canon
+            self.by_filename.setdefault(canon_filename(canon), []).append(canon)
+    
+    def blob_hashes(self) -> Dict[str, str]:
+        """git_blob_id -> file_hash, for the scan_local_canons fast path."""
+        return {blob_id: canon.get("file_hash", "") for blob_id, canon in self.by_blob.items()}
+
+
+def canon_filename(canon: Dict) -> str:
+    return canon.get("filename") or Path(canon.get("path", "")).name
+
+
+def match_local_canons(index: CanonIndex, local_canons: Dict[str, Dict]) -> Tuple[Dict[str, Tuple[Dict, str]], List[Dict]]:
+    """
+    Pair central canons with local files.
+    
+    Each local file matches at most one central canon, tried in order of
+    confidence: same path, then same content (a moved or renamed canon), then
+    same filename when that name is unique among the unmatched central canons.
+    
+    Returns:
+        (central path -> (local entry, matched_by), local entries unknown to the central inventory)
+    """
+    matches: Dict[str, Tuple[Dict, str]] = {}
+    unmatched_local = dict(local_canons)
+    
+    for path, local in local_canons.items():
+        canon = index.by_path.get(path)
+        if canon is not None:
+            matches[canon["path"]] = (local, "path")
+            del unmatched_local[path]
+    
+    for path, local in list(unmatched_local.items()):
+        for canon in index.by_hash.get(local["file_hash"][:SHA256_TRUNCATE_LENGTH].lower(), ()):
+            if canon["path"] not in matches and hashes_match(local["file_hash"], canon.get("file_hash", "")):
+                matches[canon["path"]] = (local, "hash")
+                del unmatched_local[path]
+                break
+    
+    for path, local in list(unmatched_local.items()):
+        candidates = [c for c in index.by_filename.get(Path(path).name, ()) if c["path"] not in matches]
+        if len(candidates) == 1:
+            matches[candidates[0]["path"]] = (local, "filename")
+            del unmatched_local[path]
+    
+    return matches, sorted(unmatched_local.values(), key=lambda local: local["path"])
+
+
 def determine_status(local_hash: str, central_hash: str) -> str:
     """Determine the status of a canon file."""
-    if local_hash == central_hash:
+    if hashes_match(local_hash, central_hash):
         return "UP_TO_DATE"
     else:
         return "MODIFIED"
@@ -153,15 +292,26 @@ def detect_repo_name(repo_root: Path) -> Optional[str]:
 def generate_inventory(
     repo_root: Path,
     governance_source_path: Path,
-    repo_name: Optional[str] = None
+    repo_name: Optional[str] = None,
+    jobs: Optional[int] = None,
+    use_git_blobs: bool = True,
+    central_inventory: Optional[Dict] = None
 ) -> Dict:
-    """Generate the governance alignment inventory."""
+    """Generate the governance alignment inventory.
+    
+    central_inventory, when given, is used instead of loading
+    CANON_INVENTORY.json from governance_source_path (fleet mode loads it once).
+    """
     
     # Load central inventory
-    central_inventory = load_central_inventory(governance_source_path)
+    if central_inventory is None:
+        central_inventory = load_central_inventory(governance_source_path)
     
-    # Scan local canons
-    local_canons = scan_local_canons(repo_root)
+    index = CanonIndex(central_inventory)
+    
+    # Scan local canons (central blob ids let unchanged files skip hashing)
+    central_blobs = index.blob_hashes() if use_git_blobs else None
+    local_canons = scan_local_canons(repo_root, jobs=jobs, central_blobs=central_blobs)
     
     # Determine repository name
     if repo_name is None:
@@ -169,6 +319,13 @@ def generate_inventory(
         if repo_name is None:
             repo_name = "<owner>/<repo>"
     
+    return build_alignment_inventory(central_inventory, index, local_canons, repo_name)
+
+
+def build_alignment_inventory(central_inventory: Dict, index: CanonIndex, local_canons: Dict[str, Dict], repo_name: str) -> Dict:
+    """Build the alignment inventory from an indexed central inventory and scanned local canons."""
+    matches, unknown_local = match_local_canons(index, local_canons)
+    
     # Initialize inventory structure
     inventory = {
         "repository": repo_name,
@@ -179,17 +336,16 @@ def generate_inventory(
         "canons_present": 0,
         "coverage_percentage": 0.0,
         "layered_down": [],
-        "missing": []
+        "missing": [],
+        "unknown_local": [
+            {"path": local["path"], "sha256": local["sha256"]} for local in unknown_local
+        ]
     }
     
-    # Process each canon from central inventory
-    for canon in central_inventory.get("canons", []):
-        filename = canon.get("filename", "")
-        
-        # Skip non-canon entries (policy, etc.) or determine if they should be tracked
-        # For now, only track canon type
-        if canon.get("type") != "canon":
-            continue
+    # Process each canon from central inventory (policy and other non-canon
+    # entries are not tracked)
+    for canon in index.canons:
+        filename = canon_filename(canon)
         
         layer_down_status = canon.get("layer_down_status", "OPTIONAL")
         
@@ -200,17 +356,19 @@ def generate_inventory(
         if mandatory:
             inventory["total_canons_required"] += 1
         
-        if filename in local_canons:
+        if canon.get("path") in matches:
             # Canon is present locally
-            local_info = local_canons[filename]
+            local_info, matched_by = matches[canon["path"]]
             
             inventory["layered_down"].append({
                 "id": filename,
                 "path": local_info["path"],
+                "source_path": canon["path"],
+                "matched_by": matched_by,
                 "source_version": canon.get("version", "unknown"),
                 "layered_down_date": local_info["layered_down_date"],
                 "sha256": local_info["sha256"],
-                "status": determine_status(local_info["sha256"], canon.get("file_hash", ""))
+                "status": determine_status(local_info["file_hash"], canon.get("file_hash", ""))
             })
             
             if mandatory:
@@ -220,6 +378,7 @@ def generate_inventory(
             if mandatory or layer_down_status == "PUBLIC_API":
                 inventory["missing"].append({
                     "id": filename,
+                    "source_path": canon.get("path", ""),
                     "classification": determine_classification(layer_down_status),
                     "mandatory": mandatory,
                     "priority": determine_priority(layer_down_status, mandatory)
@@ -258,12 +417,20 @@ def print_compliance_report(inventory: Dict):
     print("-"*60)
     print(f"Layered Down:      {len(inventory['layered_down'])} canons")
     print(f"Missing:           {len(inventory['missing'])} canons")
+    print(f"Unknown Local:     {len(inventory['unknown_local'])} files not in central inventory")
     
     if inventory['missing']:
         print("\nMISSING CANONS:")
         for missing in inventory['missing']:
             print(f"  - {missing['id']} ({missing['priority']}, mandatory={missing['mandatory']})")
     
+    if inventory['unknown_local']:
+        print("\nUNKNOWN LOCAL FILES (not in central inventory):")
+        for unknown in inventory['unknown_local'][:20]:
+            print(f"  - {unknown['path']}")
+        if len(inventory['unknown_local']) > 20:
+            print(f"  ... and {len(inventory['unknown_local']) - 20} more")
+    
     # Count status breakdown
     up_to_date = sum(1 for c in inventory['layered_down'] if c['status'] == 'UP_TO_DATE')
     modified = sum(1 for c in inventory['layered_down'] if c['status'] == 'MODIFIED')
@@ -276,6 +443,254 @@ def print_compliance_report(inventory: Dict):
     print("="*60 + "\n")
 
 
+def discover_fleet_repos(fleet_dir: Path) -> List[Tuple[Path, Optional[str]]]:
+    """Every immediate subdirectory of fleet_dir that is a git checkout or has governance/canon/."""
+    return [
+        (path, None)
+        for path in sorted(fleet_dir.iterdir())
+        if path.is_dir() and ((path / ".git").exists() or (path / "governance" / "canon").is_dir())
+    ]
+
+
+def registry_fleet_repos(registry_path: Path, clones_dir: Path) -> Tuple[List[Tuple[Path, Optional[str]]], List[str]]:
+    """Resolve enabled registry consumers to local clones; also return those without a clone."""
+    with open(registry_path, 'r') as f:
+        registry = json.load(f)
+    
+    repos, unresolved = [], []
+    for consumer in registry.get("consumers", []):
+        repository = consumer.get("repository", "")
+        if not consumer.get("enabled") or "/" not in repository:
+            continue
+        owner, repo = repository.split("/", 1)
+        for candidate in (clones_dir / owner / repo, clones_dir / repo):
+            if candidate.is_dir():
+                repos.append((candidate, repository))
+                break
+        else:
+            unresolved.append(repository)
+    return repos, unresolved
+
+
+# Set once per fleet worker process by the pool initializer, so the central
+# inventory is pickled once per worker instead of once per repository
+_FLEET_CENTRAL_INVENTORY: Optional[Dict] = None
+
+
+def _init_fleet_worker(central_inventory: Dict) -> None:
+    global _FLEET_CENTRAL_INVENTORY
+    _FLEET_CENTRAL_INVENTORY = central_inventory
+
+
+def sync_fleet_repo(repo_root: Path, repo_name: Optional[str], jobs: Optional[int], use_git_blobs: bool) -> Dict:
+    """Sync one consumer checkout in a fleet worker and return its report summary."""
+    # Checkouts without a GitHub remote are named after their directory
+    repo_name = repo_name or detect_repo_name(repo_root) or repo_root.name
+    summary = {"repo_root": str(repo_root), "repository": repo_name}
+    try:
+        inventory = generate_inventory(
+            repo_root=repo_root,
+            governance_source_path=repo_root,
+            repo_name=repo_name,
+            jobs=jobs,
+            use_git_blobs=use_git_blobs,
+            central_inventory=_FLEET_CENTRAL_INVENTORY
+        )
+        save_inventory(inventory, repo_root / ALIGNMENT_INVENTORY_NAME)
+    except Exception as exc:  # one broken checkout must not abort the sweep
+        summary["error"] = f"{type(exc).__name__}: {exc}"
+        return summary
+    
+    summary.update({
+        "repository": inventory["repository"],
+        "coverage_percentage": inventory["coverage_percentage"],
+        "total_canons_required": inventory["total_canons_required"],
+        "canons_present": inventory["canons_present"],
+        "layered_down": len(inventory["layered_down"]),
+        "up_to_date": sum(1 for c in inventory["layered_down"] if c["status"] == "UP_TO_DATE"),
+        "modified": sum(1 for c in inventory["layered_down"] if c["status"] == "MODIFIED"),
+        "missing": [m["id"] for m in inventory["missing"]],
+        "unknown_local": len(inventory["unknown_local"]),
+    })
+    return summary
+
+
+def sync_fleet(
+    repos: List[Tuple[Path, Optional[str]]],
+    central_inventory: Dict,
+    workers: Optional[int] = None,
+    jobs: Optional[int] = None,
+    use_git_blobs: bool = True
+) -> List[Dict]:
+    """Sync every repository on a process pool; summaries keep input order."""
+    if not repos:
+        return []
+    workers = max(1, min(workers or os.cpu_count() or 1, len(repos)))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_fleet_worker, initargs=(central_inventory,)
+    ) as executor:
+        futures = [
+            executor.submit(sync_fleet_repo, repo_root, repo_name, jobs, use_git_blobs)
+            for repo_root, repo_name in repos
+        ]
+        return [future.result() for future in futures]
+
+
+def build_fleet_report(central_inventory: Dict, summaries: List[Dict], unresolved: List[str]) -> Dict:
+    """Aggregate per-repository summaries into the fleet coverage report."""
+    synced = [s for s in summaries if "error" not in s]
+    required = sum(s["total_canons_required"] for s in synced)
+    present = sum(s["canons_present"] for s in synced)
+    
+    missing_by_canon: Dict[str, List[str]] = {}
+    for summary in synced:
+        for canon_id in summary["missing"]:
+            missing_by_canon.setdefault(canon_id, []).append(summary["repository"])
+    
+    return {
+        "generated": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+        "canonical_inventory_version": central_inventory.get("version", "1.0.0"),
+        "repositories": len(summaries),
+        "fully_aligned": sum(1 for s in synced if s["coverage_percentage"] >= 100),
+        "fleet_coverage_percentage": round(present / required * 100, 2) if required else 100.0,
+        "errors": [s for s in summaries if "error" in s],
+        "unresolved_consumers": unresolved,
+        "missing_by_canon": dict(sorted(missing_by_canon.items(), key=lambda item: (-len(item[1]), item[0]))),
+        "repos": summaries,
+    }
+
+
+def print_fleet_report(report: Dict):
+    """Print the fleet coverage summary table."""
+    print("\n" + "="*72)
+    print("GOVERNANCE ALIGNMENT INVENTORY - FLEET COVERAGE REPORT")
+    print("="*72)
+    print(f"{'Repository':<44} {'Coverage':>9} {'Missing':>8} {'Modified':>9}")
+    print("-"*72)
+    for summary in report["repos"]:
+        if "error" in summary:
+            print(f"{summary['repository']:<44} ERROR: {summary['error']}")
+            continue
+        print(f"{summary['repository']:<44} {summary['coverage_percentage']:>8}% "
+              f"{len(summary['missing']):>8} {summary['modified']:>9}")
+    for repository in report["unresolved_consumers"]:
+        print(f"{repository:<44} NO LOCAL CLONE")
+    print("-"*72)
+    print(f"Repositories:      {report['repositories']} ({report['fully_aligned']} fully aligned)")
+    print(f"Fleet Coverage:    {report['fleet_coverage_percentage']}%")
+    if report["missing_by_canon"]:
+        print("\nMOST MISSING CANONS:")
+        for canon_id, repositories in list(report["missing_by_canon"].items())[:10]:
+            print(f"  - {canon_id}: {len(repositories)} repos")
+    print("="*72 + "\n")
+
+
+def run_fleet(args) -> int:
+    """Fleet mode entry point; returns the process exit code."""
+    if args.fleet_dir:
+        if not args.fleet_dir.is_dir():
+            print(f"ERROR: Fleet directory not found at {args.fleet_dir}")
+            return 1
+        repos, unresolved = discover_fleet_repos(args.fleet_dir), []
+    else:
+        if not args.clones_dir or not args.clones_dir.is_dir():
+            print("ERROR: --registry needs --clones-dir pointing at the local consumer clones")
+            return 1
+        repos, unresolved = registry_fleet_repos(args.registry, args.clones_dir)
+    
+    governance_source = args.governance_source or Path.cwd()
+    try:
+        central_inventory = load_central_inventory(governance_source)
+    except FileNotFoundError as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    print(f"Governance Source: {governance_source}")
+    print(f"Repositories:      {len(repos)}")
+    print()
+    
+    summaries = sync_fleet(
+        repos,
+        central_inventory,
+        workers=args.fleet_jobs or None,
+        jobs=args.jobs or 2,
+        use_git_blobs=not args.no_git_blobs
+    )
+    report = build_fleet_report(central_inventory, summaries, unresolved)
+    
+    args.fleet_report.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.fleet_report, 'w') as f:
+        json.dump(report, f, indent=2)
+    print_fleet_report(report)
+    print(f"✓ Fleet report saved to {args.fleet_report}")
+    
+    if report["errors"]:
+        return 1
+    if args.strict and (report["fully_aligned"] < len(summaries) or unresolved):
+        print("ERROR: --strict mode enabled, failing due to incomplete fleet coverage")
+        return 1
+    return 0
+
+
+def watch_repo_inventory(args) -> int:
+    """Keep GOVERNANCE_ALIGNMENT_INVENTORY.json current until interrupted (--watch).
+    
+    The central inventory, its index and the local scan stay in memory. A
+    change to CANON_INVENTORY.json re-indexes the central side; changed local
+    canons are the only files re-hashed.
+    """
+    repo_root = args.repo_root.resolve()
+    canon_dir = repo_root / "governance" / "canon"
+    central_path = (args.governance_source / "governance" / "CANON_INVENTORY.json").resolve()
+    use_git_blobs = not args.no_git_blobs
+    state: Dict = {"repo_name": args.repo_name or detect_repo_name(repo_root) or "<owner>/<repo>"}
+    
+    def load_central():
+        state["central"] = load_central_inventory(args.governance_source)
+        state["index"] = CanonIndex(state["central"])
+    
+    def blobs():
+        return state["index"].blob_hashes() if use_git_blobs else None
+    
+    def rebuild(scanned: int) -> Dict:
+        inventory = build_alignment_inventory(state["central"], state["index"], state["local"], state["repo_name"])
+        save_inventory(inventory, args.output)
+        return {
+            "scanned": scanned,
+            "coverage_percentage": inventory["coverage_percentage"],
+            "layered_down": len(inventory["layered_down"]),
+            "up_to_date": sum(1 for c in inventory["layered_down"] if c["status"] == "UP_TO_DATE"),
+            "modified": sum(1 for c in inventory["layered_down"] if c["status"] == "MODIFIED"),
+            "missing": len(inventory["missing"]),
+            "unknown_local": len(inventory["unknown_local"]),
+        }
+    
+    def on_change(paths) -> Dict:
+        if paths is None or central_path in paths:
+            load_central()
+        if paths is None:
+            state["local"] = scan_local_canons(repo_root, jobs=args.jobs, central_blobs=blobs())
+            return rebuild(len(state["local"]))
+        
+        local = state["local"]
+        files = expand_changes(paths - {central_path}, (repo_root / path for path in local))
+        targets = [f for f in files if f.suffix == ".md" and canon_dir in f.parents]
+        present = [f for f in targets if f.is_file()]
+        for file_path in targets:
+            local.pop(file_path.relative_to(repo_root).as_posix(), None)
+        if present:
+            local.update(scan_local_canons(repo_root, jobs=args.jobs, central_blobs=blobs(), only=present))
+        return rebuild(len(targets))
+    
+    try:
+        with redirect_stdout(sys.stderr):
+            on_change(None)
+    except FileNotFoundError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+    return watch([canon_dir], [central_path], on_change,
+                 debounce=args.debounce_ms / 1000, backend=args.watch_backend)
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -307,9 +722,68 @@ def main():
         action="store_true",
         help="Fail with exit code 1 if coverage is below 100% (useful for CI enforcement)"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Worker threads for hashing local canons (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--no-git-blobs",
+        action="store_true",
+        help="Always hash local canons instead of trusting matching git blob ids from the central inventory"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and resync on every save of a local canon or the central inventory (NDJSON status on stdout)"
+    )
+    parser.add_argument(
+        "--debounce-ms",
+        type=int,
+        default=200,
+        help="--watch: quiet period before a batch of file events is applied (default: 200)"
+    )
+    parser.add_argument(
+        "--watch-backend",
+        choices=("auto", "inotify", "polling"),
+        default="auto",
+        help="--watch: event source (default: inotify where available, else polling)"
+    )
+    fleet = parser.add_mutually_exclusive_group()
+    fleet.add_argument(
+        "--fleet-dir",
+        type=Path,
+        help="Fleet mode: sync every consumer checkout found directly under this directory"
+    )
+    fleet.add_argument(
+        "--registry",
+        type=Path,
+        help="Fleet mode: sync the enabled consumers of this registry from --clones-dir"
+    )
+    parser.add_argument(
+        "--clones-dir",
+        type=Path,
+        help="Directory holding registry consumer clones as <owner>/<repo> or <repo>"
+    )
+    parser.add_argument(
+        "--fleet-jobs",
+        type=int,
+        default=0,
+        help="Fleet mode: repositories synced in parallel processes (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--fleet-report",
+        type=Path,
+        default=DEFAULT_FLEET_REPORT,
+        help=f"Fleet mode: aggregate coverage report path (default: {DEFAULT_FLEET_REPORT})"
+    )
     
     args = parser.parse_args()
     
+    if args.fleet_dir or args.registry:
+        sys.exit(run_fleet(args))
+    
     # Set governance source path
     if args.governance_source is None:
         # Assume we're in the governance repo itself or it's the same as repo-root
@@ -319,17 +793,26 @@ def main():
     if args.output is None:
         args.output = args.repo_root / "GOVERNANCE_ALIGNMENT_INVENTORY.json"
     
+    if args.watch:
+        sys.exit(watch_repo_inventory(args))
+    
     print(f"Repo Root:         {args.repo_root}")
     print(f"Governance Source: {args.governance_source}")
     print(f"Output File:       {args.output}")
     print()
     
     # Generate inventory
-    inventory = generate_inventory(
-        repo_root=args.repo_root,
-        governance_source_path=args.governance_source,
-        repo_name=args.repo_name
-    )
+    try:
+        inventory = generate_inventory(
+            repo_root=args.repo_root,
+            governance_source_path=args.governance_source,
+            repo_name=args.repo_name,
+            jobs=args.jobs,
+            use_git_blobs=not args.no_git_blobs
+        )
+    except FileNotFoundError as exc:
+        print(f"ERROR: {exc}")
+        sys.exit(1)
     
     # Save inventory
     save_inventory(inventory, args.output)